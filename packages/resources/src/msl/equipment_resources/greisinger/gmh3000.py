@@ -122,19 +122,20 @@ class GMH3000(Serial, manufacturer=r"Greisinger", model=r"GMH\s*3\d{3}"):
             code <<= 4
             request = [self._address, code, self._crc(self._address, code)]
 
-        _ = self.write(bytes(request))
-        header = self.read(size=3, decode=False)
-        if self._crc(*header[:2]) != header[2]:
-            msg = f"Invalid CRC checksum in header: {header!r}"
-            raise MSLConnectionError(self, msg)
+        with self._transaction():
+            _ = self.write(bytes(request))
+            header = self.read(size=3, decode=False)
+            if self._crc(*header[:2]) != header[2]:
+                msg = f"Invalid CRC checksum in header: {header!r}"
+                raise MSLConnectionError(self, msg)
 
-        # bit 1 and 2 represent the message length (including the header) in bytes
-        size = 3 * ((header[1] & 0b00000110) >> 1)
-        if size == 0:
-            return header
-        reply = self.read(size=size, decode=False)
-        self._check_crc(reply)
-        return reply
+            # bit 1 and 2 represent the message length (including the header) in bytes
+            size = 3 * ((header[1] & 0b00000110) >> 1)
+            if size == 0:
+                return header
+            reply = self.read(size=size, decode=False)
+            self._check_crc(reply)
+            return reply
 
     @staticmethod
     def _invert(b: int) -> int:
@@ -173,25 +174,26 @@ class GMH3000(Serial, manufacturer=r"Greisinger", model=r"GMH\s*3\d{3}"):
         # GMH_Transmit(1, 175, 0, 0.0, 1) call of the DLL to get the
         # hex values and message lengths
         code, value = self._invert(175), 1
-        _ = self.write(
-            bytes(
-                [
-                    self._address,
-                    0xF6,
-                    self._crc(self._address, 0xF6),
-                    code,
-                    value,
-                    self._crc(code, value),
-                    0x00,
-                    0xFF,
-                    0x0C,
-                    0x00,
-                    0xFF,
-                    0x0C,
-                ]
+        with self._transaction():
+            _ = self.write(
+                bytes(
+                    [
+                        self._address,
+                        0xF6,
+                        self._crc(self._address, 0xF6),
+                        code,
+                        value,
+                        self._crc(code, value),
+                        0x00,
+                        0xFF,
+                        0x0C,
+                        0x00,
+                        0xFF,
+                        0x0C,
+                    ]
+                )
             )
-        )
-        reply = self.read(size=12, decode=False)
+            reply = self.read(size=12, decode=False)
         self._check_crc(reply)
         return self._decode32(*reply[6:8], *reply[9:11])
 
@@ -205,25 +207,26 @@ class GMH3000(Serial, manufacturer=r"Greisinger", model=r"GMH\s*3\d{3}"):
         # GMH_Transmit(1, 174, 0, 0.0, 1) call of the DLL to get the
         # hex values and message lengths
         code, value = self._invert(174), 1
-        _ = self.write(
-            bytes(
-                [
-                    self._address,
-                    0xF6,
-                    self._crc(self._address, 0xF6),
-                    code,
-                    value,
-                    self._crc(code, value),
-                    0x00,
-                    0xFF,
-                    0x0C,
-                    0x00,
-                    0xFF,
-                    0x0C,
-                ]
+        with self._transaction():
+            _ = self.write(
+                bytes(
+                    [
+                        self._address,
+                        0xF6,
+                        self._crc(self._address, 0xF6),
+                        code,
+                        value,
+                        self._crc(code, value),
+                        0x00,
+                        0xFF,
+                        0x0C,
+                        0x00,
+                        0xFF,
+                        0x0C,
+                    ]
+                )
             )
-        )
-        reply = self.read(size=12, decode=False)
+            reply = self.read(size=12, decode=False)
         self._check_crc(reply)
         return self._decode32(*reply[6:8], *reply[9:11])
 
@@ -357,22 +360,23 @@ class GMH3000(Serial, manufacturer=r"Greisinger", model=r"GMH\s*3\d{3}"):
         # GMH_Transmit(1, 223, 0, 0.0, minutes) call of the DLL to get the
         # hex values and message lengths
         code = self._invert(223)
-        _ = self.write(
-            bytes(
-                [
-                    self._address,
-                    0xF4,
-                    self._crc(self._address, 0xF4),
-                    code,
-                    0x00,
-                    self._crc(code, 0x00),
-                    0xFF,
-                    minutes,
-                    self._crc(0xFF, minutes),
-                ]
+        with self._transaction():
+            _ = self.write(
+                bytes(
+                    [
+                        self._address,
+                        0xF4,
+                        self._crc(self._address, 0xF4),
+                        code,
+                        0x00,
+                        self._crc(code, 0x00),
+                        0xFF,
+                        minutes,
+                        self._crc(0xFF, minutes),
+                    ]
+                )
             )
-        )
-        reply = self.read(size=9, decode=False)
+            reply = self.read(size=9, decode=False)
         self._check_crc(reply)
         # do not check if reply[7]==minutes and raise an exception if not equal
         # because if, for example, minutes=121 the device will automatically
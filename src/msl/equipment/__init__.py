@@ -13,6 +13,7 @@ from .interfaces import (
     USB,
     USBTMC,
     VXI11,
+    EquipmentServer,
     HiSLIP,
     Message,
     Modbus,
@@ -21,6 +22,7 @@ from .interfaces import (
     MultiInterface,
     Prologix,
     PyVISA,
+    RemoteEquipment,
     Serial,
     Socket,
     ZeroMQ,
@@ -96,6 +98,7 @@ __all__: list[str] = [
     "Equation",
     "Equipment",
     "EquipmentRecord",
+    "EquipmentServer",
     "Evaluable",
     "File",
     "Financial",
@@ -121,6 +124,7 @@ __all__: list[str] = [
     "Readings",
     "ReferenceMaterials",
     "Register",
+    "RemoteEquipment",
     "Report",
     "Serial",
     "Socket",
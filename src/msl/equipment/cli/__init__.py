@@ -20,7 +20,7 @@ def add_help(parser: ArgumentParser) -> None:
 
 def configure_find(parser: ArgumentParser) -> None:
     """Configure the `find` command."""
-    parser.usage = "msl-equipment find [-i [IP ...]] [-t TIMEOUT] [-g GPIB_LIBRARY] [-v] [-s] [-j] [-h]"
+    parser.usage = "msl-equipment find [-i [IP ...]] [-t TIMEOUT] [-g GPIB_LIBRARY] [-c GPIB_TTL] [-v] [-s] [-j] [-h]"
     # fmt: off
     _ = parser.add_argument(
         "-i",
@@ -65,6 +65,27 @@ def configure_find(parser: ArgumentParser) -> None:
             "the library file path as a GPIB_LIBRARY environment variable."
         ),
     )
+    _ = parser.add_argument(
+        "-c",
+        "--gpib-ttl",
+        type=float,
+        default=0,
+        help=(
+            "Number of seconds that the GPIB devices that were found are\n"
+            "cached for. If a subsequent search is within this time, the\n"
+            "cached GPIB devices are used instead of scanning the GPIB bus.\n"
+            "Requires --gpib-cache, since each search runs in a new process.\n"
+            "Default is 0 seconds (do not use the cache)."
+        ),
+    )
+    _ = parser.add_argument(
+        "--gpib-cache",
+        default="",
+        help=(
+            "The path to the JSON file that the GPIB devices that were found\n"
+            "are cached in, see --gpib-ttl. Default is to not use a file."
+        ),
+    )
     _ = parser.add_argument(
         "-b",
         "--usb-backend",
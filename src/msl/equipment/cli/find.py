@@ -118,12 +118,14 @@ class VXI11Thread(Thread):
         super().__init__(target=function)
 
 
-def find_equipment(  # noqa: C901
+def find_equipment(  # noqa: C901, PLR0913
     *,
     ip: list[str] | None = None,
     timeout: float = 2,
     d2xx_library: str = "",
     gpib_library: str = "",
+    gpib_ttl: float = 0,
+    gpib_cache: str = "",
     include_sad: bool = False,
     usb_backend: Literal["libusb1", "libusb0", "openusb"] | None = None,
 ) -> list[Device]:
@@ -139,6 +141,11 @@ def find_equipment(  # noqa: C901
         gpib_library: The path to a GPIB library file. The default file that is used is
             platform dependent. If a GPIB library cannot be found, GPIB devices will not
             be searched for.
+        gpib_ttl: The number of seconds that the GPIB devices that were found are cached for.
+            A value of `0` means that the cache is not used.
+        gpib_cache: The path to a JSON file that the GPIB devices that were found are also cached in,
+            so that a subsequent search (in another process) may use the cache. If an empty string,
+            the cache is only kept in memory.
         include_sad: Whether to scan for secondary GPIB addresses.
         usb_backend: The PyUSB backend library to use to find USB devices. If `None`,
             selects the first backend that is available.
@@ -167,7 +174,7 @@ def find_equipment(  # noqa: C901
     if gpib_library:
         os.environ["GPIB_LIBRARY"] = gpib_library
 
-    gpib = find_listeners(include_sad=include_sad)
+    gpib = find_listeners(include_sad=include_sad, ttl=gpib_ttl, cache=gpib_cache or None)
     if gpib:
         num_found += len(gpib)
         devices["GPIB"] = Device(type=DeviceType.GPIB, addresses=gpib)
@@ -236,6 +243,8 @@ def run(ns: Namespace) -> int:
         timeout=ns.timeout,
         d2xx_library=ns.d2xx_library,
         gpib_library=ns.gpib_library,
+        gpib_ttl=ns.gpib_ttl,
+        gpib_cache=ns.gpib_cache,
         include_sad=ns.include_sad,
         usb_backend=ns.usb_backend,
     )
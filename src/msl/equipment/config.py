@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING, overload
-from xml.etree.ElementTree import parse
+from xml.etree.ElementTree import iterparse, parse
 
 from .schema import Register, connections
 from .utils import logger, to_primitive
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from .typing import XMLSource
 
 
-def _sources(text: str | None, tag: Literal["register", "connections"]) -> list[Path | Element[str]]:
+def _sources(text: str | None, tag: Literal["register", "connections"]) -> list[Path]:
     """Get the XML source files from `<register>` or `<connections>` elements in a config file.
 
     Args:
@@ -30,15 +30,17 @@ def _sources(text: str | None, tag: Literal["register", "connections"]) -> list[
         return []
 
     path = Path(text).expanduser()
-    sources: list[Path | Element[str]] = []
+    sources: list[Path] = []
     if path.is_dir():
         for file in path.rglob("*.xml"):
             # Ignore XML files in hidden directories (e.g., XML files in PyCharm's .idea directory)
             if any(part.startswith(".") for part in file.parts):
                 continue
-            root = parse(file).getroot()  # noqa: S314
+            # Only parse until the root element is found, the file is parsed again when it is loaded
+            with file.open("rb") as f:
+                _, root = next(iterparse(f, events=("start",)))  # noqa: S314
             if root.tag.endswith(tag):
-                sources.append(root)
+                sources.append(file)
     else:
         sources.append(path)
 
@@ -158,7 +160,9 @@ class Config:
         """Returns all equipment registers that are specified in the configuration file.
 
         The _key_ in the returned [dict][] is the [team][msl.equipment.schema.Register.team]
-        value of the corresponding [Register][].
+        value of the corresponding [Register][]. If a `<register>` element has a `cache` attribute,
+        the value is either `true` (write the cache files next to the XML files) or the directory
+        to write the cache files to. See the `cache` parameter of [Register][] for more details.
         """
         if self._registers is not None:
             return self._registers
@@ -167,7 +171,11 @@ class Config:
         for element in self.findall("register"):
             sources = _sources(element.text, "register")
             if sources:
-                register = Register(*sources)
+                cache = element.attrib.get("cache", "").strip()
+                if cache.lower() in {"", "0", "1", "false", "true"}:
+                    register = Register(*sources, cache=cache.lower() in {"1", "true"})
+                else:
+                    register = Register(*sources, cache=Path(cache).expanduser())
                 registers[register.team] = register
 
         self._registers = registers
@@ -10,6 +10,7 @@ from .modbus import Modbus
 from .nidaq import NIDAQ
 from .prologix import Prologix
 from .pyvisa import PyVISA
+from .remote import EquipmentServer, RemoteEquipment
 from .sdk import SDK
 from .serial import Serial
 from .socket import Socket
@@ -26,6 +27,7 @@ __all__: list[str] = [
     "USB",
     "USBTMC",
     "VXI11",
+    "EquipmentServer",
     "HiSLIP",
     "MSLConnectionError",
     "MSLTimeoutError",
@@ -34,6 +36,7 @@ __all__: list[str] = [
     "MultiInterface",
     "Prologix",
     "PyVISA",
+    "RemoteEquipment",
     "Serial",
     "Socket",
     "ZeroMQ",
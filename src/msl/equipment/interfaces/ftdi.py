@@ -15,11 +15,13 @@ from itertools import combinations
 from struct import unpack
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from msl.equipment.enumerations import DataBits, Parity, StopBits
 from msl.equipment.utils import logger, to_enum
 from msl.loadlib import LoadLibrary
 
-from .message import Message, MSLConnectionError, MSLTimeoutError
+from .message import Deadline, Message, MSLConnectionError, MSLTimeoutError
 from .usb import USB
 
 if TYPE_CHECKING:
@@ -238,6 +240,33 @@ def find_ftd2xx_devices(d2xx_library: str = "") -> list[_FTDevice]:
     return devices
 
 
+def _strip_status_bytes(buffer: array[int], transferred: int, packet_size: int) -> tuple[bytes, int]:
+    """Remove the 2 [modem, line] status bytes from every packet in a bulk-IN transfer.
+
+    Args:
+        buffer: The buffer that the transfer was read into.
+        transferred: The number of bytes that were transferred.
+        packet_size: The `wMaxPacketSize` value of the Bulk-IN endpoint.
+
+    Returns:
+        The payload of all packets and the first line-status byte (of a packet that contains data)
+        that has the Overrun, Parity, Framing or FIFO error bit set, or 0 if no error bit is set.
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8, count=transferred)
+    n_full, remainder = divmod(transferred, packet_size)
+    end = n_full * packet_size
+
+    # a packet that only contains the status bytes has no data, so its line-status byte is ignored
+    line = data[1 : end if remainder <= 2 else transferred : packet_size]  # noqa: PLR2004
+    errors = line[(line & 0x8E) != 0]
+    error = int(errors[0]) if errors.size > 0 else 0
+
+    payload = data[:end].reshape(n_full, packet_size)[:, 2:].tobytes()
+    if remainder > 2:  # noqa: PLR2004
+        payload += data[end + 2 :].tobytes()
+    return payload, error
+
+
 def _ftdi_sio_index(baudrate: int) -> int:
     # https://github.com/torvalds/linux/blob/5572ad8fddecd4a0db19801262072ff5916b7589/drivers/usb/serial/ftdi_sio.c#L1273
     speeds = [300, 600, 1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200]
@@ -718,7 +747,7 @@ class _D2XX:
 class FTDI(Message, regex=REGEX):
     """Base class for equipment that use a Future Technology Devices International (FTDI) chip for communication."""
 
-    def __init__(self, equipment: Equipment) -> None:
+    def __init__(self, equipment: Equipment) -> None:  # noqa: PLR0915
         """Base class for equipment that use a Future Technology Devices International (FTDI) chip for communication.
 
         Args:
@@ -750,6 +779,9 @@ class FTDI(Message, regex=REGEX):
                 _Default: `False`_
             stop_bits (StopBits | str | float): The number of stop bits: 1, 1.5 or 2 (_alias:_ stopbits).
                 _Default: `1`_
+            transfer_size (int): The number of bytes to request in each bulk-IN transfer if *libusb* is used
+                as the communication library. The value is rounded up to a multiple of `wMaxPacketSize`, so
+                that many packets are received per transfer. _Default: `16384`_
             xon_xoff (bool): Whether to enable software flow control (_alias:_ xonxoff).
                 _Default: `False`_
         """
@@ -779,6 +811,7 @@ class FTDI(Message, regex=REGEX):
         self._index: int = -1
         self._characteristics: int = 0
         self._buffer: bytearray = bytearray()
+        self._transfer_size: int = 0
 
         if parsed.driver == 0:
             self._libusb = libusb = USB(equipment)
@@ -794,6 +827,9 @@ class FTDI(Message, regex=REGEX):
                 type=libusb.CtrlType.VENDOR,
                 recipient=libusb.CtrlRecipient.DEVICE,
             )
+            mps = libusb.bulk_in_endpoint.max_packet_size
+            transfer_size: int = equipment.connection.properties.get("transfer_size", 16384)
+            self._transfer_size = max(1, -(-transfer_size // mps)) * mps
         elif parsed.driver == 2:  # noqa: PLR2004
             self._d2xx = _D2XX(errcheck=self._error_check)
             if not IS_WINDOWS:
@@ -849,36 +885,35 @@ class FTDI(Message, regex=REGEX):
         assert self._libusb is not None  # noqa: S101
         address = self._libusb.bulk_in_endpoint.address
         read = self._libusb._device.read  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
-        original_timeout = self._libusb._timeout_ms  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
-        timeout = original_timeout
-
-        # First 2 bytes in each packet represent the current [modem, line] status
-        n_skip = 2
+        timeout = self._libusb._timeout_ms  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
 
-        packet = array("B", bytes(self._libusb.bulk_in_endpoint.max_packet_size))
-        t0 = time.time()
+        # First 2 bytes in each packet represent the current [modem, line] status.
+        # Request many packets per transfer and strip the status bytes from all packets at once.
+        packet_size = self._libusb.bulk_in_endpoint.max_packet_size
+        buffer = array("B", bytes(self._transfer_size))
+        deadline = Deadline(timeout / 1000 if timeout > 0 else None)  # libusb considers 0 as no timeout
         while True:
             if size is not None and len(self._buffer) >= size:
                 msg = self._buffer[:size]
                 self._buffer = self._buffer[size:]
                 return bytes(msg)
 
-            transferred: int = read(address, packet, timeout)
-            if transferred > n_skip:
-                # check for Overrun, Parity, Framing or FIFO error -- see self.poll_status()
-                if self.check_packet_for_errors and packet[1] & 0x8E:
-                    message = (
-                        f"FTDI read-packet error, bit mask of the line-status byte is 0b{packet[1]:08b}. "
-                        "Set the attribute check_packet_for_errors=False if you want to ignore this error."
-                    )
-                    raise MSLConnectionError(self, message)
-                self._buffer.extend(packet[n_skip:transferred])
+            transferred: int = read(address, buffer, timeout)
+            payload, line = _strip_status_bytes(buffer, transferred, packet_size)
+            # check for Overrun, Parity, Framing or FIFO error -- see self.poll_status()
+            if line and self.check_packet_for_errors:
+                message = (
+                    f"FTDI read-packet error, bit mask of the line-status byte is 0b{line:08b}. "
+                    "Set the attribute check_packet_for_errors=False if you want to ignore this error."
+                )
+                raise MSLConnectionError(self, message)
+            self._buffer.extend(payload)
 
             if len(self._buffer) > self._max_read_size:
                 error = f"len(message) [{len(self._buffer)}] > max_read_size [{self._max_read_size}]"
                 raise RuntimeError(error)
 
-            if self._buffer and transferred == 2:  # noqa: PLR2004
+            if self._buffer and not payload:
                 # If `size` is not specified then assume that once data is in the buffer and only
                 # the 2 status bytes are transferred that reading packets from the device is done.
                 # Increasing the value of the latency timer could strengthen this ad hoc decision.
@@ -889,14 +924,12 @@ class FTDI(Message, regex=REGEX):
                 self._buffer.clear()
                 return out
 
-            if original_timeout > 0:
+            if deadline.timeout is not None:
                 # decrease the timeout when reading each packet so that the total
                 # time to receive all packets preserves what was specified
-                elapsed_time = int((time.time() - t0) * 1000)
-                if elapsed_time >= original_timeout:
+                if deadline.expired:
                     raise MSLTimeoutError(self)
-                # use at least 1 ms, since libusb considers 0 as no timeout
-                timeout = max(1, original_timeout - elapsed_time)
+                timeout = deadline.remaining_ms()
 
     def _set_interface_timeout(self) -> None:  # pyright: ignore[reportImplicitOverride]
         """Overrides method in `Message`."""
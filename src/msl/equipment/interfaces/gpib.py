@@ -3,14 +3,33 @@
 from __future__ import annotations
 
 import contextlib
+import json
 import os
 import re
 import sys
 from bisect import bisect_right
-from ctypes import POINTER, byref, c_char_p, c_int, c_long, c_short, c_ubyte, c_wchar_p, create_string_buffer
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from ctypes import (
+    POINTER,
+    byref,
+    c_char,
+    c_char_p,
+    c_int,
+    c_long,
+    c_short,
+    c_ubyte,
+    c_ushort,
+    c_void_p,
+    c_wchar_p,
+    create_string_buffer,
+)
 from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING
+from pathlib import Path
+from threading import Lock, Thread
+from time import sleep, time
+from typing import TYPE_CHECKING, ClassVar
 
 from msl.equipment.enumerations import ATNState, RENMode
 from msl.equipment.utils import logger, to_enum
@@ -19,12 +38,16 @@ from msl.loadlib import LoadLibrary
 from .message import Message, MSLConnectionError, MSLTimeoutError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from ctypes import _NamedFuncPointer, _Pointer  # pyright: ignore[reportPrivateUsage]
     from typing import Any, Callable, Never
 
     from msl.equipment.schema import Equipment
+    from msl.equipment.typing import Buffer, NumpyArray1D, PathLike
 
-    ArgType = type[c_int | c_char_p | c_long | c_wchar_p | _Pointer[c_ubyte | c_int | c_short | c_char_p]]
+    ArgType = type[
+        c_int | c_char_p | c_long | c_void_p | c_wchar_p | _Pointer[c_ubyte | c_int | c_short | c_ushort | c_char_p]
+    ]
 
 
 IS_WINDOWS: bool = sys.platform == "win32"
@@ -62,6 +85,10 @@ EWIP = 26
 ERST = 27
 EPWR = 28
 
+NOADDR = 0xFFFF
+
+CMPL = 0x0100
+SRQI = 0x1000
 TIMO = 0x4000
 ERR = 0x8000
 
@@ -102,6 +129,15 @@ _ERRORS = {
     -519700360: "You are using a GPIB-ENET/100 and the network link is broken between the host and the GPIB-ENET/100 interface",  # noqa: E501
 }
 
+# The maximum number of GPIB boards that are scanned concurrently in find_listeners()
+_MAX_BOARD_WORKERS = 4
+
+# The timeout index to use for a board while scanning for listeners with ibln (T10ms = 7)
+_LISTENER_TIMEOUT = 7
+
+# The GPIB listeners that were found, key -> (timestamp, addresses)
+_listeners_cache: dict[str, tuple[float, list[str]]] = {}
+
 # linux-gpib-user/include/gpib/gpib_user.h
 _TIMEOUTS = (
     0,
@@ -196,13 +232,16 @@ def _load_library(errcheck: Callable[[int, _NamedFuncPointer, tuple[int, ...]],
         ("ibonl", True, c_int, (c_int, c_int)),
         ("ibpct", True, c_int, (c_int,)),
         ("ibrd", True, c_int, (c_int, c_char_p, c_long)),
+        ("ibrda", True, c_int, (c_int, c_void_p, c_long)),
         ("ibrsp", True, c_int, (c_int, POINTER(c_ubyte))),
         ("ibsic", True, c_int, (c_int,)),
         ("ibspb", True, c_int, (c_int, POINTER(c_short))),
+        ("ibstop", True, c_int, (c_int,)),
         ("ibtrg", True, c_int, (c_int,)),
         ("ibwait", True, c_int, (c_int, c_int)),
         ("ibwrt", True, c_int, (c_int, c_char_p, c_long)),
         ("ibwrta", True, c_int, (c_int, c_char_p, c_long)),
+        ("FindLstn", False, None, (c_int, POINTER(c_ushort), POINTER(c_ushort), c_int)),
         ("ThreadIbsta", False, c_int, ()),
         ("ThreadIberr", False, c_int, ()),
     ]
@@ -246,17 +285,25 @@ def _load_library(errcheck: Callable[[int, _NamedFuncPointer, tuple[int, ...]],
         lib.ibcntl = lib.ThreadIbcnt
 
 
-def find_listeners(*, include_sad: bool = False) -> list[str]:  # noqa: C901
+def find_listeners(*, include_sad: bool = False, ttl: float = 0, cache: PathLike | None = None) -> list[str]:
     """Find GPIB listeners.
 
+    If the GPIB library exports the NI-488.2 `FindLstn` function, it is used to find all listeners
+    on a board with a single call, otherwise each address is checked with `ibln` (using a short
+    timeout for the board). Boards are scanned concurrently.
+
     Args:
         include_sad: Whether to scan all secondary GPIB addresses.
+        ttl: The number of seconds that the GPIB addresses that were found remain valid in a cache.
+            A value of `0` means that the cache is not used and the GPIB bus is always scanned.
+        cache: The path to a JSON file to also keep the cache in (so that another process, e.g., a
+            subsequent `msl-equipment find --gpib-cache <file>` command, may use the cache). If `None`,
+            the cache is only kept in memory. Ignored if `ttl` is `0`.
 
     Returns:
         The GPIB addresses that were found.
     """
     logger.debug("Searching for GPIB devices (include_sad=%s)", include_sad)
-    devices: list[str] = []
 
     def error_check(result: int, *_: object) -> int:
         return result
@@ -266,51 +313,228 @@ def find_listeners(*, include_sad: bool = False) -> list[str]:  # noqa: C901
     except (OSError, AttributeError) as e:
         msg = str(e).splitlines()[0]  # ignore "create a GPIB_LIBRARY environment variable" tip
         logger.debug("%s: %s", e.__class__.__name__, msg)
-        return devices
+        return []
+
+    assert GPIB.gpib_library is not None  # noqa: S101
+    key = f"{GPIB.gpib_library.path}|include_sad={include_sad}"
+    file = None if cache is None else Path(os.fsdecode(cache)).expanduser()
+    if ttl > 0:
+        cached = _get_cached_listeners(key, ttl, file)
+        if cached is not None:
+            logger.debug("Using the cached GPIB devices (ttl=%g)", ttl)
+            return cached
 
     # suppress stderr messages from the gpib library (in particular linux-gpib)
     new_stderr = open(os.devnull, "wb")  # noqa: PTH123, SIM115
     old_stderr = os.dup(2)
     _ = os.dup2(new_stderr.fileno(), 2)
 
-    assert GPIB.gpib_library is not None  # noqa: S101
-    lib = GPIB.gpib_library.lib
+    find = partial(_find_board_listeners, GPIB.gpib_library.lib, include_sad=include_sad)
+    try:
+        with ThreadPoolExecutor(max_workers=_MAX_BOARD_WORKERS) as executor:
+            found = list(executor.map(find, range(16)))
+    finally:
+        _ = os.dup2(old_stderr, 2)
+        os.close(old_stderr)
+        new_stderr.close()
+
+    devices = [address for addresses in found for address in addresses]
+    if ttl > 0:
+        _set_cached_listeners(key, devices, file)
+    return devices
+
+
+def _find_board_listeners(lib: Any, board: int, *, include_sad: bool) -> list[str]:  # noqa: ANN401
+    """Find the GPIB listeners on a board."""
     asked = c_int()
+    if lib.ibask(board, 0x1, byref(asked)) & ERR:  # IbaPAD = 0x1
+        return []
+
+    # the board must be controller-in-charge for FindLstn/ibln to succeed
+    handle = lib.ibdev(board, asked.value, 0, 8, 1, 0)  # T30ms = 8
+    if handle < 0 or lib.ibpct(handle) & ERR:
+        return []
+
+    pads = [pad for pad in range(31) if pad != asked.value]
+    sads = range(96, 127) if include_sad else range(0)
+    try:
+        try:
+            found = _find_lstn(lib, board, pads)
+        except NotImplementedError:
+            found = None
+
+        if found is None:
+            found = _ibln(lib, board, pads, sads)
+        elif include_sad:
+            # FindLstn only checks the secondary addresses of a primary address that is not a listener
+            primary = [pad for pad, sad in found if sad == 0]
+            found = sorted(set(found).union(_ibln(lib, board, primary, sads, check_pad=False)))
+        else:
+            found = [(pad, sad) for pad, sad in found if sad == 0]
+    finally:
+        # close handle
+        lib.ibonl(handle, 0)
+
+    return [f"GPIB{board}::{pad}::INSTR" if sad == 0 else f"GPIB{board}::{pad}::{sad}::INSTR" for pad, sad in found]
+
+
+def _find_lstn(lib: Any, board: int, pads: list[int]) -> list[tuple[int, int]] | None:  # noqa: ANN401
+    """Find listeners using FindLstn. Returns `None` if FindLstn failed."""
+    padlist = (c_ushort * (len(pads) + 1))(*pads, NOADDR)
+    results = (c_ushort * (31 * 32))()
+    lib.FindLstn(board, padlist, results, len(results))
+    if lib.ThreadIbsta() & ERR:
+        return None
+    # an Addr4882_t value has the primary address in the low byte and the secondary address in the high byte
+    return sorted((address & 0xFF, address >> 8) for address in results[: lib.ibcntl()])
+
+
+def _ibln(
+    lib: Any,  # noqa: ANN401
+    board: int,
+    pads: list[int],
+    sads: range,
+    *,
+    check_pad: bool = True,
+) -> list[tuple[int, int]]:
+    """Find listeners by calling ibln for each address."""
+    found: list[tuple[int, int]] = []
     exists = c_short()
-    for board in range(16):
-        if lib.ibask(board, 0x1, byref(asked)) & ERR:  # IbaPAD = 0x1
-            continue
 
-        # the board must be controller-in-charge for ibln to succeed
-        handle = lib.ibdev(board, asked.value, 0, 8, 1, 0)  # T30ms = 8
-        if handle < 0 or lib.ibpct(handle) & ERR:
-            continue
+    # use a short timeout for the board, then restore the original timeout (IbaTMO = IbcTMO = 0x3)
+    timeout = c_int()
+    restore = not lib.ibask(board, 0x3, byref(timeout)) & ERR
+    _ = lib.ibconfig(board, 0x3, _LISTENER_TIMEOUT)
+    try:
+        for pad in pads:
+            if check_pad:
+                if lib.ibln(board, pad, 0, byref(exists)) & ERR:
+                    continue
+                if exists.value:
+                    found.append((pad, 0))
+
+            for sad in sads:
+                if lib.ibln(board, pad, sad, byref(exists)) & ERR:
+                    continue
+                if exists.value:
+                    found.append((pad, sad))
+    finally:
+        if restore:
+            _ = lib.ibconfig(board, 0x3, timeout.value)
+
+    return found
+
+
+def _get_cached_listeners(key: str, ttl: float, file: Path | None) -> list[str] | None:
+    """Returns the cached GPIB addresses, if the cache is not older than `ttl` seconds."""
+    entry = _listeners_cache.get(key)
+    if entry is None:
+        if file is None:
+            return None
+        try:
+            with file.open() as f:
+                timestamp, devices = json.load(f)[key]
+            entry = (float(timestamp), [str(d) for d in devices])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    timestamp, devices = entry
+    if time() - timestamp > ttl:
+        return None
+    return list(devices)
 
-        for pad in range(31):
-            if pad == asked.value:
-                continue
 
-            if lib.ibln(board, pad, 0, byref(exists)) & ERR:
-                continue
+def _set_cached_listeners(key: str, devices: list[str], file: Path | None) -> None:
+    """Cache the GPIB addresses that were found."""
+    timestamp = time()
+    _listeners_cache[key] = (timestamp, list(devices))
+    if file is None:
+        return
 
-            if exists.value:
-                devices.append(f"GPIB{board}::{pad}::INSTR")
+    try:
+        with file.open() as f:
+            cache = json.load(f)
+        if not isinstance(cache, dict):
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+
+    cache[key] = [timestamp, devices]
+    try:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        _ = file.write_text(json.dumps(cache))
+    except OSError as e:
+        logger.debug("Cannot write the GPIB cache file: %s", e)
 
-            if include_sad:
-                for sad in range(96, 127):
-                    if lib.ibln(board, pad, sad, byref(exists)) & ERR:
-                        continue
-                    if exists.value:
-                        devices.append(f"GPIB{board}::{pad}::{sad}::INSTR")
 
-        # close handle
-        lib.ibonl(handle, 0)
+def read_async_all(
+    devices: Sequence[GPIB],
+    buffers: Sequence[Buffer | NumpyArray1D],
+    *,
+    message: bytes | str | None = None,
+    timeout: float | None = None,
+) -> list[int]:
+    """Read from multiple GPIB devices with overlapped I/O.
 
-    _ = os.dup2(old_stderr, 2)
-    os.close(old_stderr)
-    new_stderr.close()
+    An asynchronous read is started for every device and then all reads are waited on together,
+    so that, for example, a rack of digital multimeters that are connected to the same board can
+    be read without waiting for each device to finish before starting the next read.
 
-    return devices
+    Args:
+        devices: The GPIB devices to read from.
+        buffers: The buffer to read the data into for each device, see
+            [read_async][msl.equipment.interfaces.gpib.GPIB.read_async] for more details.
+        message: An optional message to first write (asynchronously) to every device before reading,
+            e.g., `"READ?"`. The [write_termination][msl.equipment.interfaces.message.Message.write_termination]
+            characters of each device are appended to `message`.
+        timeout: The maximum number of seconds to wait for the writes to complete and then for the reads
+            to complete. A value of `None` means that only the timeout of each device applies.
+
+    Returns:
+        The number of bytes read into each buffer.
+    """
+    if len(devices) != len(buffers):
+        msg = f"The number of devices ({len(devices)}) and buffers ({len(buffers)}) are not the same"
+        raise ValueError(msg)
+
+    if message is not None:
+        writes: list[Future[int]] = []
+        for device in devices:
+            data = message if isinstance(message, bytes) else message.encode(device.encoding)
+            term = device.write_termination
+            if term and not data.endswith(term):
+                data += term
+            writes.append(device.write_async(data))
+        _ = _wait_all(devices, writes, timeout)
+
+    reads = [device.read_async(buffer) for device, buffer in zip(devices, buffers)]
+    return _wait_all(devices, reads, timeout)
+
+
+def _wait_all(devices: Sequence[GPIB], futures: list[Future[int]], timeout: float | None) -> list[int]:
+    """Wait for all futures to complete and return the results (raises the first exception).
+
+    If an I/O operation fails or the timeout expires, the I/O operations that are still in progress
+    are aborted before raising, so that the buffers are no longer written to and the handles can be
+    used again.
+    """
+    done, not_done = wait_futures(futures, timeout=timeout, return_when=FIRST_EXCEPTION)
+    errors = [e for e in (f.exception() for f in futures if f in done) if e is not None]
+    if errors or not_done:
+        for device, future in zip(devices, futures):
+            if future in not_done:
+                with contextlib.suppress(MSLConnectionError, MSLTimeoutError):
+                    _ = device._lib.ibstop(device.handle)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        _ = wait_futures(not_done)
+
+    if errors:
+        raise errors[0]
+
+    if not_done:
+        msg = f"Asynchronous GPIB I/O did not complete after {timeout} seconds"
+        raise TimeoutError(msg)
+
+    return [f.result() for f in futures]
 
 
 def _convert_timeout(value: float | None) -> int:
@@ -324,11 +548,149 @@ def _convert_timeout(value: float | None) -> int:
         return min(bisect_right(_TIMEOUTS, value), len(_TIMEOUTS) - 1)
 
 
+def _call_srq_callback(device: GPIB, callback: Callable[[int], None], status: int) -> None:
+    """Call a service-request callback, an exception does not stop the background thread."""
+    try:
+        callback(status)
+    except Exception as e:  # noqa: BLE001
+        logger.debug("%r SRQ callback %s: %s", device, e.__class__.__name__, e)
+
+
+class GPIBSRQWatcher:
+    """Watches for service requests from the GPIB devices that are attached to a GPIB board."""
+
+    def __init__(self, board: int, *, min_delay: float = 0.001, max_delay: float = 0.05) -> None:
+        """Watches for service requests from the GPIB devices that are attached to a GPIB board.
+
+        A single background thread calls [wait][msl.equipment.interfaces.gpib.GPIB.wait] on the board
+        with a mask of `SRQI | TIMO` while callbacks are registered, so the library (not a sleep loop)
+        blocks until the SRQ line is asserted. When the SRQ line is asserted, all devices that have a
+        callback registered are serial polled in one sweep and the callbacks of each device that requested
+        service (bit 6 of the status byte is set) are called. If no device claims the service request,
+        the background thread backs off (starting at `min_delay` and doubling up to `max_delay`) before
+        waiting again, since the SRQ line remains asserted.
+
+        You do not need to create an instance of this class, use
+        [add_srq_callback][msl.equipment.interfaces.gpib.GPIB.add_srq_callback].
+
+        Args:
+            board: The board index.
+            min_delay: The minimum number of seconds to back off if no device claims the service request.
+            max_delay: The maximum number of seconds to back off if no device claims the service request.
+        """
+        self._board: int = board
+        self._lock: Lock = Lock()
+        self._callbacks: dict[GPIB, list[Callable[[int], None]]] = {}
+        self._thread: Thread | None = None
+        self.min_delay: float = min_delay
+        self.max_delay: float = max_delay
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"{self.__class__.__name__}<board={self._board}>"
+
+    def _sweep(self, callbacks: list[tuple[GPIB, list[Callable[[int], None]]]]) -> bool:
+        """Serial poll the devices and call the callbacks of each device that requested service."""
+        requested = False
+        for device, funcs in callbacks:
+            try:
+                status = device.serial_poll()
+            except MSLConnectionError as e:
+                logger.debug("%r %s: %s", self, e.__class__.__name__, e)
+                continue
+            if status & 0x40:  # RQS
+                requested = True
+                for func in funcs:
+                    _call_srq_callback(device, func, status)
+        return requested
+
+    def _worker(self) -> None:
+        """Wait for service requests (runs in the background thread)."""
+        delay = self.min_delay
+        while True:
+            with self._lock:
+                if not self._callbacks:
+                    self._thread = None
+                    return
+                callbacks = [(d, list(c)) for d, c in self._callbacks.items()]
+
+            device = callbacks[0][0]
+            try:
+                ibsta = device.wait(SRQI | TIMO, handle=self._board)
+            except MSLTimeoutError:
+                continue
+            except MSLConnectionError as e:
+                logger.debug("%r %s: %s", self, e.__class__.__name__, e)
+                sleep(self.max_delay)
+                continue
+
+            if not ibsta & SRQI:
+                continue
+
+            # the SRQ line remains asserted if no device claimed the service request
+            if self._sweep(callbacks):
+                delay = self.min_delay
+            else:
+                sleep(delay)
+                delay = min(2 * delay, self.max_delay)
+
+    def add_callback(self, device: GPIB, callback: Callable[[int], None]) -> None:
+        """Add a callback that is called when the device requests service.
+
+        Args:
+            device: The GPIB device to add the callback for.
+            callback: A callable that accepts the status byte of the device.
+        """
+        with self._lock:
+            self._callbacks.setdefault(device, []).append(callback)
+            if self._thread is None:
+                self._thread = Thread(target=self._worker, name=f"{self!r}", daemon=True)
+                self._thread.start()
+
+    @property
+    def board(self) -> int:
+        """Returns the board index."""
+        return self._board
+
+    @property
+    def devices(self) -> list[GPIB]:
+        """Returns the GPIB devices that have a callback registered."""
+        with self._lock:
+            return list(self._callbacks)
+
+    def remove_callback(self, device: GPIB, callback: Callable[[int], None] | None = None) -> None:
+        """Remove a callback.
+
+        The background thread stops after the last callback is removed and the current
+        [wait][msl.equipment.interfaces.gpib.GPIB.wait] returns.
+
+        Args:
+            device: The GPIB device to remove the callback for.
+            callback: The callback to remove. If `None`, remove all callbacks for `device`.
+        """
+        with self._lock:
+            callbacks = self._callbacks.get(device, [])
+            if callback is None:
+                callbacks.clear()
+            elif callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                _ = self._callbacks.pop(device, None)
+
+
 class GPIB(Message, regex=REGEX):
     """Base class for GPIB communication."""
 
     gpib_library: LoadLibrary | None = None
 
+    _srq_watchers: ClassVar[dict[int, GPIBSRQWatcher]] = {}
+    """A mapping of the service-request watcher for each GPIB board."""
+
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+    """The threads that wait for asynchronous I/O operations to complete."""
+
+    _lock: ClassVar[Lock] = Lock()
+
     def __init__(self, equipment: Equipment) -> None:
         """Base class for GPIB communication.
 
@@ -413,6 +775,34 @@ class GPIB(Message, regex=REGEX):
             raise MSLConnectionError(self, msg)
         return handle
 
+    def _complete_async(self, handle: int, data: object) -> Future[int]:
+        """Wait for an asynchronous I/O operation to complete in a background thread.
+
+        Args:
+            handle: Board or device descriptor.
+            data: The buffer that is being read into or written from, a reference must be kept
+                until the I/O operation is complete.
+        """
+
+        def complete() -> int:
+            _ = data  # keep a reference to the buffer until the I/O operation is complete
+            try:
+                _ = self.wait(CMPL | TIMO, handle=handle)
+            except (MSLConnectionError, MSLTimeoutError):
+                # abort the I/O operation so that the handle can be used again
+                with contextlib.suppress(MSLConnectionError, MSLTimeoutError):
+                    _ = self._lib.ibstop(handle)
+                raise
+            # ibcntl is thread specific, it must be called in the same thread as ibwait
+            n = self.count()
+            logger.debug("%s async I/O complete, count=%d", self, n)
+            return n
+
+        with GPIB._lock:
+            if GPIB._executor is None:
+                GPIB._executor = ThreadPoolExecutor(thread_name_prefix="GPIB")
+            return GPIB._executor.submit(complete)
+
     def _error_check(self, result: int, func: _NamedFuncPointer, arguments: tuple[int, ...]) -> int:
         logger.debug("%s.%s%s -> 0x%X", self, func.__name__, arguments, result)
         if result & TIMO:
@@ -493,6 +883,26 @@ class GPIB(Message, regex=REGEX):
         self._lib.ibwrt(self._handle, message, len(message))
         return self.count()
 
+    def add_srq_callback(self, callback: Callable[[int], None]) -> None:
+        """Add a callback that is called when the device requests service.
+
+        The SRQ line is waited on in a background thread (one thread per GPIB board) using
+        [ibwait](https://linux-gpib.sourceforge.io/doc_html/reference-function-ibwait.html) and the
+        callback is called from that thread after a serial-poll sweep finds that bit 6 (RQS) of
+        the status byte of this device is set.
+
+        !!! note "See Also"
+            [remove_srq_callback][msl.equipment.interfaces.gpib.GPIB.remove_srq_callback]
+
+        Args:
+            callback: A callable that accepts the status byte of the device.
+        """
+        board = self._address_info.board
+        watcher = GPIB._srq_watchers.get(board)
+        if watcher is None:
+            watcher = GPIB._srq_watchers.setdefault(board, GPIBSRQWatcher(board))
+        watcher.add_callback(self, callback)
+
     def ask(self, option: int, *, handle: int | None = None) -> int:
         """Get a GPIB configuration setting (board or device).
 
@@ -649,6 +1059,8 @@ class GPIB(Message, regex=REGEX):
 
     def disconnect(self) -> None:  # pyright: ignore[reportImplicitOverride]
         """Close the GPIB connection."""
+        if hasattr(self, "_address_info"):
+            self.remove_srq_callback()
         if self._own and self._handle > 0:
             with contextlib.suppress(MSLConnectionError):
                 _ = self.online(state=False, handle=self._handle)
@@ -798,6 +1210,47 @@ class GPIB(Message, regex=REGEX):
         self._lib.ibpct(handle)
         return handle
 
+    def read_async(self, buffer: Buffer | NumpyArray1D, *, handle: int | None = None) -> Future[int]:
+        """Read data asynchronously (board or device).
+
+        This method is the [ibrda](https://linux-gpib.sourceforge.io/doc_html/reference-function-ibrda.html)
+        function. The read is started in the calling thread and the data is written directly into `buffer`.
+        A background thread waits for the I/O operation to complete (by calling
+        [ibwait](https://linux-gpib.sourceforge.io/doc_html/reference-function-ibwait.html) with a
+        mask of `CMPL | TIMO`). If the I/O operation times out, it is aborted and the future raises
+        [MSLTimeoutError][msl.equipment.interfaces.message.MSLTimeoutError].
+
+        !!! note "See Also"
+            [read_async_all][msl.equipment.interfaces.gpib.read_async_all]
+
+        Args:
+            buffer: A writable, C-contiguous object that supports the buffer protocol (e.g., a [bytearray][]
+                or a numpy [ndarray][numpy.ndarray]) to read the data into. The read stops when the device
+                asserts EOI (or the `eos` character is received) or when `buffer` is full. You must not
+                modify `buffer` until the I/O operation is complete.
+            handle: Board or device descriptor. Default is the handle of the instantiated class.
+
+        Returns:
+            A future that, when the I/O operation is complete, has the number of bytes read as its result.
+
+        !!! example
+            ```python
+            import numpy as np
+
+            buffer = np.empty(1000, dtype="<f8")
+            dmm.write(b"FORMAT REAL,64;FETCH?")
+            future = dmm.read_async(buffer)
+            # do other work
+            values = buffer[: future.result() // buffer.itemsize]
+            ```
+        """
+        if handle is None:
+            handle = self._handle
+        view = memoryview(buffer).cast("B")  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+        data = (c_char * view.nbytes).from_buffer(view)
+        _ = self._lib.ibrda(handle, data, view.nbytes)
+        return self._complete_async(handle, data)
+
     @property
     def read_termination(self) -> bytes | None:  # pyright: ignore[reportImplicitOverride]
         """The termination character sequence that is used for the [read][msl.equipment.interfaces.message.Message.read] method.
@@ -841,6 +1294,16 @@ class GPIB(Message, regex=REGEX):
             handle = self._address_info.board
         return self.config(0xB, int(state), handle=handle)
 
+    def remove_srq_callback(self, callback: Callable[[int], None] | None = None) -> None:
+        """Remove a callback that was added by [add_srq_callback][msl.equipment.interfaces.gpib.GPIB.add_srq_callback].
+
+        Args:
+            callback: The callback to remove. If `None`, remove all callbacks for this device.
+        """
+        watcher = GPIB._srq_watchers.get(self._address_info.board)
+        if watcher is not None:
+            watcher.remove_callback(self, callback)
+
     def serial_poll(self, *, handle: int | None = None) -> int:
         """Read status byte / serial poll (device).
 
@@ -940,7 +1403,9 @@ class GPIB(Message, regex=REGEX):
 
         This method will return when the board receives a service request from *any* device.
         If there are multiple devices connected to the board, you must determine which
-        device asserted the service request.
+        device asserted the service request (or use
+        [add_srq_callback][msl.equipment.interfaces.gpib.GPIB.add_srq_callback] to have the
+        service request delivered to the device that requested it).
 
         Args:
             handle: Board descriptor. Default is the board handle of the instantiated class.
@@ -950,24 +1415,28 @@ class GPIB(Message, regex=REGEX):
         """
         if handle is None:
             handle = self._address_info.board
-        return self.wait(0x1000, handle=handle)  # SRQI = 0x1000
+        return self.wait(SRQI, handle=handle)
 
-    def write_async(self, message: bytes, *, handle: int | None = None) -> int:
+    def write_async(self, message: bytes, *, handle: int | None = None) -> Future[int]:
         """Write a message asynchronously (board or device).
 
-        This method is the [ibwrta](https://linux-gpib.sourceforge.io/doc_html/reference-function-ibwrta.html) function.
+        This method is the [ibwrta](https://linux-gpib.sourceforge.io/doc_html/reference-function-ibwrta.html)
+        function. The write is started in the calling thread and a background thread waits for the I/O
+        operation to complete, see [read_async][msl.equipment.interfaces.gpib.GPIB.read_async] for more details.
 
         Args:
-            message: The data to send.
+            message: The data to send. The
+                [write_termination][msl.equipment.interfaces.message.Message.write_termination]
+                characters are not appended to `message`.
             handle: Board or device descriptor. Default is the handle of the instantiated class.
 
         Returns:
-            The status value (`ibsta`).
+            A future that, when the I/O operation is complete, has the number of bytes written as its result.
         """
         if handle is None:
             handle = self._handle
-        ibsta: int = self._lib.ibwrta(handle, message, len(message))
-        return ibsta
+        _ = self._lib.ibwrta(handle, message, len(message))
+        return self._complete_async(handle, message)
 
 
 @dataclass
@@ -11,13 +11,13 @@ from __future__ import annotations
 
 import re
 import socket
-import time
 from dataclasses import dataclass
 from enum import IntEnum
 from struct import Struct, pack, unpack
 from typing import TYPE_CHECKING
 
-from .message import Message, MSLConnectionError, MSLTimeoutError
+from .message import Deadline, Message, MSLConnectionError, MSLTimeoutError
+from .socket import set_socket_options
 
 if TYPE_CHECKING:
     from typing import Any, ClassVar, TypeVar
@@ -662,16 +662,19 @@ class HiSLIPClient:
             self._socket.close()
             self._socket = None
 
-    def connect(self, port: int = PORT, timeout: float | None = 10) -> None:
+    def connect(self, port: int = PORT, timeout: float | None = 10, options: dict[str, Any] | None = None) -> None:
         """Connect to a specific port of the device.
 
         Args:
             port: The port number to connect to.
             timeout: The maximum number of seconds to wait for the connection to be established.
+            options: The socket options, see [set_socket_options][msl.equipment.interfaces.socket.set_socket_options].
         """
         self.close()
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._socket.settimeout(timeout)
+        if options:
+            set_socket_options(self._socket, options)
         self._socket.connect((self._host, port))
 
     def get_descriptors(self) -> GetDescriptorsResponse:
@@ -692,12 +695,14 @@ class HiSLIPClient:
     def maximum_server_message_size(self, size: int) -> None:
         self._maximum_server_message_size = int(size)
 
-    def read(self, message: T, chunk_size: int = 4096) -> T:
+    def read(self, message: T, chunk_size: int = 4096, deadline: Deadline | None = None) -> T:
         """Read a message from the server.
 
         Args:
             message: An instance of the type of message to read.
             chunk_size: The maximum number of bytes to receive at a time.
+            deadline: If the socket is in non-blocking mode, the deadline to wait until
+                for the data of the message to be received.
 
         Returns:
             The `message` that was passed in, but with its attributes updated with the
@@ -707,8 +712,8 @@ class HiSLIPClient:
             raise FatalError(ErrorType.CHANNELS_INACTIVATED, reason="socket closed")
 
         header_size = message.header.size
-        data = self._socket.recv(header_size)
-        if len(data) != header_size:
+        data = bytearray(header_size)
+        if self._recv_into(memoryview(data), header_size, deadline) != header_size:
             reason = f"The reply header is != {header_size} bytes"
             raise FatalError(ErrorType.BAD_HEADER, reason=reason)
 
@@ -720,10 +725,9 @@ class HiSLIPClient:
         size = 0
         payload = bytearray(length)  # preallocate
         view = memoryview(payload)  # avoids unnecessarily copying of slices
-        recv_into = self._socket.recv_into
         while size < length:
             request_size = min(chunk_size, length - size)
-            received_size = recv_into(view, request_size)
+            received_size = self._recv_into(view, request_size, deadline)
             view = view[received_size:]
             size += received_size
         message.payload = payload
@@ -747,6 +751,19 @@ class HiSLIPClient:
         message.parameter = param
         return message
 
+    def _recv_into(self, buffer: memoryview, nbytes: int, deadline: Deadline | None) -> int:
+        """Receive bytes into a buffer, waiting until the deadline if the socket is in non-blocking mode."""
+        assert self._socket is not None  # noqa: S101
+        try:
+            return self._socket.recv_into(buffer, nbytes)
+        except BlockingIOError:
+            if deadline is None:
+                raise
+
+        if not deadline.wait_readable(self._socket):
+            raise TimeoutError
+        return self._socket.recv_into(buffer, nbytes)
+
     def get_timeout(self) -> float | None:
         """Get the socket timeout value.
 
@@ -889,23 +906,27 @@ class SyncClient(HiSLIPClient):
         Returns:
             The received data.
         """
+        # the socket is non-blocking while receiving and each Message waits for data until the
+        # deadline, so the socket timeout is not decreased after each Message is read
         timeout = self.get_timeout()
+        deadline = Deadline(timeout)
+        if timeout is not None:
+            self.set_timeout(0)
         try:
-            # _receive() decreases the timeout after each Message is read
-            return self._receive(timeout, size, max_size, chunk_size)
+            return self._receive(deadline, size, max_size, chunk_size)
         finally:
             # make sure the socket timeout goes back to what it was originally
-            self.set_timeout(timeout)
+            if timeout is not None:
+                self.set_timeout(timeout)
 
-    def _receive(self, timeout: float | None, size: int | None, max_size: int | None, chunk_size: int) -> bytearray:  # noqa: C901, PLR0912, PLR0915
+    def _receive(self, deadline: Deadline, size: int | None, max_size: int | None, chunk_size: int) -> bytearray:  # noqa: C901, PLR0912
         async_interrupted_received = False
         interrupted_received = False
         discard_data = False
         not_done = True
         data = bytearray()
-        t0 = time.time()
         while not_done:
-            msg = self.read(HiSLIPMessage(), chunk_size=chunk_size)
+            msg = self.read(HiSLIPMessage(), chunk_size=chunk_size, deadline=deadline)
 
             # These 'if' statements follow the guidelines in
             # Section 3.1.2: Synchronized Mode Client Requirements
@@ -1007,15 +1028,10 @@ class SyncClient(HiSLIPClient):
                 reason = f"len(message) [{len(data)}] > max_read_size [{max_size}]"
                 raise FatalError(0, reason=reason)
 
-            if not_done and timeout is not None:
-                elapsed_time = time.time() - t0
-                if elapsed_time > timeout:
-                    reason = f"timeout after {timeout} seconds"
-                    raise FatalError(0, reason=reason)
-
-                # decrease the timeout when reading each Message so that the
-                # total time to receive all Messages preserves what was specified
-                self.set_timeout(max(0, timeout - elapsed_time))
+            # the total time to receive all Messages preserves what was specified
+            if not_done and deadline.expired:
+                reason = f"timeout after {deadline.timeout} seconds"
+                raise FatalError(0, reason=reason)
 
         return data
 
@@ -1286,7 +1302,8 @@ class HiSLIP(Message, regex=REGEX):
 
         A [Connection][msl.equipment.schema.Connection] instance supports the following _properties_
         for the HiSLIP communication protocol, as well as the _properties_ defined in
-        [Message][msl.equipment.interfaces.message.Message].
+        [Message][msl.equipment.interfaces.message.Message] and the `so_*` and `tcp_*` socket
+        options (e.g., `tcp_nodelay`) defined in [Socket][msl.equipment.interfaces.socket.Socket].
 
         Attributes: Connection Properties:
             buffer_size (int): The maximum number of bytes to read at a time. _Default: `4096`_
@@ -1325,19 +1342,21 @@ class HiSLIP(Message, regex=REGEX):
                 msg = "The HiSLIP server requires encryption, this feature has not been tested yet"
                 raise RuntimeError(msg)
 
+        assert self.equipment.connection is not None  # noqa: S101
+        props = self.equipment.connection.properties
         host, port = self._info.host, self._info.port
         try:
             # IVI-6.1: IVI High-Speed LAN Instrument Protocol (HiSLIP)
             # 23 April 2020 (Revision 2.0)
             # Section 6.1: Initialization Transaction
             self._sync = SyncClient(host)
-            self._sync.connect(port=port, timeout=self._timeout)
+            self._sync.connect(port=port, timeout=self._timeout, options=props)
 
             status = self._sync.initialize(sub_address=self._info.name.encode())
             check_for_encryption(status)
 
             self._async = AsyncClient(host)
-            self._async.connect(port=port, timeout=self._timeout)
+            self._async.connect(port=port, timeout=self._timeout, options=props)
             _ = self._async.async_initialize(status.session_id)
         except (socket.timeout, TimeoutError):
             raise MSLTimeoutError(self) from None
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import select
 import socket
+import sys
 import time
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, overload
 
 import serial
@@ -15,6 +18,7 @@ from msl.equipment.schema import Connection, Interface
 from msl.equipment.utils import from_bytes, logger, to_bytes
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
     from typing import Literal
 
     from msl.equipment.schema import Equipment
@@ -97,6 +101,14 @@ class Message(Interface, append=False):
         The connection subclass must override this method to notify the backend.
         """
 
+    def _transaction(self) -> AbstractContextManager[object]:
+        """Some connections (e.g., a shared serial bus) need a write and a read to not be interrupted.
+
+        The connection subclass must override this method to return a context manager that
+        provides exclusive access to the backend for the duration of a query.
+        """
+        return nullcontext()
+
     def _write(self, message: bytes) -> int:  # pyright: ignore[reportUnusedParameter]
         """The subclass must override this method."""
         raise NotImplementedError
@@ -202,12 +214,13 @@ class Message(Interface, append=False):
                 returned as a numpy [ndarray][numpy.ndarray], if `decode` is `True` then the message
                 is returned as a [str][], otherwise the message is returned as [bytes][].
         """  # noqa: D205
-        _ = self.write(message)
-        if delay > 0:
-            time.sleep(delay)
-        if dtype:
-            return self.read(dtype=dtype, fmt=fmt, size=size)
-        return self.read(decode=decode, size=size)
+        with self._transaction():
+            _ = self.write(message)
+            if delay > 0:
+                time.sleep(delay)
+            if dtype:
+                return self.read(dtype=dtype, fmt=fmt, size=size)
+            return self.read(decode=decode, size=size)
 
     @overload
     def read(  # pyright: ignore[reportOverlappingOverload]
@@ -425,6 +438,83 @@ class Message(Interface, append=False):
             self._write_termination = termination.encode(self._encoding)
 
 
+class Deadline:
+    """The time, on a monotonic clock, by which an I/O operation must finish."""
+
+    __slots__: tuple[str, ...] = ("_end", "_timeout")
+
+    def __init__(self, timeout: float | None) -> None:
+        """The time, on a monotonic clock, by which an I/O operation must finish.
+
+        A deadline is created once at the start of a read (or write) and is passed to every wait
+        that the operation performs, rather than measuring the elapsed time and updating the
+        timeout of the interface after each chunk of data is received. The deadline uses
+        [time.monotonic][], so the time remaining is correct even if the system clock is
+        adjusted (e.g., by NTP) while waiting.
+
+        Args:
+            timeout: The maximum number of seconds that the operation may take.
+                If `None`, the operation may wait forever.
+        """
+        self._timeout: float | None = timeout
+        self._end: float = float("inf") if timeout is None else time.monotonic() + timeout
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"<{self.__class__.__name__} timeout={self._timeout} remaining={self.remaining()}>"
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self._end
+
+    def remaining(self) -> float | None:
+        """Returns the number of seconds until the deadline.
+
+        Returns:
+            The number of seconds remaining (never negative), or `None` if there is no deadline.
+        """
+        if self._timeout is None:
+            return None
+        return max(0.0, self._end - time.monotonic())
+
+    def remaining_ms(self) -> int:
+        """Returns the number of milliseconds until the deadline, as a libusb timeout.
+
+        Returns:
+            The number of milliseconds remaining. The value is at least 1 if there is a deadline,
+                since libusb treats 0 as wait forever, and 0 if there is no deadline.
+        """
+        if self._timeout is None:
+            return 0
+        return max(1, round((self._end - time.monotonic()) * 1000))
+
+    @property
+    def timeout(self) -> float | None:
+        """The maximum number of seconds that the operation may take."""
+        return self._timeout
+
+    def wait_readable(self, sock: socket.socket) -> bool:
+        """Wait until a socket has data to read or the deadline passes.
+
+        Args:
+            sock: The socket to wait for. Typically the socket is in non-blocking mode,
+                so the timeout of the socket is not modified while waiting.
+
+        Returns:
+            Whether the socket is readable. If `False`, the deadline passed.
+        """
+        remaining = self.remaining()
+        if sys.platform == "win32":
+            readable, _, _ = select.select([sock], [], [], remaining)
+            return bool(readable)
+
+        # poll() is not limited to file descriptors < FD_SETSIZE
+        poll = select.poll()  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+        poll.register(sock, select.POLLIN)
+        return bool(poll.poll(None if remaining is None else remaining * 1000))
+
+
 class MSLConnectionError(OSError):
     """Base class for connection-related exceptions."""
 
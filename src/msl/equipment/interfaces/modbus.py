@@ -19,6 +19,7 @@ from .message import MSLConnectionError, MSLTimeoutError
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Iterator, Sequence
+    from contextlib import AbstractContextManager
     from typing import Any, Literal
 
     from numpy.typing import DTypeLike, NDArray
@@ -47,6 +48,9 @@ class Modbus(Interface, regex=REGEX):
         A [Connection][msl.equipment.schema.Connection] instance supports the same _properties_
         as either [Serial][msl.equipment.interfaces.serial.Serial] or [Socket][msl.equipment.interfaces.socket.Socket],
         depending on which underlying interface is used for the connection.
+
+        If the `shared` property is `True` for a serial connection, multiple Modbus devices (device IDs)
+        on the same RS-485 bus can be used simultaneously, see [SerialBus][msl.equipment.interfaces.serial.SerialBus].
         """
         super().__init__(equipment)
 
@@ -56,7 +60,7 @@ class Modbus(Interface, regex=REGEX):
             msg = f"Invalid Modbus address {equipment.connection.address!r}"
             raise ValueError(msg)
 
-        self._lock: Lock = Lock()
+        self._lock: AbstractContextManager[object] = Lock()
         self._repr: str = self._str[:-1] + f" at {parsed.address}>"
         self._parsed: ParsedModbusAddress = parsed
         self._connect()
@@ -74,6 +78,11 @@ class Modbus(Interface, regex=REGEX):
         interface.read_termination = None
         interface.write_termination = None
 
+        bus = getattr(interface, "bus", None)
+        if bus is not None:
+            # a transaction must not be interrupted by another device on the shared bus
+            self._lock = interface._transaction()  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
         self._framer: Framer
         if self._parsed.framer == FramerType.SOCKET:
             self._framer = SocketFramer(interface)
@@ -0,0 +1,219 @@
+"""Query many socket-based devices from a single thread."""
+
+from __future__ import annotations
+
+import selectors
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING
+
+from .message import MSLConnectionError, MSLTimeoutError
+from .prologix import Prologix
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from concurrent.futures import Future
+
+    from .socket import Socket
+
+
+class SocketMultiplexer:
+    """Query many socket-based devices from a single thread."""
+
+    def __init__(self, devices: Iterable[Socket | Prologix] = ()) -> None:
+        """Query many socket-based devices from a single thread.
+
+        The queries are written to all devices and then the replies are collected, as they arrive, by waiting
+        on all sockets at once (using the [selectors][] module). The time to query all devices is therefore
+        the time of the slowest reply rather than the sum of the time of each reply.
+
+        A reply from a [Socket][msl.equipment.interfaces.socket.Socket] is complete when the
+        [read_termination][msl.equipment.interfaces.message.Message.read_termination] characters are
+        received (if the `read_termination` is `None`, the bytes from the first packet are the reply).
+        A query for a [Prologix][msl.equipment.interfaces.prologix.Prologix] device is submitted to the
+        [scheduler][msl.equipment.interfaces.prologix.Prologix.scheduler] of its Controller, so the
+        queries for devices that are attached to different Controllers are also executed concurrently.
+
+        Args:
+            devices: The devices to query.
+
+        **Example:**
+        ```python
+        from msl.equipment.interfaces.multiplexer import SocketMultiplexer
+
+        mux = SocketMultiplexer([dmm1, dmm2, counter])
+        replies = mux.query_all({dmm1: "MEAS:VOLT?", dmm2: "MEAS:VOLT?", counter: "READ?"}, timeout=2)
+        ```
+        """
+        self._selector: selectors.BaseSelector = selectors.DefaultSelector()
+        self._devices: list[Socket | Prologix] = []
+        for device in devices:
+            self.add(device)
+
+    def __enter__(self) -> SocketMultiplexer:  # noqa: PYI034
+        """Enter a context manager."""
+        return self
+
+    def __exit__(self, *ignore: object) -> None:
+        """Exit the context manager."""
+        self.close()
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"<{self.__class__.__name__} devices={len(self._devices)}>"
+
+    def _collect(
+        self, deadlines: dict[Socket, float], replies: dict[Socket | Prologix, bytes | str | Exception], *, decode: bool
+    ) -> None:
+        """Wait for the replies from the sockets until each reply is complete or its deadline has passed."""
+        for device in deadlines:
+            _ = self._selector.register(device.socket, selectors.EVENT_READ, device)
+
+        try:
+            while deadlines:
+                wait = min(deadlines.values()) - time.monotonic()
+                for key, _ in self._selector.select(timeout=None if wait == float("inf") else max(0.0, wait)):
+                    ready: Socket = key.data
+                    try:
+                        if not self._receive(ready):
+                            continue
+                        replies[ready] = self._reply(ready, decode=decode)
+                    except Exception as e:  # noqa: BLE001
+                        replies[ready] = e
+                    del deadlines[ready]
+                    _ = self._selector.unregister(ready.socket)
+
+                now = time.monotonic()
+                for device in [d for d, deadline in deadlines.items() if deadline <= now]:
+                    replies[device] = MSLTimeoutError(device)
+                    del deadlines[device]
+                    _ = self._selector.unregister(device.socket)
+        finally:
+            for device in deadlines:
+                _ = self._selector.unregister(device.socket)
+
+    @staticmethod
+    def _receive(device: Socket) -> bool:
+        """Receive the bytes that are waiting and returns whether the reply is complete."""
+        buffer = device._byte_buffer  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        size = device._buffer_size  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        if device._is_stream:  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+            data = device.socket.recv(size)
+            if not data:
+                raise MSLConnectionError(device, "The connection was closed by the peer")
+        else:
+            data, _ = device.socket.recvfrom(size)
+        buffer.extend(data)
+
+        if len(buffer) > device.max_read_size:
+            msg = f"len(message) [{len(buffer)}] > max_read_size [{device.max_read_size}]"
+            raise MSLConnectionError(device, msg)
+
+        termination = device.read_termination
+        return not termination or buffer.find(termination) != -1
+
+    @staticmethod
+    def _reply(device: Socket, *, decode: bool) -> bytes | str:
+        """Read the reply that has been received (does not block)."""
+        size = None if device.read_termination else len(device._byte_buffer)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        reply = device.read(decode=False, size=size)
+        return reply.decode(device.encoding) if decode else reply
+
+    @staticmethod
+    def _submit(device: Prologix, message: bytes | str, *, decode: bool) -> Future[bytes | str]:
+        """Submit a query to the scheduler of the Prologix Controller."""
+
+        def query() -> bytes | str:
+            _ = device.write(message)
+            reply = device.read(decode=False)
+            return reply.decode(device.encoding) if decode else reply
+
+        return device.scheduler.submit(device, query)
+
+    def add(self, device: Socket | Prologix) -> None:
+        """Add a device to the multiplexer.
+
+        Args:
+            device: The device to add. A [Prologix][msl.equipment.interfaces.prologix.Prologix]
+                device can use either a GPIB-ETHERNET or a GPIB-USB Controller.
+        """
+        if device not in self._devices:
+            self._devices.append(device)
+
+    def close(self) -> None:
+        """Close the selector. The devices are not disconnected."""
+        self._selector.close()
+        self._devices.clear()
+
+    @property
+    def devices(self) -> list[Socket | Prologix]:
+        """Returns the devices that are in the multiplexer."""
+        return list(self._devices)
+
+    def query_all(
+        self,
+        messages: Mapping[Socket | Prologix, bytes | str] | bytes | str,
+        *,
+        decode: bool = True,
+        timeout: float | None = None,
+    ) -> dict[Socket | Prologix, bytes | str | Exception]:
+        """Write a query to each device and collect the replies as they arrive.
+
+        Args:
+            messages: The message to write to each device. If a [str][] or [bytes][], the same
+                message is written to all devices in the multiplexer.
+            decode: Whether to decode the replies (i.e., convert each reply to a [str][])
+                or keep the replies as [bytes][].
+            timeout: The maximum number of seconds to wait for each reply, measured from when the
+                queries were written. If `None`, the [timeout][msl.equipment.interfaces.message.Message.timeout]
+                of each device is used.
+
+        Returns:
+            The reply from each device. If writing to, or reading from, a device failed (e.g., a
+                timeout) the value is the exception instead of the reply. The exceptions are not
+                raised, so that a device that is not responding does not prevent the replies from
+                the other devices from being returned.
+        """
+        if isinstance(messages, (bytes, str)):
+            messages = dict.fromkeys(self._devices, messages)
+
+        replies: dict[Socket | Prologix, bytes | str | Exception] = {}
+        futures: dict[Prologix, tuple[Future[bytes | str], float]] = {}
+        deadlines: dict[Socket, float] = {}
+
+        t0 = time.monotonic()
+        for device, message in messages.items():
+            t = device.timeout if timeout is None else timeout
+            deadline = float("inf") if t is None else t0 + t
+            if isinstance(device, Prologix):
+                futures[device] = (self._submit(device, message, decode=decode), deadline)
+                continue
+
+            try:
+                _ = device.write(message)
+            except Exception as e:  # noqa: BLE001
+                replies[device] = e
+            else:
+                deadlines[device] = deadline
+
+        self._collect(deadlines, replies, decode=decode)
+
+        for prologix, (future, deadline) in futures.items():
+            wait = deadline - time.monotonic()
+            try:
+                replies[prologix] = future.result(timeout=None if wait == float("inf") else max(0.0, wait))
+            except FutureTimeoutError:
+                _ = future.cancel()
+                replies[prologix] = MSLTimeoutError(prologix.controller, "Waiting for the Prologix scheduler")
+            except Exception as e:  # noqa: BLE001
+                replies[prologix] = e
+
+        return {device: replies[device] for device in messages}
+
+    def remove(self, device: Socket | Prologix) -> None:
+        """Remove a device from the multiplexer.
+
+        Args:
+            device: The device to remove.
+        """
+        self._devices.remove(device)
@@ -4,25 +4,31 @@ from __future__ import annotations
 
 import asyncio
 import re
+import socket
 import sys
 import time
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass
-from threading import Lock
-from typing import TYPE_CHECKING, overload
+from threading import Condition, Event, Lock, Thread, current_thread
+from typing import TYPE_CHECKING, Generic, TypeVar, overload
+
+import serial
 
 from msl.equipment.schema import Connection, Equipment, Interface
 from msl.equipment.utils import ipv4_addresses, logger, to_bytes
 
-from .message import MSLConnectionError
+from .message import MSLConnectionError, MSLTimeoutError
 from .serial import Serial
 from .socket import Socket
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Sequence
+    from collections.abc import Awaitable, Callable, Iterator, Sequence
     from typing import ClassVar, Literal
 
     from msl.equipment.typing import MessageDataFormat, MessageDataType, NumpyArray1D, Sequence1D
 
+T = TypeVar("T")
 
 # The value of `enet_port` should always be 1234 for the actual hardware, but make it configurable for the tests
 REGEX = re.compile(
@@ -30,6 +36,8 @@ REGEX = re.compile(
     flags=re.IGNORECASE,
 )
 
+_EOI_EOS_REGEX = re.compile(rb"^\+\+(?P<key>eoi|eos)\s+\d")
+
 MIN_PAD_ADDRESS = 0
 MAX_PAD_ADDRESS = 30
 MIN_SAD_ADDRESS = 96
@@ -37,6 +45,44 @@ MAX_SAD_ADDRESS = 126
 MIN_READ_TIMEOUT_MS = 1
 MAX_READ_TIMEOUT_MS = 3000
 
+# Messages that are larger than this size (before escaping) are streamed to the Prologix Controller in chunks
+_WRITE_CHUNK_SIZE = 65536
+
+
+def _escape(data: bytes) -> bytes:
+    """Escape the LF, CR, ESC and + characters so that Prologix passes them on to the Equipment.
+
+    Chained bytes.replace() calls are faster than a single-pass regular expression (or numpy)
+    substitution, and, since replace() returns the same object if there is nothing to replace,
+    no copy is made if the data does not contain any of these characters.
+    """
+    # ASCII code ESC is decimal 27 (octal 033, hexadecimal 0x1B)
+    data = data.replace(b"\033", b"\033\033")  # must be first
+    data = data.replace(b"\n", b"\033\n")
+    data = data.replace(b"\r", b"\033\r")
+    return data.replace(b"+", b"\033+")
+
+
+def _message_parts(message: bytes, payload: bytes | None, termination: bytes | None) -> list[bytes]:
+    """Returns the parts of a message, the termination is only included if the message does not already end with it."""
+    parts = [message] if payload is None else [message, payload]
+    if termination:
+        n = len(termination)
+        tail = message[-n:] if payload is None else (message[-n:] + payload[-n:])[-n:]
+        if tail != termination:
+            parts.append(termination)
+    return parts
+
+
+def _chunks(parts: list[bytes], *, escape: bool) -> Iterator[bytes]:
+    """Yield the (escaped) chunks of a message, each chunk is at most `_WRITE_CHUNK_SIZE` bytes before escaping."""
+    size = _WRITE_CHUNK_SIZE
+    for part in parts:
+        view = memoryview(part)
+        for i in range(0, len(view), size):
+            chunk = view[i : i + size].tobytes()
+            yield _escape(chunk) if escape else chunk
+
 
 def _char_to_int(char: bytes | str | int) -> int:
     """Convert a char to an integer.
@@ -62,6 +108,25 @@ class PrologixEthernet(Socket, append=False):
         super().__init__(equipment)
         self.lock: Lock = Lock()
 
+    def write_chunk(self, chunk: bytes) -> int:
+        """Write a chunk of a message to the Prologix Controller.
+
+        The `write_termination` is not appended to `chunk`.
+
+        Args:
+            chunk: The chunk to write.
+
+        Returns:
+            The number of bytes written.
+        """
+        logger.debug("%s.write(%r)", self, chunk)
+        try:
+            return self._write(chunk)
+        except (serial.SerialTimeoutException, socket.timeout, TimeoutError):
+            raise MSLTimeoutError(self) from None
+        except Exception as e:  # noqa: BLE001
+            raise MSLConnectionError(self, str(e)) from None
+
 
 class PrologixUSB(Serial, append=False):
     """Prologix GPIB-USB Controller."""
@@ -71,6 +136,429 @@ class PrologixUSB(Serial, append=False):
         super().__init__(equipment)
         self.lock: Lock = Lock()
 
+    def write_chunk(self, chunk: bytes) -> int:
+        """Write a chunk of a message to the Prologix Controller.
+
+        The `write_termination` is not appended to `chunk`.
+
+        Args:
+            chunk: The chunk to write.
+
+        Returns:
+            The number of bytes written.
+        """
+        logger.debug("%s.write(%r)", self, chunk)
+        try:
+            return self._write(chunk)
+        except (serial.SerialTimeoutException, socket.timeout, TimeoutError):
+            raise MSLTimeoutError(self) from None
+        except Exception as e:  # noqa: BLE001
+            raise MSLConnectionError(self, str(e)) from None
+
+
+class _Request(Generic[T]):
+    """A request that is waiting in the queue of a [PrologixScheduler][msl.equipment.interfaces.prologix.PrologixScheduler]."""  # noqa: E501
+
+    __slots__: tuple[str, ...] = ("device", "func", "future", "select")
+
+    def __init__(self, device: Prologix, func: Callable[[], T], *, select: bool) -> None:
+        self.device: Prologix = device
+        self.func: Callable[[], T] = func
+        self.future: Future[T] = Future()
+        self.select: bool = select
+
+
+class PrologixScheduler:
+    """Schedules the requests from all equipment that are attached to the same Prologix Controller."""
+
+    def __init__(self, controller: PrologixUSB | PrologixEthernet, *, max_batch: int = 16) -> None:
+        """Schedules the requests from all equipment that are attached to the same Prologix Controller.
+
+        All [Prologix][msl.equipment.interfaces.prologix.Prologix] instances that share a Prologix Controller
+        also share a scheduler. Requests are queued per GPIB address (so the order of the requests for each
+        device is preserved) and a single background thread executes the queued requests. Consecutive requests
+        for the same GPIB address are grouped together, which minimises the number of `++addr`, `++eoi` and
+        `++eos` commands that must be sent to the Controller. To be fair to all devices, at most `max_batch`
+        requests are executed for a GPIB address before the next GPIB address (that has pending requests)
+        is selected.
+
+        You do not need to create an instance of this class, use the
+        [scheduler][msl.equipment.interfaces.prologix.Prologix.scheduler] property of a
+        [Prologix][msl.equipment.interfaces.prologix.Prologix] instance.
+
+        Args:
+            controller: The connection to the Prologix Controller.
+            max_batch: The maximum number of consecutive requests to execute for a GPIB address
+                while other GPIB addresses have pending requests.
+        """
+        self._controller: PrologixUSB | PrologixEthernet = controller
+        self._condition: Condition = Condition()
+        self._queues: dict[bytes, deque[_Request[object]]] = {}
+        self._order: deque[bytes] = deque()  # round-robin order of the GPIB addresses that have pending requests
+        self._state: dict[str, bytes] = {}  # the ++ settings that the Controller is currently using
+        self._batch: int = 0
+        self._thread: Thread | None = None
+        self._devices: list[Prologix] = []  # the equipment that are attached to the Controller
+        self._srq_watcher: PrologixSRQWatcher | None = None
+        self.max_batch: int = max(1, int(max_batch))
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"{self.__class__.__name__}<{self._controller}>"
+
+    def _execute(self, request: _Request[object]) -> None:
+        """Execute a request (called in the background thread)."""
+        if not request.future.set_running_or_notify_cancel():
+            return
+
+        try:
+            with self._controller.lock:
+                if request.select:
+                    self.select(request.device)
+                result = request.func()
+        except Exception as e:  # noqa: BLE001
+            request.future.set_exception(e)
+        else:
+            request.future.set_result(result)
+
+    def _next(self) -> _Request[object]:
+        """Get the next request to execute. Must be called while the condition is acquired."""
+        key = self._order[0]
+        queue = self._queues[key]
+        request = queue.popleft()
+        self._batch += 1
+        if not queue:
+            _ = self._order.popleft()
+            del self._queues[key]
+            self._batch = 0
+        elif self._batch >= self.max_batch:
+            self._order.rotate(-1)
+            self._batch = 0
+        return request
+
+    def _worker(self) -> None:
+        """Execute the requests in the queue (runs in the background thread)."""
+        while True:
+            with self._condition:
+                while not self._order:
+                    _ = self._condition.wait()
+                request = self._next()
+            self._execute(request)
+
+    @property
+    def controller(self) -> PrologixUSB | PrologixEthernet:
+        """Returns the connection to the Prologix Controller."""
+        return self._controller
+
+    @property
+    def devices(self) -> list[Prologix]:
+        """Returns the equipment that are attached to the Prologix Controller."""
+        return list(self._devices)
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of requests that are waiting to be executed."""
+        with self._condition:
+            return sum(len(q) for q in self._queues.values())
+
+    def register(self, device: Prologix) -> None:
+        """Attach equipment to the Prologix Controller.
+
+        Args:
+            device: The equipment to attach.
+        """
+        with self._condition:
+            if device not in self._devices:
+                self._devices.append(device)
+
+    def remember(self, key: str, command: bytes) -> None:
+        r"""Remember a ++ setting that the Controller is now using.
+
+        Args:
+            key: The name of the setting, e.g., `eoi`.
+            command: The ++ command that was sent to the Controller, e.g., `b"++eoi 0\n"`.
+        """
+        self._state[key] = command
+
+    def reset(self) -> None:
+        """Forget the ++ settings that the Controller is using.
+
+        The settings are resent to the Controller before the next request for a device is executed.
+        """
+        self._state.clear()
+
+    def run(self, device: Prologix, func: Callable[[], T], *, select: bool = True) -> T:
+        """Schedule a request and wait for it to be executed.
+
+        If this method is called by a request that is currently being executed, `func` is
+        called immediately (otherwise a deadlock would occur).
+
+        Args:
+            device: The equipment that the request is for.
+            func: The callable to execute.
+            select: Whether the GPIB address (and the ++ settings) of `device` must be
+                selected before `func` is called.
+
+        Returns:
+            The value returned by `func`.
+        """
+        if current_thread() is self._thread:
+            if select:
+                self.select(device)
+            return func()
+        return self.submit(device, func, select=select).result()
+
+    def select(self, device: Prologix, keys: Sequence[str] = ("addr", "eoi", "eos")) -> None:
+        """Send the ++ commands (only those that have changed) so that the Controller communicates with `device`.
+
+        This method must only be called by a request that is being executed.
+
+        Args:
+            device: The equipment to select.
+            keys: The names of the ++ settings to send.
+        """
+        settings = device.settings
+        for key in keys:
+            command = settings[key]
+            if self._state.get(key) != command:
+                _ = self._controller.write(command)
+                self._state[key] = command
+
+    def submit(self, device: Prologix, func: Callable[[], T], *, select: bool = True) -> Future[T]:
+        """Schedule a request without waiting for it to be executed.
+
+        Args:
+            device: The equipment that the request is for.
+            func: The callable to execute. The callable may call methods of `device`,
+                for example, `lambda: device.query("MEAS?")`.
+            select: Whether the GPIB address (and the ++ settings) of `device` must be
+                selected before `func` is called.
+
+        Returns:
+            A future that completes when `func` has been executed.
+        """
+        key = device.address
+        request: _Request[T] = _Request(device, func, select=select)
+        with self._condition:
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+                self._order.append(key)
+            queue.append(request)  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+            if self._thread is None:
+                self._thread = Thread(target=self._worker, name=f"{self!r}", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return request.future
+
+    @property
+    def srq_watcher(self) -> PrologixSRQWatcher:
+        """Returns the service-request watcher for the Prologix Controller."""
+        if self._srq_watcher is None:
+            self._srq_watcher = PrologixSRQWatcher(self)
+        return self._srq_watcher
+
+    def unregister(self, device: Prologix) -> None:
+        """Detach equipment from the Prologix Controller.
+
+        The service-request callbacks of `device` are also removed.
+
+        Args:
+            device: The equipment to detach.
+        """
+        with self._condition:
+            if device in self._devices:
+                self._devices.remove(device)
+        if self._srq_watcher is not None:
+            self._srq_watcher.remove_callback(device)
+
+
+class _SRQWaiter:
+    """A thread that is waiting for a service request."""
+
+    __slots__: tuple[str, ...] = ("delay", "device", "error", "event", "status")
+
+    def __init__(self, device: Prologix, delay: float) -> None:
+        self.delay: float = delay
+        self.device: Prologix = device
+        self.error: Exception | None = None
+        self.event: Event = Event()
+        self.status: int = 0
+
+
+def _call_srq_callback(device: Prologix, callback: Callable[[int], None], status: int) -> None:
+    """Call a service-request callback, an exception does not stop the background thread."""
+    try:
+        callback(status)
+    except Exception as e:  # noqa: BLE001
+        logger.debug("%r SRQ callback %s: %s", device, e.__class__.__name__, e)
+
+
+class PrologixSRQWatcher:
+    """Watches for service requests from the equipment that are attached to a Prologix Controller."""
+
+    def __init__(self, scheduler: PrologixScheduler, *, min_delay: float = 0.001, max_delay: float = 0.05) -> None:
+        """Watches for service requests from the equipment that are attached to a Prologix Controller.
+
+        A single background thread checks whether the SRQ line is asserted (by sending `++srq` to the
+        Controller) while there are threads waiting for a service request or while callbacks are registered.
+        The interval between checks starts at `min_delay` and doubles after each check (up to `max_delay`)
+        until the SRQ line is asserted. When the SRQ line is asserted, all attached equipment are serial
+        polled in one sweep, all waiting threads are woken up and the callbacks of each equipment that
+        requested service (bit 6 of the status byte is set) are called.
+
+        You do not need to create an instance of this class, use
+        [wait_for_srq][msl.equipment.interfaces.prologix.Prologix.wait_for_srq] or
+        [add_srq_callback][msl.equipment.interfaces.prologix.Prologix.add_srq_callback].
+
+        Args:
+            scheduler: The scheduler of the Prologix Controller.
+            min_delay: The minimum number of seconds between checking if the SRQ line is asserted.
+            max_delay: The maximum number of seconds between checking if the SRQ line is asserted.
+        """
+        self._scheduler: PrologixScheduler = scheduler
+        self._condition: Condition = Condition()
+        self._waiters: list[_SRQWaiter] = []
+        self._callbacks: dict[Prologix, list[Callable[[int], None]]] = {}
+        self._restart: bool = True
+        self._thread: Thread | None = None
+        self.min_delay: float = min_delay
+        self.max_delay: float = max_delay
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"{self.__class__.__name__}<{self._scheduler.controller}>"
+
+    def _notify(self) -> None:
+        """Wake up the background thread. Must be called while the condition is acquired."""
+        self._restart = True
+        if self._thread is None:
+            self._thread = Thread(target=self._worker, name=f"{self!r}", daemon=True)
+            self._thread.start()
+        self._condition.notify()
+
+    def _sweep(self) -> dict[Prologix, int]:
+        """Serial poll all attached equipment (runs as a single scheduled request)."""
+        controller = self._scheduler.controller
+        polled: dict[bytes, int] = {}
+        statuses: dict[Prologix, int] = {}
+        for device in self._scheduler.devices:
+            key = device.address
+            if key not in polled:
+                cmd = f"++spoll {device.pad}" if device.sad is None else f"++spoll {device.pad} {device.sad}"
+                polled[key] = int(controller.query(cmd, decode=False))
+            statuses[device] = polled[key]
+        return statuses
+
+    def _worker(self) -> None:  # noqa: C901
+        """Check for service requests (runs in the background thread)."""
+        controller = self._scheduler.controller
+        delay = self.min_delay
+        while True:
+            with self._condition:
+                while not (self._waiters or self._callbacks):
+                    _ = self._condition.wait()
+                if self._restart:
+                    self._restart = False
+                    delay = self.min_delay
+                max_delay = min([w.delay for w in self._waiters] or [self.max_delay])
+                device = self._waiters[0].device if self._waiters else next(iter(self._callbacks))
+
+            try:
+                run = self._scheduler.run
+                asserted = int(run(device, lambda: controller.query(b"++srq\n"), select=False)) == 1
+                statuses = run(device, self._sweep, select=False) if asserted else {}
+            except Exception as e:  # noqa: BLE001
+                logger.debug("%r %s: %s", self, e.__class__.__name__, e)
+                with self._condition:
+                    for waiter in self._waiters:
+                        waiter.error = e
+                        waiter.event.set()
+                    self._waiters.clear()
+                    _ = self._condition.wait(max_delay)
+                continue
+
+            if not asserted:
+                with self._condition:
+                    if not self._restart:
+                        _ = self._condition.wait(delay)
+                delay = min(2 * delay, max_delay)
+                continue
+
+            with self._condition:
+                for waiter in self._waiters:
+                    waiter.status = statuses.get(waiter.device, 0)
+                    waiter.event.set()
+                self._waiters.clear()
+                callbacks = [(d, list(c)) for d, c in self._callbacks.items()]
+
+            requested = False
+            for dev, funcs in callbacks:
+                status = statuses.get(dev, 0)
+                if status & 0x40:  # RQS
+                    requested = True
+                    for func in funcs:
+                        _call_srq_callback(dev, func, status)
+
+            # if no equipment claimed the service request, keep backing off
+            delay = self.min_delay if requested else min(2 * delay, max_delay)
+
+    def add_callback(self, device: Prologix, callback: Callable[[int], None]) -> None:
+        """Add a callback that is called when the equipment requests service.
+
+        Args:
+            device: The equipment to add the callback for.
+            callback: A callable that accepts the status byte of the equipment.
+        """
+        with self._condition:
+            self._callbacks.setdefault(device, []).append(callback)
+            self._notify()
+
+    def remove_callback(self, device: Prologix, callback: Callable[[int], None] | None = None) -> None:
+        """Remove a callback.
+
+        Args:
+            device: The equipment to remove the callback for.
+            callback: The callback to remove. If `None`, remove all callbacks for `device`.
+        """
+        with self._condition:
+            callbacks = self._callbacks.get(device, [])
+            if callback is None:
+                callbacks.clear()
+            elif callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                _ = self._callbacks.pop(device, None)
+
+    def wait(self, device: Prologix, *, delay: float = 0.05, timeout: float | None = None) -> int:
+        """Wait for the SRQ line to be asserted.
+
+        Args:
+            device: The equipment that is waiting.
+            delay: The maximum number of seconds between checking if the SRQ line is asserted.
+            timeout: The maximum number of seconds to wait before raising [TimeoutError][]
+                if the SRQ line is not asserted. A value of `None` means wait forever.
+
+        Returns:
+            The status byte of `device` from the serial-poll sweep.
+        """
+        waiter = _SRQWaiter(device, max(delay, self.min_delay))
+        with self._condition:
+            self._waiters.append(waiter)
+            self._notify()
+
+        if not waiter.event.wait(timeout or None):
+            with self._condition:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            if not waiter.event.is_set():
+                msg = f"SRQ line has not been asserted after {timeout} seconds"
+                raise TimeoutError(msg)
+
+        if waiter.error is not None:
+            raise waiter.error
+        return waiter.status
+
 
 class Prologix(Interface, regex=REGEX):
     """Use [Prologix](https://prologix.biz/) hardware to establish a connection."""
@@ -78,10 +566,10 @@ class Prologix(Interface, regex=REGEX):
     _controllers: ClassVar[dict[str, PrologixUSB | PrologixEthernet]] = {}
     """A mapping of all Prologix Controllers that are being used to communicate with GPIB devices."""
 
-    _selected_addresses: ClassVar[dict[str, bytes]] = {}
-    """A mapping of the currently-selected GPIB address for all Prologix Controllers."""
+    _schedulers: ClassVar[dict[str, PrologixScheduler]] = {}
+    """A mapping of the request scheduler for all Prologix Controllers."""
 
-    def __init__(self, equipment: Equipment) -> None:
+    def __init__(self, equipment: Equipment) -> None:  # noqa: PLR0915
         """Use [Prologix](https://prologix.biz/) hardware to establish a connection.
 
         For the GPIB-ETHERNET Controller, the format of the [address][msl.equipment.schema.Connection.address]
@@ -140,12 +628,11 @@ class Prologix(Interface, regex=REGEX):
                 read. The `read_tmo_ms` value must be between 1 and 3000 milliseconds. _Default: `1000`_
 
         !!! important
-            The Prologix Connection Properties are the same for _all_ equipment that are attached to the
-            Prologix hardware. If different equipment require different properties you must manage the
-            settings appropriately, such as by writing `++eoi 0` to disable the use of the End or
-            Identify line before reading from the equipment and then perhaps writing `++eoi 1`
-            to re-enable it afterwards. Only the `escape_characters` property is associated with the
-            [Prologix][] instance.
+            Except for `eoi`, `eos` and `escape_characters`, the Prologix Connection Properties are the same
+            for _all_ equipment that are attached to the Prologix hardware. The `eoi` and `eos` values
+            (including the values from writing `++eoi <value>` or `++eos <value>` messages) are associated
+            with the [Prologix][] instance and the [scheduler][msl.equipment.interfaces.prologix.Prologix.scheduler]
+            resends them to the Prologix hardware only if a different GPIB device requires a different value.
         """
         self._addr: bytes = b""
         super().__init__(equipment)
@@ -167,6 +654,7 @@ class Prologix(Interface, regex=REGEX):
             raise ValueError(msg)
 
         self._addr = f"++addr {pad}\n".encode() if sad is None else f"++addr {pad} {sad}\n".encode()
+        self._settings: dict[str, bytes] = {"addr": self._addr}
         self._pad: int = pad
         self._sad: int | None = sad
         self._plus_plus_read_char: int | str = "eoi"
@@ -182,7 +670,9 @@ class Prologix(Interface, regex=REGEX):
             self._controller = PrologixEthernet(e) if info.enet_port else PrologixUSB(e)
             self._controller._str = f"Prologix<{info.hw_address}>"  # noqa: SLF001
             Prologix._controllers[self._hw_address] = self._controller
-            Prologix._selected_addresses[self._hw_address] = b""
+            Prologix._schedulers[self._hw_address] = PrologixScheduler(self._controller)
+
+        self._scheduler: PrologixScheduler = Prologix._schedulers[self._hw_address]
 
         # There are two steps involved when writing a message to the equipment
         # 1) Computer -> Prologix
@@ -198,32 +688,34 @@ class Prologix(Interface, regex=REGEX):
 
         self._escape_characters: bool = bool(props.get("escape_characters", True))
 
-        _ = self._controller.write("++mode 1\n")  # CONTROLLER mode
-        _ = self._controller.write("++auto 0\n")  # write "++read eoi|<char>" before reading
-
         eoi = 1 if props.get("eoi", True) else 0
-        _ = self._controller.write(f"++eoi {eoi}\n")
+        self._settings["eoi"] = f"++eoi {eoi}\n".encode()
 
         eos = props.get("eos", 3)
-        _ = self._controller.write(f"++eos {eos}\n")
-
-        self.set_eot_char(props.get("eot_char", 0))
-        self.set_eot_enable(props.get("eot_enable", False))
-
-        read_tmo_ms = props.get("read_tmo_ms", 1000)
-        _ = self._controller.write(f"++read_tmo_ms {read_tmo_ms}\n")
-
-        self._ensure_gpib_address_selected()
-
-    def _ensure_gpib_address_selected(self) -> None:
-        # Make sure that the connection to the equipment for this instance of the Prologix class
-        # is the equipment that the message will be sent to.
+        self._settings["eos"] = f"++eos {eos}\n".encode()
+
+        def configure() -> None:
+            _ = self._controller.write("++mode 1\n")  # CONTROLLER mode
+            _ = self._controller.write("++auto 0\n")  # write "++read eoi|<char>" before reading
+            # ++eoi and ++eos are only sent if they differ from what the Controller is currently using
+            self._scheduler.select(self, keys=("eoi", "eos"))
+            self.set_eot_char(props.get("eot_char", 0))
+            self.set_eot_enable(props.get("eot_enable", False))
+            read_tmo_ms = props.get("read_tmo_ms", 1000)
+            _ = self._controller.write(f"++read_tmo_ms {read_tmo_ms}\n")
+            self._scheduler.select(self)
+
+        self._scheduler.run(self, configure, select=False)
+        self._scheduler.register(self)
+
+    def _ensure_connected(self) -> None:
+        """Raises an exception if disconnected from the GPIB device."""
         if not self._addr:
             raise MSLConnectionError(self, "Disconnected from Prologix GPIB device")
 
-        if self._addr != Prologix._selected_addresses[self._hw_address]:
-            Prologix._selected_addresses[self._hw_address] = self._addr
-            _ = self._controller.write(self._addr)
+    def _run(self, func: Callable[[], T], *, select: bool = True) -> T:
+        """Run `func` in the scheduler of the Prologix Controller."""
+        return self._scheduler.run(self, func, select=select)
 
     def _read(self, size: int | None) -> bytes:
         # Called in `MultiInterface`
@@ -245,11 +737,34 @@ class Prologix(Interface, regex=REGEX):
         # Don't call self._controller.write because the message must be checked for characters that must be escaped
         return self.write(message)
 
+    @property
+    def address(self) -> bytes:
+        """Returns the `++addr` command that selects the GPIB address of the equipment.
+
+        Raises [MSLConnectionError][msl.equipment.interfaces.message.MSLConnectionError] if disconnected.
+        """
+        self._ensure_connected()
+        return self._addr
+
+    def add_srq_callback(self, callback: Callable[[int], None]) -> None:
+        """Add a callback that is called when the equipment requests service.
+
+        The SRQ line is checked in a background thread (one thread per Prologix Controller) and the
+        callback is called from that thread after a serial-poll sweep of all equipment that are attached
+        to the Controller finds that bit 6 (RQS) of the status byte of this equipment is set.
+
+        !!! note "See Also"
+            [remove_srq_callback][msl.equipment.interfaces.prologix.Prologix.remove_srq_callback]
+
+        Args:
+            callback: A callable that accepts the status byte of the equipment.
+        """
+        self._ensure_connected()
+        self._scheduler.srq_watcher.add_callback(self, callback)
+
     def clear(self) -> None:
         """Send the Selected Device Clear (SDC) command."""
-        with self._controller.lock:
-            self._ensure_gpib_address_selected()
-            _ = self._controller.write(b"++clr\n")
+        _ = self._run(lambda: self._controller.write(b"++clr\n"))
 
     @property
     def controller(self) -> Serial | Socket:
@@ -272,6 +787,8 @@ class Prologix(Interface, regex=REGEX):
         """
         if self._addr:
             self._addr = b""
+            if hasattr(self, "_scheduler"):
+                self._scheduler.unregister(self)
             super().disconnect()
 
     @property
@@ -312,7 +829,7 @@ class Prologix(Interface, regex=REGEX):
         command = "++trg"
         if addresses:
             command += " " + " ".join(str(a) for a in addresses)
-        _ = self._controller.write(command)
+        _ = self._run(lambda: self._controller.write(command), select=False)
 
     def interface_clear(self) -> None:
         """Perform interface clear.
@@ -320,13 +837,11 @@ class Prologix(Interface, regex=REGEX):
         Resets the GPIB bus by asserting the *interface clear* (IFC) bus line for a duration of at
         least 150 microseconds.
         """
-        _ = self._controller.write(b"++ifc\n")
+        _ = self._run(lambda: self._controller.write(b"++ifc\n"), select=False)
 
     def local(self) -> None:
         """Enables front panel operation of the device, `GTL` GPIB command."""
-        with self._controller.lock:
-            self._ensure_gpib_address_selected()
-            _ = self._controller.write(b"++loc\n")
+        _ = self._run(lambda: self._controller.write(b"++loc\n"))
 
     @property
     def max_read_size(self) -> int:
@@ -348,14 +863,18 @@ class Prologix(Interface, regex=REGEX):
         Returns:
             The help as a [list][] of `(command, description)` [tuple][]s.
         """
-        h: list[tuple[str, str]] = []
-        # ignore the first line in the reply, "The following commands are available:"
-        _ = self._controller.query(b"++help\n")
-        while True:
-            cmd, msg = map(str.strip, self._controller.read().split("--"))
-            h.append((cmd, msg))
-            if cmd == "++help":  # pragma: no branch
-                return h
+
+        def get_help() -> list[tuple[str, str]]:
+            h: list[tuple[str, str]] = []
+            # ignore the first line in the reply, "The following commands are available:"
+            _ = self._controller.query(b"++help\n")
+            while True:
+                cmd, msg = map(str.strip, self._controller.read().split("--"))
+                h.append((cmd, msg))
+                if cmd == "++help":  # pragma: no branch
+                    return h
+
+        return self._run(get_help, select=False)
 
     @overload
     def query(  # pyright: ignore[reportOverlappingOverload]
@@ -431,16 +950,19 @@ class Prologix(Interface, regex=REGEX):
         if message.startswith(b"++"):  # message is (probably) for the Prologix hardware
             if not message.endswith(b"\n"):
                 message += b"\n"
-            with self._controller.lock:
-                self._ensure_gpib_address_selected()
-                return self._controller.query(message, delay=delay, decode=decode, size=size)
+            cmd = message
+            return self._run(lambda: self._controller.query(cmd, delay=delay, decode=decode, size=size))
 
-        _ = self.write(message)
-        if delay > 0:
-            time.sleep(delay)
-        if dtype:
-            return self.read(dtype=dtype, fmt=fmt, size=size)
-        return self.read(decode=decode, size=size)
+        def query() -> bytes | str | NumpyArray1D:
+            # the write and read are a single request so that the GPIB address remains selected
+            _ = self.write(message)
+            if delay > 0:
+                time.sleep(delay)
+            if dtype:
+                return self.read(dtype=dtype, fmt=fmt, size=size)
+            return self.read(decode=decode, size=size)
+
+        return self._run(query)
 
     @overload
     def read(  # pyright: ignore[reportOverlappingOverload]
@@ -505,11 +1027,13 @@ class Prologix(Interface, regex=REGEX):
                 as a numpy [ndarray][numpy.ndarray], if `decode` is `True` then the message
                 is returned as a [str][], otherwise the message is returned as [bytes][].
         """
-        with self._controller.lock:
-            self._ensure_gpib_address_selected()
+
+        def read() -> bytes | str | NumpyArray1D:
             _ = self._controller.write(f"++read {self._plus_plus_read_char}\n")
             return self._controller.read(decode=decode, dtype=dtype, fmt=fmt, size=size)  # type: ignore[arg-type]
 
+        return self._run(read)
+
     @property
     def read_termination(self) -> bytes | None:
         """The termination character sequence that is used for a
@@ -525,6 +1049,14 @@ class Prologix(Interface, regex=REGEX):
     def read_termination(self, termination: str | bytes | None) -> None:  # pyright: ignore[reportPropertyTypeMismatch]
         self._controller.read_termination = termination
 
+    def remove_srq_callback(self, callback: Callable[[int], None] | None = None) -> None:
+        """Remove a callback that was added by [add_srq_callback][msl.equipment.interfaces.prologix.Prologix.add_srq_callback].
+
+        Args:
+            callback: The callback to remove. If `None`, remove all callbacks for this equipment.
+        """  # noqa: E501
+        self._scheduler.srq_watcher.remove_callback(self, callback)
+
     def remote_enable(self, state: bool) -> None:  # noqa: FBT001
         """Whether to enable or disable front panel operation of the device.
 
@@ -532,9 +1064,7 @@ class Prologix(Interface, regex=REGEX):
             state: If `True`, the device goes to remote mode (local lockout), `False` for local mode.
         """
         if state:
-            with self._controller.lock:
-                self._ensure_gpib_address_selected()
-                _ = self._controller.write(b"++llo\n")
+            _ = self._run(lambda: self._controller.write(b"++llo\n"))
         else:
             self.local()
 
@@ -543,7 +1073,12 @@ class Prologix(Interface, regex=REGEX):
 
         It takes about five seconds for the Controller to reboot.
         """
-        _ = self._controller.write(b"++rst\n")
+
+        def reset() -> None:
+            _ = self._controller.write(b"++rst\n")
+            self._scheduler.reset()
+
+        self._run(reset, select=False)
 
     @property
     def rstrip(self) -> bool:
@@ -554,6 +1089,21 @@ class Prologix(Interface, regex=REGEX):
     def rstrip(self, value: bool) -> None:
         self._controller.rstrip = value
 
+    @property
+    def scheduler(self) -> PrologixScheduler:
+        """The scheduler for the requests that are sent to the Prologix Controller.
+
+        The scheduler is shared by all equipment that are attached to the same Prologix Controller.
+        You may use the scheduler to queue requests without waiting for the requests to be executed,
+        for example,
+
+        ```python
+        futures = [dmm.scheduler.submit(dmm, lambda dmm=dmm: dmm.query("READ?")) for dmm in dmms]
+        readings = [float(f.result()) for f in futures]
+        ```
+        """
+        return self._scheduler
+
     @property
     def sad(self) -> int | None:
         """Returns the secondary GPIB address."""
@@ -575,7 +1125,7 @@ class Prologix(Interface, regex=REGEX):
         s = self._sad if sad is None else sad
         cmd = f"++spoll {p} {s}" if s is not None else f"++spoll {p}"
         try:
-            return int(self._controller.query(cmd, decode=False))
+            return int(self._run(lambda: self._controller.query(cmd, decode=False), select=False))
         except ValueError:  # pragma: no cover
             return 0
 
@@ -590,7 +1140,8 @@ class Prologix(Interface, regex=REGEX):
         Args:
             char: Must be an ASCII value &lt;256, e.g., `42` appends `*` (ASCII 42) when EOI is detected.
         """
-        _ = self._controller.write(f"++eot_char {_char_to_int(char)}\n")
+        command = f"++eot_char {_char_to_int(char)}\n"
+        _ = self._run(lambda: self._controller.write(command), select=False)
 
     def set_eot_enable(self, enable: bool | int) -> None:  # noqa: FBT001
         """Enables or disables the appending of a user-specified character.
@@ -602,7 +1153,7 @@ class Prologix(Interface, regex=REGEX):
             enable: Whether to enable or disable the appending of a user-specified character.
         """
         state = 1 if enable else 0
-        _ = self._controller.write(f"++eot_enable {state}\n")
+        _ = self._run(lambda: self._controller.write(f"++eot_enable {state}\n"), select=False)
 
     def set_plus_plus_read_char(self, char: bytes | str | int | None = None) -> None:
         """Set the character to send when the `++read eoi|<char>` message is written in [read][msl.equipment.interfaces.prologix.Prologix.read].
@@ -613,6 +1164,11 @@ class Prologix(Interface, regex=REGEX):
         """  # noqa: E501
         self._plus_plus_read_char = "eoi" if char is None else _char_to_int(char)
 
+    @property
+    def settings(self) -> dict[str, bytes]:
+        """Returns the `++addr`, `++eoi` and `++eos` commands that the Prologix Controller uses for the equipment."""
+        return dict(self._settings)
+
     @property
     def timeout(self) -> float | None:
         """The timeout, in seconds, to use for the connection to the Prologix hardware.
@@ -632,7 +1188,7 @@ class Prologix(Interface, regex=REGEX):
     def trigger(self) -> None:
         """Trigger device."""
         cmd = f"++trg {self._pad}\n" if self._sad is None else f"++trg {self._pad} {self._sad}\n"
-        _ = self._controller.write(cmd)
+        _ = self._run(lambda: self._controller.write(cmd), select=False)
 
     def wait(
         self,
@@ -645,12 +1201,15 @@ class Prologix(Interface, regex=REGEX):
     ) -> int:
         """Wait for an event.
 
+        The status byte is polled tightly at first and the interval between polls doubles
+        (up to `delay`) until the event occurs.
+
         Args:
             mask: Wait until one of the conditions specified in `mask` is true.
                 See [here](https://linux-gpib.sourceforge.io/doc_html/reference-globals-ibsta.html)
                 for the bit values that the `mask` supports. If `mask=0`,
                 then this method will return immediately.
-            delay: The number of seconds to wait between checking for an event.
+            delay: The maximum number of seconds to wait between checking for an event.
             pad: The primary GPIB address to poll. If not specified, uses the
                 primary address of the instantiated class.
             sad: The secondary GPIB address to poll. If not specified, uses the
@@ -663,17 +1222,19 @@ class Prologix(Interface, regex=REGEX):
         """
         p = self._pad if pad is None else pad
         s = self._sad if sad is None else sad
-        t0 = time.time()
+        interval = min(self._scheduler.srq_watcher.min_delay, delay)
+        t0 = time.monotonic()
         while True:
             status = self.serial_poll(pad=p, sad=s)
             if (status & mask) or (mask == 0):
                 return status
 
-            if timeout and time.time() > t0 + timeout:
+            if timeout and time.monotonic() > t0 + timeout:
                 msg = f"An event has not occurred after {timeout} seconds"
                 raise TimeoutError(msg)
 
-            time.sleep(delay)
+            time.sleep(interval)
+            interval = min(2 * interval, delay)
 
     def wait_for_srq(self, *, delay: float = 0.05, timeout: float | None = None) -> int:
         """Wait for the SRQ interrupt line to be asserted.
@@ -682,24 +1243,26 @@ class Prologix(Interface, regex=REGEX):
         from *any* device. If there are multiple devices connected to the Prologix Controller,
         you must determine which device asserted the service request.
 
+        The SRQ line is checked by a background thread that is shared by all threads that are waiting
+        for a service request from equipment that are attached to the same Prologix Controller. When
+        the SRQ line is asserted, all attached equipment are serial polled in one sweep and all
+        waiting threads are woken up.
+
+        !!! note "See Also"
+            [add_srq_callback][msl.equipment.interfaces.prologix.Prologix.add_srq_callback]
+
         Args:
-            delay: The number of seconds to wait between checking if SRQ has been asserted.
+            delay: The maximum number of seconds to wait between checking if SRQ has been asserted.
+                The SRQ line is checked tightly at first and the interval between checks doubles
+                (up to `delay`) until the SRQ line is asserted.
             timeout: The maximum number of seconds to wait before raising [TimeoutError][]
                 if the SRQ line is not asserted. A value of `None` means wait forever.
 
         Returns:
             The [status value](https://linux-gpib.sourceforge.io/doc_html/reference-globals-ibsta.html).
         """
-        t0 = time.time()
-        while True:
-            if int(self._controller.query(b"++srq\n")) == 1:
-                return self.serial_poll()
-
-            if timeout and time.time() > t0 + timeout:
-                msg = f"SRQ line has not been asserted after {timeout} seconds"
-                raise TimeoutError(msg)
-
-            time.sleep(delay)
+        self._ensure_connected()
+        return self._scheduler.srq_watcher.wait(self, delay=delay, timeout=timeout)
 
     def write(
         self,
@@ -711,6 +1274,10 @@ class Prologix(Interface, regex=REGEX):
     ) -> int:
         """Write a message to the equipment.
 
+        A large message (e.g., an arbitrary waveform that is specified by `data`) is escaped and
+        streamed to the Prologix Controller in chunks, rather than building the entire escaped
+        message in memory before writing it.
+
         !!! note "See Also"
             [escape_characters][msl.equipment.interfaces.prologix.Prologix.escape_characters]
 
@@ -739,26 +1306,51 @@ class Prologix(Interface, regex=REGEX):
             # Prologix termination is b"\n" not self._write_termination (which is for the Equipment)
             if not message.endswith(b"\n"):
                 message += b"\n"
-            return self._controller.write(message, data=data, dtype=dtype, fmt=fmt)
+            cmd = message
+
+            def write_plus_plus() -> int:
+                n = self._controller.write(cmd, data=data, dtype=dtype, fmt=fmt)
+                match = _EOI_EOS_REGEX.match(cmd)
+                if match is not None:
+                    # remember the setting for this device and that the Controller is now using it
+                    key, value = match["key"].decode(), cmd.rstrip()
+                    self._settings[key] = value + b"\n"
+                    self._scheduler.remember(key, value + b"\n")
+                return n
+
+            return self._run(write_plus_plus, select=False)
+
+        # Keep the message, the data and the termination separate (rather than concatenating
+        # them) so that a large payload is not copied before it is escaped and written
+        payload = None if data is None else to_bytes(data, fmt=fmt, dtype=dtype)
+        parts = _message_parts(message, payload, self._write_termination)
+        if sum(len(p) for p in parts) > _WRITE_CHUNK_SIZE:
+            chunks = _chunks(parts, escape=self._escape_characters)
+            return self._run(lambda: self._write_chunks(chunks))
+
+        message = b"".join(parts)
+        if self._escape_characters:
+            # Escape \n \r ESC + characters so that Prologix does not consume them but passes them on to the Equipment
+            message = _escape(message)
 
-        if data is not None:
-            message += to_bytes(data, fmt=fmt, dtype=dtype)
+        # Add an un-escaped \n for Prologix to know it has received the full message from the Computer
+        escaped = message + b"\n"
+        return self._run(lambda: self._controller.write(escaped))
 
-        if self._write_termination and not message.endswith(self._write_termination):
-            message += self._write_termination
+    def _write_chunks(self, chunks: Iterator[bytes]) -> int:
+        """Stream chunks of a large message to the Prologix Controller.
 
-        if self._escape_characters:
-            # Escape \n \r ESC + characters so that Prologix does not consume them but passes them on to the Equipment
-            # ASCII code ESC is decimal 27 (octal 033, hexadecimal 0x1B)
-            message = message.replace(b"\033", b"\033\033")  # must be first
-            message = message.replace(b"\n", b"\033\n")
-            message = message.replace(b"\r", b"\033\r")
-            message = message.replace(b"+", b"\033+")
-
-        with self._controller.lock:
-            self._ensure_gpib_address_selected()
-            # Add an un-escaped \n for Prologix to know it has received the full message from the Computer
-            return self._controller.write(message + b"\n")
+        The un-escaped LF that tells Prologix that it has received the full message is appended to the last chunk.
+        """
+        controller = self._controller
+        n = 0
+        pending = b""
+        for chunk in chunks:
+            if pending:
+                n += controller.write_chunk(pending)
+            pending = chunk
+        pending += b"\n"
+        return n + controller.write_chunk(pending)
 
     @property
     def write_termination(self) -> bytes | None:
@@ -0,0 +1,661 @@
+"""Control equipment that is connected to a remote computer using ZeroMQ."""
+
+from __future__ import annotations
+
+import builtins
+import enum
+import inspect
+import struct
+from collections import deque
+from typing import TYPE_CHECKING
+
+import numpy as np
+import zmq
+
+from msl.equipment.schema import Interface
+from msl.equipment.utils import logger
+
+from .message import MSLConnectionError, MSLTimeoutError
+from .zeromq import ZeroMQServer, pack_array, parse_zmq_address, unpack_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from typing import Any
+
+    from zmq.sugar.context import Context
+    from zmq.sugar.socket import SyncSocket
+
+    from msl.equipment.schema import Equipment
+    from msl.equipment.typing import ZMQBuffer
+
+
+# request header: operation, request id
+_REQUEST = struct.Struct("<BI")
+_DESCRIBE, _EXECUTE = 0, 1
+
+# reply header: request id
+_REPLY = struct.Struct("<I")
+
+# the kind of each call in a batch
+_CALL, _GET, _SET = 0, 1, 2
+
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_C128 = struct.Struct("<dd")
+_U32 = struct.Struct("<I")
+
+
+class EquipmentServer(ZeroMQServer):
+    """Make the methods of an interface available to clients on the network."""
+
+    def __init__(
+        self,
+        interface: Interface,
+        *,
+        allow: str | Iterable[str] | None = None,
+        host: str = "*",
+        max_in_flight: int = 100,
+        methods: Iterable[str] | None = None,
+        port: int = 0,
+        protocol: str = "tcp",
+    ) -> None:
+        """Make the methods of an interface available to clients on the network.
+
+        Unlike a [ZeroMQServer][msl.equipment.interfaces.zeromq.ZeroMQServer], a `handle_request`
+        method does not need to be implemented. A client connects to the server by specifying
+        `remote=True` as a _property_ of a [Connection][msl.equipment.schema.Connection] that
+        has a `ZMQ::host::port` address, see [RemoteEquipment][msl.equipment.interfaces.remote.RemoteEquipment].
+
+        The server uses a [ROUTER][zmq.SocketType.ROUTER] socket, so the requests from different
+        clients are received concurrently, but the requests are handled one at a time (in a single
+        worker thread) so that only one client communicates with the equipment at a time.
+
+        Args:
+            interface: The interface to make available on the network. Can be any
+                [Interface][msl.equipment.schema.Interface], including a resource.
+            allow: The IPv4 address(es), or hostname(s), that are allowed to connect to the server.
+                If not specified, all IP addresses can connect.
+            host: The network interface (IP address) to bind the server to. If `*`, the server
+                listens on all available network interfaces simultaneously.
+            max_in_flight: The maximum number of requests that the server accepts but has not replied to yet.
+            methods: The names of the public methods and attributes of the `interface` that a client
+                may use. If not specified, all public methods and attributes (except for `disconnect`)
+                may be used.
+            port: The port to bind the server to. If `0`, binds the server to any available port.
+            protocol: The ZeroMQ protocol to use (`tcp`, `udp`, `pgm`, `inproc`, `ipc`).
+
+        **Example:**
+        ```python
+        from msl.equipment import Connection, EquipmentServer
+
+        supply = Connection("COM3", manufacturer="Aim-TTi", model="MX100TP").connect()
+        server = EquipmentServer(supply, port=5555)
+        server.start()
+        ```
+        """
+        # check the names before the socket is created
+        members = _members(interface, methods)
+
+        super().__init__(
+            allow=allow,
+            host=host,
+            max_in_flight=max_in_flight,
+            port=port,
+            protocol=protocol,
+            socket_type="ROUTER",
+            workers=1,
+        )
+
+        self.interface: Interface = interface
+        """[Interface][msl.equipment.schema.Interface] &mdash; The interface that is available on the network."""
+
+        self._members: dict[str, bool] = members
+
+    def _execute(self, name: str, kind: int, args: Sequence[Any], kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Execute a call from a client."""
+        if name not in self._members:
+            msg = f"{self.interface.__class__.__name__!r} object has no attribute {name!r} that a client may use"
+            raise AttributeError(msg)
+        if kind == _GET:
+            return getattr(self.interface, name)
+        if kind == _SET:
+            setattr(self.interface, name, args[0])
+            return None
+        return getattr(self.interface, name)(*args, **kwargs)
+
+    def handle_request(self, msg_parts: list[bytes]) -> list[ZMQBuffer]:  # pyright: ignore[reportImplicitOverride]
+        """Handle a request from a [RemoteEquipment][msl.equipment.interfaces.remote.RemoteEquipment] client.
+
+        Args:
+            msg_parts: The request message.
+
+        Returns:
+            The reply.
+        """
+        op, request_id = _REQUEST.unpack(msg_parts[0])
+        if op == _DESCRIBE:
+            methods = [name for name, is_method in self._members.items() if is_method]
+            attributes = [name for name, is_method in self._members.items() if not is_method]
+            return _pack_message(_REPLY.pack(request_id), [(True, (methods, attributes))])
+
+        try:
+            calls: list[tuple[int, str, Sequence[Any], dict[str, Any]]] = _decode(msg_parts[1], msg_parts[2:])
+        except Exception as e:  # noqa: BLE001
+            return _pack_message(_REPLY.pack(request_id), [(False, _error(e))])
+
+        # the results are encoded as they are created, the number of results is updated at the end
+        out = bytearray(b"l" + _U32.pack(0))
+        frames: list[ZMQBuffer] = []
+        count = 0
+        for kind, name, args, kwargs in calls:
+            count += 1
+            size, n = len(out), len(frames)
+            try:
+                _encode((True, self._execute(name, kind, args, kwargs)), out, frames)
+            except Exception as e:  # noqa: BLE001
+                del out[size:]
+                del frames[n:]
+                _encode((False, _error(e)), out, frames)
+                # do not execute the remaining calls in the batch
+                break
+
+        _U32.pack_into(out, 1, count)
+        return [_REPLY.pack(request_id), out, *frames]
+
+    def shutdown_handler(self) -> None:  # pyright: ignore[reportImplicitOverride]
+        """Disconnect from the equipment when the server shuts down."""
+        self.interface.disconnect()
+
+
+class RemoteEquipment(Interface, remote=True):
+    """Control equipment that is connected to a remote computer."""
+
+    def __init__(self, equipment: Equipment) -> None:
+        """Control equipment that is connected to a remote computer.
+
+        A client proxy for an [EquipmentServer][msl.equipment.interfaces.remote.EquipmentServer].
+        Calling [connect][msl.equipment.schema.Connection.connect] returns a
+        [RemoteEquipment][msl.equipment.interfaces.remote.RemoteEquipment] instance, instead of a
+        [ZeroMQ][msl.equipment.interfaces.zeromq.ZeroMQ] instance, if the `ZMQ::host::port` address
+        has the `remote` _property_ set to `True`.
+
+        The public methods and attributes of the interface on the server are available as though the
+        interface was local. Each method call (and each time an attribute is accessed) is one round
+        trip to the server. To reduce the number of round trips for a driver that communicates
+        often with the equipment, several calls can be sent in one [batch][..batch] and the
+        calls can be pipelined, i.e., sent without waiting for the previous reply, see [submit][..submit].
+
+        Arguments and return values can be `None`, [bool][], [int][], [float][], [complex][],
+        [str][], [bytes][], a [list][], [tuple][] or [dict][] of these types, an [Enum][enum.Enum]
+        member (its value is sent) or a numpy [ndarray][numpy.ndarray] (the data is not copied).
+
+        If a call raises an exception on the server, the exception is re-raised by the client.
+        A built-in exception is raised with the same type, otherwise the type of the exception
+        is the first built-in base class (a [MSLConnectionError][msl.equipment.interfaces.message.MSLConnectionError]
+        is raised as a [MSLConnectionError][msl.equipment.interfaces.message.MSLConnectionError]).
+
+        Args:
+            equipment: An [Equipment][] instance.
+
+        A [Connection][msl.equipment.schema.Connection] instance supports the following _properties_
+        for a remote interface.
+
+        Attributes: Connection Properties:
+            protocol (str): ZeroMQ protocol (`tcp`, `udp`, `pgm`, `inproc`, `ipc`) _Default: `tcp`_
+            remote (bool): Must be `True` to create a remote interface. _Default: `False`_
+            timeout (float | None): The maximum number of seconds to wait for a reply from the
+                server before a [RemoteTimeoutError][msl.equipment.interfaces.remote.RemoteTimeoutError]
+                is raised. If `None`, wait forever. _Default: `None`_
+
+        **Example:**
+        ```python
+        from msl.equipment import Connection
+
+        # The server has an IP address of 192.168.1.8 and is running on port 5555
+        supply = Connection("ZMQ::192.168.1.8::5555", remote=True, timeout=10).connect()
+
+        # One round trip for each call
+        supply.set_voltage(1, 5.0)
+        print(supply.get_voltage(1))
+
+        # One round trip for all calls
+        batch = supply.batch()
+        for channel in (1, 2, 3):
+            batch.get_voltage(channel)
+        print(batch.execute())
+        ```
+        """
+        self._context: Context[SyncSocket] | None = None
+        self._methods: frozenset[str] = frozenset()
+        self._attributes: frozenset[str] = frozenset()
+        super().__init__(equipment)
+
+        assert equipment.connection is not None  # noqa: S101
+
+        address = parse_zmq_address(equipment.connection.address)
+        if address is None:
+            msg = f"Invalid ZeroMQ address {equipment.connection.address!r}"
+            raise ValueError(msg)
+
+        p = equipment.connection.properties
+        protocol: str = p.get("protocol", "tcp")
+        self._timeout: float | None = p.get("timeout")
+        self._next_id: int = 0
+        self._pending: deque[RemoteResult] = deque()
+
+        self._context = zmq.Context()
+        self._socket: SyncSocket = self._context.socket(zmq.DEALER)
+        self._socket.setsockopt(zmq.LINGER, 0)
+        self._socket.setsockopt(zmq.RCVTIMEO, -1 if self._timeout is None else int(self._timeout * 1000))
+
+        try:
+            _ = self._socket.connect(f"{protocol}://{address.host}:{address.port}")
+        except zmq.ZMQError as e:
+            msg = f"{e.__class__.__name__}: {e}"
+            raise MSLConnectionError(self, msg) from None
+
+        methods, attributes = self._submit(_DESCRIBE, [], single=True).result()
+        self._methods = frozenset(methods)
+        self._attributes = frozenset(attributes)
+
+    def __dir__(self) -> Iterable[str]:  # pyright: ignore[reportImplicitOverride]
+        """Include the names of the remote methods and attributes."""
+        return sorted({*super().__dir__(), *self._methods, *self._attributes})
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Returns a remote method or the value of a remote attribute."""
+        # __getattr__ is only called if the attribute does not exist locally
+        if name in self.__dict__.get("_methods", ()):
+
+            def method(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                return self.call(name, *args, **kwargs)
+
+            method.__name__ = name
+            return method
+
+        if name in self.__dict__.get("_attributes", ()):
+            return self._submit(_EXECUTE, [(_GET, name, (), {})], single=True).result()
+
+        msg = f"{self.__class__.__name__!r} object has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def __setattr__(self, name: str, value: object) -> None:  # pyright: ignore[reportImplicitOverride]
+        """Set the value of a remote attribute."""
+        if name in self.__dict__.get("_attributes", ()):
+            self._submit(_EXECUTE, [(_SET, name, (value,), {})], single=True).result()
+        else:
+            super().__setattr__(name, value)
+
+    def _receive(self) -> None:
+        """Receive a reply from the server and set the result of the pending request."""
+        try:
+            frames = self._socket.recv_multipart(copy=False)
+        except zmq.Again:
+            raise RemoteTimeoutError(self, self._timeout) from None
+
+        (request_id,) = _REPLY.unpack(frames[0].bytes)
+        if all(pending.id != request_id for pending in self._pending):
+            # a reply for a request that was sent before the connection was reset
+            return
+
+        while self._pending:
+            pending = self._pending.popleft()
+            if pending.id == request_id:
+                pending._set(_decode(frames[1].buffer, frames[2:]))  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+                return
+            # the server replies in order, so the server did not reply to this request (see ZeroMQServer logs)
+            pending._set([(False, ("MSLConnectionError", "MSLConnectionError", "The reply was not received"))])  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    def _submit(
+        self, op: int, calls: list[tuple[int, str, Sequence[Any], dict[str, Any]]], *, single: bool = False
+    ) -> RemoteResult:
+        """Send a request to the server without waiting for the reply."""
+        if self._context is None:
+            msg = "The connection to the server is closed"
+            raise MSLConnectionError(self, msg)
+
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        result = RemoteResult(self, self._next_id, single=single)
+        msg_parts = _pack_message(_REQUEST.pack(op, self._next_id), calls)
+        _ = self._socket.send_multipart(msg_parts, copy=False)
+        self._pending.append(result)
+        return result
+
+    def batch(self) -> RemoteBatch:
+        """Create a batch of calls to send to the server in one round trip.
+
+        Returns:
+            A new batch. The methods of the remote interface are recorded when called on
+                the batch and are sent to the server when the batch is
+                [executed][msl.equipment.interfaces.remote.RemoteBatch.execute] or
+                [submitted][msl.equipment.interfaces.remote.RemoteBatch.submit].
+        """
+        return RemoteBatch(self)
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Call a remote method and wait for the result.
+
+        Useful if the name of the remote method is the same as the name of a method
+        of [RemoteEquipment][msl.equipment.interfaces.remote.RemoteEquipment].
+
+        Args:
+            name: The name of the remote method.
+            args: The positional arguments to pass to the remote method.
+            kwargs: The keyword arguments to pass to the remote method.
+
+        Returns:
+            The value that the remote method returned.
+        """
+        return self.submit(name, *args, **kwargs).result()
+
+    def disconnect(self) -> None:  # pyright: ignore[reportImplicitOverride]
+        """Close the connection to the server. The equipment on the server remains connected."""
+        if self._context is not None:
+            self._socket.close()
+            self._context.term()
+            self._context = None
+            self._pending.clear()
+            super().disconnect()
+
+    def submit(self, name: str, *args: Any, **kwargs: Any) -> RemoteResult:  # noqa: ANN401
+        """Call a remote method without waiting for the result.
+
+        Several calls can be submitted (pipelined) before the results are requested. The
+        server executes the calls in the order that they were submitted.
+
+        Args:
+            name: The name of the remote method.
+            args: The positional arguments to pass to the remote method.
+            kwargs: The keyword arguments to pass to the remote method.
+
+        Returns:
+            The pending result.
+        """
+        return self._submit(_EXECUTE, [(_CALL, name, args, kwargs)], single=True)
+
+
+class RemoteBatch:
+    """A batch of calls to send to the server in one round trip."""
+
+    def __init__(self, remote: RemoteEquipment) -> None:
+        """A batch of calls to send to the server in one round trip.
+
+        Calling a method of the remote interface on the batch records the call. The
+        server executes the calls in the order that they were recorded. If a call
+        raises an exception, the remaining calls in the batch are not executed.
+
+        Args:
+            remote: The remote interface.
+        """
+        self._remote: RemoteEquipment = remote
+        self._calls: list[tuple[int, str, Sequence[Any], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        """Returns a function that records a call to the remote method."""
+        if name not in self._remote._methods:  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+            msg = f"{self._remote.__class__.__name__!r} object has no remote method {name!r}"
+            raise AttributeError(msg)
+
+        def method(*args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            self.call(name, *args, **kwargs)
+
+        return method
+
+    def __len__(self) -> int:
+        """Returns the number of calls in the batch."""
+        return len(self._calls)
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Record a call to a remote method.
+
+        Args:
+            name: The name of the remote method.
+            args: The positional arguments to pass to the remote method.
+            kwargs: The keyword arguments to pass to the remote method.
+        """
+        self._calls.append((_CALL, name, args, kwargs))
+
+    def execute(self) -> list[Any]:
+        """Send the calls to the server and wait for the results.
+
+        Returns:
+            The value that each remote method returned.
+        """
+        return self.submit().result()  # type: ignore[no-any-return]
+
+    def get(self, name: str) -> None:
+        """Record a request for the value of a remote attribute.
+
+        Args:
+            name: The name of the remote attribute.
+        """
+        self._calls.append((_GET, name, (), {}))
+
+    def set(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Record a request to set the value of a remote attribute.
+
+        Args:
+            name: The name of the remote attribute.
+            value: The value to set.
+        """
+        self._calls.append((_SET, name, (value,), {}))
+
+    def submit(self) -> RemoteResult:
+        """Send the calls to the server without waiting for the results.
+
+        The batch is empty after it is submitted, so it may be reused to record more calls.
+
+        Returns:
+            The pending result. The result is a [list][] of the values that the remote methods returned.
+        """
+        calls, self._calls = self._calls, []
+        return self._remote._submit(_EXECUTE, calls)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+class RemoteResult:
+    """The pending result of a request that was sent to the server."""
+
+    def __init__(self, remote: RemoteEquipment, request_id: int, *, single: bool) -> None:
+        """The pending result of a request that was sent to the server.
+
+        Args:
+            remote: The remote interface that sent the request.
+            request_id: The id of the request.
+            single: Whether the request is for a single call (or a batch of calls).
+        """
+        self._remote: RemoteEquipment = remote
+        self._single: bool = single
+        self._results: list[tuple[bool, Any]] | None = None
+        self.id: int = request_id
+        """[int][] &mdash; The id of the request."""
+
+    def _set(self, results: list[tuple[bool, Any]]) -> None:
+        """Set the results that the server replied with."""
+        self._results = results
+
+    def done(self) -> bool:
+        """Returns whether the reply from the server has been received."""
+        return self._results is not None
+
+    def result(self) -> Any:  # noqa: ANN401
+        """Wait for the reply from the server.
+
+        Returns:
+            The value that the remote method returned, or a [list][] of
+                values for a [batch][msl.equipment.interfaces.remote.RemoteBatch].
+        """
+        while self._results is None:
+            self._remote._receive()  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+        values: list[Any] = []
+        for ok, value in self._results:
+            if not ok:
+                raise _exception(self._remote, *value)
+            values.append(value)
+
+        if not self._single:
+            return values
+        return values[0]
+
+
+class RemoteTimeoutError(MSLTimeoutError):
+    """A timeout exception waiting for a reply from the server."""
+
+    def __init__(self, remote: RemoteEquipment, timeout: float | None) -> None:
+        """A timeout exception waiting for a reply from the server.
+
+        Args:
+            remote: The remote interface that is waiting for the reply.
+            timeout: The maximum number of seconds that the remote interface waits for a reply.
+        """
+        msg = f"Timeout occurred after {timeout} second(s) waiting for a reply from the server"
+        logger.debug("%r %s", remote, msg)
+        TimeoutError.__init__(self, f"{remote!r}\n{msg}")  # MSLTimeoutError requires a message-based interface
+
+        self.message: str = msg
+        """[str][] &mdash; The error message."""
+
+
+def _encode(obj: Any, out: bytearray, frames: list[ZMQBuffer]) -> None:  # noqa: ANN401, C901, PLR0912
+    """Encode an object into a compact binary format. A numpy array is appended to `frames`."""
+    if obj is None:
+        out += b"N"
+    elif obj is True:
+        out += b"T"
+    elif obj is False:
+        out += b"F"
+    elif isinstance(obj, enum.Enum):
+        _encode(obj.value, out, frames)
+    elif isinstance(obj, int):
+        if -(1 << 63) <= obj < (1 << 63):
+            out += b"i" + _I64.pack(obj)
+        else:
+            data = str(obj).encode()
+            out += b"I" + _U32.pack(len(data)) + data
+    elif isinstance(obj, float):
+        out += b"f" + _F64.pack(obj)
+    elif isinstance(obj, complex):
+        out += b"c" + _C128.pack(obj.real, obj.imag)
+    elif isinstance(obj, str):
+        data = obj.encode()
+        out += b"s" + _U32.pack(len(data)) + data
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)  # pyright: ignore[reportUnknownArgumentType]
+        out += b"b" + _U32.pack(len(data)) + data
+    elif isinstance(obj, np.ndarray):
+        out += b"a"
+        frames.extend(pack_array(obj))
+    elif isinstance(obj, np.generic):
+        _encode(obj.item(), out, frames)
+    elif isinstance(obj, dict):
+        mapping: dict[Any, Any] = obj  # pyright: ignore[reportUnknownVariableType]
+        out += b"d" + _U32.pack(len(mapping))
+        for key, value in mapping.items():
+            _encode(key, out, frames)
+            _encode(value, out, frames)
+    elif isinstance(obj, (list, tuple)):
+        items: list[Any] | tuple[Any, ...] = obj  # pyright: ignore[reportUnknownVariableType]
+        out += (b"l" if isinstance(items, list) else b"t") + _U32.pack(len(items))
+        for item in items:
+            _encode(item, out, frames)
+    else:
+        msg = f"Cannot serialize an object of type {type(obj).__name__!r}"
+        raise TypeError(msg)
+
+
+def _decode(data: bytes | bytearray | memoryview, frames: Sequence[ZMQBuffer]) -> Any:  # noqa: ANN401, C901
+    """Decode an object that was encoded by `_encode`."""
+    view = memoryview(data)
+    pos = 0
+    array_index = 0
+
+    def read() -> Any:  # noqa: ANN401, C901, PLR0911
+        nonlocal pos, array_index
+        tag = view[pos]
+        pos += 1
+        if tag == ord("N"):
+            return None
+        if tag == ord("T"):
+            return True
+        if tag == ord("F"):
+            return False
+        if tag == ord("i"):
+            (value,) = _I64.unpack_from(view, pos)
+            pos += _I64.size
+            return value
+        if tag == ord("f"):
+            (value,) = _F64.unpack_from(view, pos)
+            pos += _F64.size
+            return value
+        if tag == ord("c"):
+            real, imag = _C128.unpack_from(view, pos)
+            pos += _C128.size
+            return complex(real, imag)
+        if tag == ord("a"):
+            array_index += 2
+            return unpack_array(frames[array_index - 2 : array_index])
+
+        if tag not in b"sbIltd":
+            msg = f"Invalid type code {chr(tag)!r} in the remote message"
+            raise ValueError(msg)
+
+        (size,) = _U32.unpack_from(view, pos)
+        pos += _U32.size
+        if tag in b"sbI":
+            raw = bytes(view[pos : pos + size])
+            pos += size
+            if tag == ord("b"):
+                return raw
+            return raw.decode() if tag == ord("s") else int(raw)
+        if tag == ord("l"):
+            return [read() for _ in range(size)]
+        if tag == ord("t"):
+            return tuple(read() for _ in range(size))
+        return {read(): read() for _ in range(size)}
+
+    return read()
+
+
+def _error(error: Exception) -> tuple[str, str, str]:
+    """Returns the name of the exception type, the name of the first built-in base class and the message."""
+    base = next(c for c in type(error).__mro__ if getattr(builtins, c.__name__, None) is c)
+    message = error.message if isinstance(error, MSLConnectionError) else str(error)
+    return type(error).__name__, base.__name__, message
+
+
+def _exception(remote: RemoteEquipment, name: str, base: str, message: str) -> Exception:
+    """Create the exception to raise for an exception that was raised on the server."""
+    if name == "MSLConnectionError":
+        return MSLConnectionError(remote, message)
+    exc = getattr(builtins, base, Exception)
+    if not (isinstance(exc, type) and issubclass(exc, Exception)):
+        exc = Exception
+    return exc(message if name == base else f"{name}: {message}")
+
+
+def _members(interface: Interface, names: Iterable[str] | None) -> dict[str, bool]:
+    """Returns the public members of an interface that a client may use and whether each member is a method."""
+    if names is None:
+        names = {*dir(type(interface)), *vars(interface)} - {"disconnect"}
+
+    members: dict[str, bool] = {}
+    for name in sorted(names):
+        if name.startswith("_"):
+            continue
+        try:
+            static = inspect.getattr_static(interface, name)
+        except AttributeError:
+            msg = f"{interface.__class__.__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg) from None
+        members[name] = not isinstance(static, property) and (
+            callable(static) or isinstance(static, (classmethod, staticmethod))
+        )
+    return members
+
+
+def _pack_message(header: bytes, obj: Any) -> list[ZMQBuffer]:  # noqa: ANN401
+    """Pack a header and an encoded object into the message parts."""
+    out = bytearray()
+    frames: list[ZMQBuffer] = []
+    _encode(obj, out, frames)
+    return [header, out, *frames]
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import re
 import time
+from collections import deque
+from contextlib import nullcontext
+from threading import Condition, Event, Lock, Thread, get_ident
 from typing import TYPE_CHECKING, NamedTuple
 
 import serial
@@ -11,11 +14,12 @@ import serial
 from msl.equipment.enumerations import DataBits, Parity, StopBits
 from msl.equipment.utils import logger, to_enum
 
-from .message import Message, MSLConnectionError, MSLTimeoutError
+from .message import Deadline, Message, MSLConnectionError, MSLTimeoutError
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
-    from typing import Any
+    from contextlib import AbstractContextManager
+    from typing import Any, Callable, ClassVar
 
     from serial.tools.list_ports_common import ListPortInfo
 
@@ -27,6 +31,363 @@ REGEX = re.compile(
     flags=re.IGNORECASE,
 )
 
+_READER_POLL_TIMEOUT = 0.1  # seconds
+
+
+class SerialReader:
+    """Reads from a serial port in a background thread and frames the messages."""
+
+    def __init__(self, device: Serial) -> None:
+        """Reads from a serial port in a background thread and frames the messages.
+
+        The background thread reads all bytes that are waiting in the receive buffer of the serial port
+        as a single block and splits the bytes into frames that end with the
+        [read_termination][msl.equipment.interfaces.message.Message.read_termination] characters.
+        Reading from the [Serial][msl.equipment.interfaces.serial.Serial] instance then only removes
+        completed frames, so the timeout of the serial port is never reconfigured by the calling thread.
+
+        Do not instantiate this class directly, call
+        [start_reader][msl.equipment.interfaces.serial.Serial.start_reader] to create a reader.
+
+        Args:
+            device: The serial device to read from.
+        """
+        self._device: Serial = device
+        self._condition: Condition = Condition()
+        self._frames: deque[bytes] = deque()  # complete frames, end with the read termination
+        self._partial: bytearray = bytearray()  # bytes that are not part of a complete frame yet
+        self._size: int = 0  # total number of bytes in _frames and _partial
+        self._error: str = ""
+        self._stop: Event = Event()
+        self._thread: Thread = Thread(target=self._worker, name=f"{device}-reader", daemon=True)
+        self._thread.start()
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"<{self.__class__.__name__} frames={len(self._frames)} available={self._size}>"
+
+    def _append(self, data: bytes) -> None:
+        """Append data and split off the completed frames, must be called while the condition is acquired."""
+        partial = self._partial
+        partial.extend(data)
+        self._size += len(data)
+        termination = self._device._read_termination  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        if not termination:
+            return
+
+        # only search the new data (and the characters before it that could be a partial termination)
+        start = 0
+        index = partial.find(termination, max(0, len(partial) - len(data) - len(termination) + 1))
+        while index != -1:
+            end = index + len(termination)
+            self._frames.append(bytes(partial[start:end]))
+            start = end
+            index = partial.find(termination, start)
+        if start:
+            del partial[:start]
+
+    def _take(self, size: int) -> bytes:
+        """Remove `size` bytes, must be called while the condition is acquired and `size` bytes are available."""
+        out = bytearray()
+        frames = self._frames
+        while frames and len(out) < size:
+            out.extend(frames.popleft())
+
+        if len(out) > size:
+            frames.appendleft(bytes(out[size:]))
+            del out[size:]
+        elif len(out) < size:
+            n = size - len(out)
+            out.extend(self._partial[:n])
+            del self._partial[:n]
+
+        self._size -= size
+        return bytes(out)
+
+    def _wait(self, predicate: Callable[[], bool], timeout: float | None) -> None:
+        """Wait for the predicate to be true, must be called while the condition is acquired."""
+        if not self._condition.wait_for(lambda: predicate() or self._error != "", timeout=timeout):
+            raise MSLTimeoutError(self._device)
+        if not predicate():
+            raise MSLConnectionError(self._device, self._error)
+
+    def _worker(self) -> None:
+        """Runs in the background thread to read from the serial port."""
+        ser = self._device._serial  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        while not self._stop.is_set():
+            try:
+                # block (for a short time, so that the stop flag is checked periodically)
+                # until a byte is received, then read everything that is waiting as a single block
+                data = ser.read(ser.in_waiting or 1)
+            except OSError as e:  # serial.SerialException is a subclass of OSError
+                if self._stop.is_set():  # the port was closed
+                    break
+                with self._condition:
+                    self._error = f"The serial reader stopped, {e}"
+                    self._condition.notify_all()
+                logger.error("%s %s", self._device, self._error)
+                return
+
+            if not data:
+                continue
+
+            with self._condition:
+                self._append(data)
+                max_read_size = self._device.max_read_size
+                if len(self._partial) > max_read_size:
+                    self._error = f"len(message) [{len(self._partial)}] > max_read_size [{max_read_size}]"
+                    self._condition.notify_all()
+                    logger.error("%s %s", self._device, self._error)
+                    return
+                self._condition.notify_all()
+
+    @property
+    def available(self) -> int:
+        """The number of bytes that have been received but not read yet."""
+        return self._size
+
+    def clear(self) -> None:
+        """Discard all bytes that have been received but not read yet."""
+        with self._condition:
+            self._frames.clear()
+            self._partial.clear()
+            self._size = 0
+
+    @property
+    def frames(self) -> int:
+        """The number of complete frames that have been received but not read yet."""
+        return len(self._frames)
+
+    def read(self, size: int | None = None, timeout: float | None = None) -> bytes:
+        """Read from the received bytes.
+
+        Args:
+            size: The number of bytes to read. If `None`, read the next frame. If the
+                [read_termination][msl.equipment.interfaces.message.Message.read_termination]
+                of the device is `None`, the bytes that are available are returned.
+            timeout: The maximum number of seconds to wait. If `None`, wait forever.
+
+        Returns:
+            The bytes that were read.
+        """
+        with self._condition:
+            if size is not None:
+                self._wait(lambda: self._size >= size, timeout)
+                return self._take(size)
+
+            if not self._device._read_termination:  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+                self._wait(lambda: self._size > 0, timeout)
+                return self._take(self._size)
+
+            self._wait(lambda: len(self._frames) > 0, timeout)
+            frame = self._frames.popleft()
+            self._size -= len(frame)
+            return frame
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is reading from the serial port."""
+        return self._thread.is_alive()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        self._thread.join()
+
+
+class SerialBus:
+    """A serial port that is shared by multiple devices (e.g., an RS-485 multi-drop bus)."""
+
+    _buses: ClassVar[dict[str, SerialBus]] = {}
+    _buses_lock: ClassVar[Lock] = Lock()
+
+    def __init__(self, port: serial.Serial, *, inter_frame_gap: float | None = None, max_batch: int = 4) -> None:
+        """A serial port that is shared by multiple devices (e.g., an RS-485 multi-drop bus).
+
+        A transaction (a write and the corresponding read) of one device cannot be interrupted by
+        another device on the bus. Transactions are granted in the order that they were requested,
+        except that up to `max_batch` consecutive transactions of the same device are granted before
+        the next device in the queue, so that a device that is polled repeatedly does not have to
+        wait for the inter-frame gap and a full round of the queue for every poll.
+
+        Do not instantiate this class directly, use the `shared` property of the
+        [Connection][msl.equipment.schema.Connection] for the [Serial][msl.equipment.interfaces.serial.Serial]
+        interface to share a serial port.
+
+        Args:
+            port: The opened serial port.
+            inter_frame_gap: The minimum number of seconds between the end of one transaction and the
+                start of the next transaction. If `None`, the gap is 3.5 character times (or 1.75 ms
+                if the baud rate is greater than 19200), which is what Modbus RTU requires.
+            max_batch: The maximum number of consecutive transactions of the same device.
+        """
+        self._serial: serial.Serial = port
+        self._key: str = port.port or ""
+        self._condition: Condition = Condition()
+        self._queue: deque[_BusRequest] = deque()
+        self._owner: object = None  # the device that has (or most recently had) access to the bus
+        self._thread_id: int = 0  # the thread that has access to the bus
+        self._depth: int = 0  # number of nested acquisitions by the thread that has access to the bus
+        self._batch: int = 0  # number of consecutive transactions of the owner
+        self._last_end: float = 0.0
+        self._users: int = 0
+        self._max_batch: int = max(1, int(max_batch))
+        self._gap: float = _default_inter_frame_gap(port) if inter_frame_gap is None else float(inter_frame_gap)
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"<{self.__class__.__name__} port={self._serial.port!r} users={self._users}>"
+
+    def _acquire(self, owner: object) -> None:
+        """Wait for exclusive access to the bus."""
+        ident = get_ident()
+        with self._condition:
+            if self._depth > 0 and self._thread_id == ident:
+                self._depth += 1
+                return
+
+            request = _BusRequest(owner)
+            self._queue.append(request)
+            _ = self._condition.wait_for(lambda: self._depth == 0 and self._next() is request)
+            self._queue.remove(request)
+            self._batch = self._batch + 1 if owner is self._owner else 1
+            self._owner = owner
+            self._thread_id = ident
+            self._depth = 1
+            wait = self._last_end + self._gap - time.perf_counter()
+
+        # still has exclusive access to the bus while sleeping
+        if wait > 0:
+            time.sleep(wait)
+
+    def _next(self) -> _BusRequest:
+        """Returns the request that is granted next, must be called while the condition is acquired."""
+        if self._batch < self._max_batch:
+            for request in self._queue:
+                if request.owner is self._owner:
+                    return request
+        return self._queue[0]
+
+    def _release(self) -> None:
+        """Release exclusive access to the bus."""
+        with self._condition:
+            self._depth -= 1
+            if self._depth == 0:
+                self._last_end = time.perf_counter()
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        """Release a reference to the bus, the serial port is closed when no device is using the bus."""
+        with SerialBus._buses_lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            _ = SerialBus._buses.pop(self._key, None)
+        self._serial.close()
+
+    @property
+    def inter_frame_gap(self) -> float:
+        """The minimum number of seconds between the end of one transaction and the start of the next transaction."""
+        return self._gap
+
+    @inter_frame_gap.setter
+    def inter_frame_gap(self, value: float) -> None:
+        self._gap = float(value)
+
+    def lock(self, owner: object) -> AbstractContextManager[object]:
+        """Returns a context manager that has exclusive access to the bus.
+
+        The context manager is reentrant for the thread that has exclusive access to the bus.
+
+        Args:
+            owner: The device that is requesting access to the bus. Consecutive transactions
+                of the same `owner` are batched.
+        """
+        return _BusLock(self, owner)
+
+    @property
+    def max_batch(self) -> int:
+        """The maximum number of consecutive transactions of the same device."""
+        return self._max_batch
+
+    @max_batch.setter
+    def max_batch(self, value: int) -> None:
+        self._max_batch = max(1, int(value))
+
+    @classmethod
+    def open(cls, url: str, properties: dict[str, Any]) -> SerialBus:
+        """Open a serial port or return the bus that is already using the serial port.
+
+        Args:
+            url: The port/url of the serial port.
+            properties: Connection properties.
+
+        Returns:
+            The bus for the serial port.
+        """
+        port = _init_serial(url, properties)
+        gap: float | None = properties.get("inter_frame_gap")
+        with cls._buses_lock:
+            bus = cls._buses.get(url)
+            if bus is None:
+                port.open()  # raises serial.SerialException
+                bus = cls(port, inter_frame_gap=gap)
+                bus._key = url
+                cls._buses[url] = bus
+            else:
+                for name in ("baudrate", "bytesize", "parity", "stopbits"):
+                    expected, got = getattr(bus.serial, name), getattr(port, name)
+                    if expected != got:
+                        msg = f"The serial port {url!r} is shared with {name}={expected!r}, requested {name}={got!r}"
+                        raise ValueError(msg)
+                if gap is not None:
+                    bus.inter_frame_gap = max(bus.inter_frame_gap, gap)
+            bus._users += 1
+            return bus
+
+    @property
+    def serial(self) -> serial.Serial:
+        """Returns the reference to the [pySerial.Serial][serial.Serial]{:target="_blank"} instance."""
+        return self._serial
+
+    @property
+    def users(self) -> int:
+        """The number of devices that are using the bus."""
+        return self._users
+
+
+class _BusRequest:
+    """A request for exclusive access to a [SerialBus][msl.equipment.interfaces.serial.SerialBus]."""
+
+    __slots__: tuple[str, ...] = ("owner",)
+
+    def __init__(self, owner: object) -> None:
+        self.owner: object = owner
+
+
+class _BusLock:
+    """Context manager for exclusive access to a [SerialBus][msl.equipment.interfaces.serial.SerialBus]."""
+
+    __slots__: tuple[str, ...] = ("bus", "owner")
+
+    def __init__(self, bus: SerialBus, owner: object) -> None:
+        self.bus: SerialBus = bus
+        self.owner: object = owner
+
+    def __enter__(self) -> None:
+        self.bus._acquire(self.owner)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    def __exit__(self, *ignore: object) -> None:
+        self.bus._release()  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+def _default_inter_frame_gap(port: serial.Serial) -> float:
+    """Returns 3.5 character times (Modbus RTU uses a fixed value of 1.75 ms above 19200 baud)."""
+    if port.baudrate > 19200:  # noqa: PLR2004
+        return 1.75e-3
+    bits = 1 + port.bytesize + (0 if port.parity == serial.PARITY_NONE else 1) + port.stopbits
+    return 3.5 * bits / port.baudrate
+
 
 class Serial(Message, regex=REGEX):
     """Base class for equipment that is connected through a Serial port (or a USB-to-Serial adaptor)."""
@@ -45,6 +406,9 @@ class Serial(Message, regex=REGEX):
         name as the property name. See [serial.Serial][] for more details.
 
         Attributes: Connection Properties:
+            background_reader (bool): Whether to start a [SerialReader][msl.equipment.interfaces.serial.SerialReader]
+                when the port is opened, see [start_reader][msl.equipment.interfaces.serial.Serial.start_reader].
+                _Default: `False`_
             baud_rate (int): The baud rate (_alias:_ baudrate). _Default: `9600`_
             buffer_size (int): The maximum number of bytes to read at a time. _Default: `1024`_
             data_bits (DataBits | str | int): The number of data bits: 5, 6, 7 or 8 (_alias:_ bytesize). _Default: `8`_
@@ -53,11 +417,18 @@ class Serial(Message, regex=REGEX):
                 consecutive bytes in a read operation. A value of zero (or `None`) indicates that the inter-byte timeout
                 condition is not used. On Windows, the minimum supported value is 0.001 seconds, on POSIX it is 0.1
                 seconds. A value less than the minimum will disable the inter-byte timeout. _Default: `None`_
+            inter_frame_gap (float | None): The minimum number of seconds between the end of one transaction and
+                the start of the next transaction on a shared port. If `None`, 3.5 character times (or 1.75 ms if
+                the baud rate is greater than 19200). Only used if `shared` is `True`. _Default: `None`_
             parity (Parity | str): Parity checking: NONE, ODD, EVEN, MARK or SPACE. _Default: `NONE`_
             rts_cts (bool): Whether to enable hardware (RTS/CTS) flow control (_alias:_ rtscts). _Default: `False`_
+            shared (bool): Whether the serial port is shared by multiple devices (e.g., an RS-485 multi-drop bus),
+                see [SerialBus][msl.equipment.interfaces.serial.SerialBus]. All devices that share a port must
+                use the same baud rate, data bits, parity and stop bits. _Default: `False`_
             stop_bits (StopBits | str | float): The number of stop bits: 1, 1.5 or 2 (_alias:_ stopbits). _Default: `1`_
             xon_xoff (bool): Whether to enable software flow control (_alias:_ xonxoff). _Default: `False`_
         """
+        self._bus: SerialBus | None = None
         super().__init__(equipment)
 
         assert equipment.connection is not None  # noqa: S101
@@ -67,83 +438,180 @@ class Serial(Message, regex=REGEX):
             raise ValueError(msg)
 
         url = find_port(info.url[3:], equipment.connection.address) if info.url.startswith("?::") else info.url
-        self._serial: serial.Serial = _init_serial(url, equipment.connection.properties)
-        self._set_interface_timeout()
-
         self._buffer_size: int = equipment.connection.properties.get("buffer_size", 1024)
         self._buffer: bytearray = bytearray()
+        self._reader: SerialReader | None = None
+        self._bus_lock: AbstractContextManager[object] = nullcontext()
 
-        try:
-            self._serial.open()
-        except serial.SerialException as e:
-            raise MSLConnectionError(self, str(e)) from None
+        if equipment.connection.properties.get("shared", False):
+            try:
+                self._bus = SerialBus.open(url, equipment.connection.properties)
+            except serial.SerialException as e:
+                raise MSLConnectionError(self, str(e)) from None
+            self._serial: serial.Serial = self._bus.serial
+            self._bus_lock = self._bus.lock(self)
+        else:
+            self._serial = _init_serial(url, equipment.connection.properties)
+            self._set_interface_timeout()
+            try:
+                self._serial.open()
+            except serial.SerialException as e:
+                raise MSLConnectionError(self, str(e)) from None
 
-    def _read(self, size: int | None) -> bytes:  # pyright: ignore[reportImplicitOverride]  # noqa: C901
+        if equipment.connection.properties.get("background_reader", False):
+            _ = self.start_reader()
+
+    def _read(self, size: int | None) -> bytes:  # pyright: ignore[reportImplicitOverride]
         """Overrides method in `Message`."""
-        original_timeout = self._serial.timeout
-        t0 = time.time()
-        while True:
-            if size is not None:
-                if len(self._buffer) >= size:
-                    msg = self._buffer[:size]
-                    self._buffer = self._buffer[size:]
-                    break
+        if self._reader is not None:
+            return self._reader.read(size, timeout=self._timeout)
 
-            elif self._read_termination:
-                index = self._buffer.find(self._read_termination)
-                if index != -1:
-                    index += len(self._read_termination)
-                    msg = self._buffer[:index]
-                    self._buffer = self._buffer[index:]
-                    break
+        if self._bus is None:
+            return self._read_port(size)
+
+        with self._bus_lock:
+            self._serial.timeout = self._timeout
+            return self._read_port(size)
+
+    def _read_port(self, size: int | None) -> bytes:  # noqa: C901, PLR0912
+        """Read from the serial port."""
+        # Only the bytes that are waiting are read, which does not block, so the timeout of the port
+        # (which reconfigures the port when it is changed) is only decreased to the time remaining
+        # until the deadline if the port must wait for more bytes to arrive
+        original_timeout = self._serial.timeout
+        deadline = Deadline(original_timeout)
+        try:
+            while True:
+                if size is not None:
+                    if len(self._buffer) >= size:
+                        msg = self._buffer[:size]
+                        self._buffer = self._buffer[size:]
+                        break
+
+                elif self._read_termination:
+                    index = self._buffer.find(self._read_termination)
+                    if index != -1:
+                        index += len(self._read_termination)
+                        msg = self._buffer[:index]
+                        self._buffer = self._buffer[index:]
+                        break
+
+                waiting = self._serial.in_waiting
+                if waiting:
+                    data = self._serial.read(min(self._buffer_size, waiting))
+                else:
+                    remaining = deadline.remaining()
+                    if remaining is not None and original_timeout is not None and remaining < original_timeout:
+                        self._serial.timeout = remaining
+                    data = self._serial.read(1)
+                    if not data:
+                        raise MSLTimeoutError(self)
 
-            try:
-                data = self._serial.read(max(1, min(self._buffer_size, self._serial.in_waiting)))
-            except:
-                self._serial.timeout = original_timeout
-                raise
-            else:
                 self._buffer.extend(data)
 
-            if len(self._buffer) > self._max_read_size:
-                self._serial.timeout = original_timeout
-                error = f"len(message) [{len(self._buffer)}] > max_read_size [{self._max_read_size}]"
-                raise RuntimeError(error)
-
-            if original_timeout is not None:
-                # decrease the timeout when reading each packet so that the total
-                # time to receive all packets preserves what was specified
-                elapsed_time = time.time() - t0
-                if elapsed_time > original_timeout:
-                    self._serial.timeout = original_timeout
+                if len(self._buffer) > self._max_read_size:
+                    error = f"len(message) [{len(self._buffer)}] > max_read_size [{self._max_read_size}]"
+                    raise RuntimeError(error)
+
+                # the total time to receive all packets preserves what was specified
+                if deadline.expired:
                     raise MSLTimeoutError(self)
-                self._serial.timeout = max(0, original_timeout - elapsed_time)
+        finally:
+            if self._serial.timeout != original_timeout:
+                self._serial.timeout = original_timeout
 
-        if original_timeout is not None:
-            self._serial.timeout = original_timeout
         return bytes(msg)
 
     def _set_interface_timeout(self) -> None:  # pyright: ignore[reportImplicitOverride]
         """Overrides method in `Message`."""
-        if hasattr(self, "_serial"):
-            self._serial.timeout = self._timeout
+        if hasattr(self, "_serial") and self._bus is None:
+            if getattr(self, "_reader", None) is None:
+                self._serial.timeout = self._timeout
             self._serial.write_timeout = self._timeout
 
+    def _transaction(self) -> AbstractContextManager[object]:  # pyright: ignore[reportImplicitOverride]
+        """Overrides method in `Message`."""
+        return self._bus_lock
+
     def _write(self, message: bytes) -> int:  # pyright: ignore[reportImplicitOverride]
         """Overrides method in `Message`."""
-        return self._serial.write(message) or 0
+        if self._bus is None:
+            return self._serial.write(message) or 0
+
+        with self._bus_lock:
+            self._serial.write_timeout = self._timeout
+            n = self._serial.write(message) or 0
+            # wait until the frame has been transmitted so that the inter-frame gap starts at the end of the frame
+            self._serial.flush()
+            return n
+
+    @property
+    def bus(self) -> SerialBus | None:
+        """The bus, if the serial port is shared by multiple devices."""
+        return self._bus
 
     def disconnect(self) -> None:  # pyright: ignore[reportImplicitOverride]
-        """Close the serial port."""
-        if hasattr(self, "_serial") and self._serial.is_open:
+        """Close the serial port.
+
+        If the serial port is shared, the port is closed when no other device is using it.
+        """
+        if self._bus is not None:
+            self._bus.close()
+            self._bus = None
+            self._serial = serial.Serial()  # an unopened port, so that reading or writing raises an error
+            super().disconnect()
+        elif hasattr(self, "_serial") and self._serial.is_open:
+            self.stop_reader()
             self._serial.close()
             super().disconnect()
 
+    @property
+    def reader(self) -> SerialReader | None:
+        """The background reader, if one has been started."""
+        return self._reader
+
     @property
     def serial(self) -> serial.Serial:
         """Returns the reference to the [pySerial.Serial][serial.Serial]{:target="_blank"} instance."""
         return self._serial
 
+    def start_reader(self) -> SerialReader:
+        """Start reading from the serial port in a background thread.
+
+        Instruments that stream data continuously (e.g., a sensor in a free-running mode or a logger)
+        can send more data than is read. While the reader is running, bytes are read from the port in
+        large blocks and framed by the [read_termination][msl.equipment.interfaces.message.Message.read_termination]
+        characters off the calling thread, and [read][msl.equipment.interfaces.message.Message.read]
+        only removes completed frames (or `size` bytes) from the reader.
+
+        Returns:
+            The reader. If a reader is already running, the existing reader is returned.
+        """
+        if self._bus is not None:
+            raise MSLConnectionError(self, "Cannot start a background reader on a shared serial port")
+
+        if self._reader is not None and self._reader.running:
+            return self._reader
+
+        logger.debug("%s.start_reader()", self)
+        self._serial.timeout = _READER_POLL_TIMEOUT
+        self._buffer.clear()
+        self._reader = SerialReader(self)
+        return self._reader
+
+    def stop_reader(self) -> None:
+        """Stop reading from the serial port in a background thread.
+
+        Any bytes that were received but not read are discarded.
+        """
+        if self._reader is None:
+            return
+
+        logger.debug("%s.stop_reader()", self)
+        self._reader.stop()
+        self._reader = None
+        self._serial.timeout = self._timeout
+
 
 class ParsedSerialAddress(NamedTuple):
     """The parsed result of a VISA-style address for the Serial interface.
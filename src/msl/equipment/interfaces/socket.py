@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
 import re
 import socket
+import struct
+import sys
 import time
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING, NamedTuple, cast
 
-from .message import Message, MSLConnectionError, MSLTimeoutError
+from msl.equipment.utils import logger
+
+from .message import Deadline, Message, MSLConnectionError, MSLTimeoutError
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from msl.equipment.schema import Equipment
 
 
@@ -17,6 +24,42 @@ REGEX = re.compile(
     r"^(?P<prefix>TCP|UDP|TCPIP\d*)::(?P<host>[^\s:]+)::(?P<port>\d+)(?P<suffix>::SOCKET)?", flags=re.IGNORECASE
 )
 
+# Connection property -> (level, names of the socket constant), the first name that the platform supports is used
+_SOCKET_OPTIONS: dict[str, tuple[int, tuple[str, ...]]] = {
+    "so_keepalive": (socket.SOL_SOCKET, ("SO_KEEPALIVE",)),
+    "so_rcvbuf": (socket.SOL_SOCKET, ("SO_RCVBUF",)),
+    "so_sndbuf": (socket.SOL_SOCKET, ("SO_SNDBUF",)),
+    "tcp_keepcnt": (socket.IPPROTO_TCP, ("TCP_KEEPCNT",)),
+    "tcp_keepidle": (socket.IPPROTO_TCP, ("TCP_KEEPIDLE", "TCP_KEEPALIVE")),  # macOS uses TCP_KEEPALIVE
+    "tcp_keepintvl": (socket.IPPROTO_TCP, ("TCP_KEEPINTVL",)),
+    "tcp_nodelay": (socket.IPPROTO_TCP, ("TCP_NODELAY",)),
+    "tcp_quickack": (socket.IPPROTO_TCP, ("TCP_QUICKACK",)),
+}
+
+IS_LINUX: bool = sys.platform == "linux"
+
+# Linux socket options that the socket module does not define
+_SO_TIMESTAMP = 29  # the kernel timestamps each datagram when it arrives
+_SO_MEMINFO = 55  # memory usage of the socket, the last value (SK_MEMINFO_DROPS) is the number of dropped packets
+_SK_MEMINFO = struct.Struct("@9I")
+_TIMEVAL = struct.Struct("@ll")
+
+
+class Datagram(NamedTuple):
+    """A datagram that was received by a UDP [Socket][msl.equipment.interfaces.socket.Socket].
+
+    Args:
+        data: The payload of the datagram.
+        address: The (host, port) of the sender.
+        timestamp: The time, in seconds since the epoch, that the datagram was received. On Linux,
+            the operating system timestamps the datagram when it arrives, on other platforms it is
+            the time that the datagram was read from the socket.
+    """
+
+    data: bytes
+    address: tuple[str, int]
+    timestamp: float
+
 
 class Socket(Message, regex=REGEX):
     """Base class for equipment that is connected through a socket."""
@@ -29,10 +72,28 @@ class Socket(Message, regex=REGEX):
 
         A [Connection][msl.equipment.schema.Connection] instance supports the following _properties_
         for the socket communication protocol, as well as the _properties_ defined in
-        [Message][msl.equipment.interfaces.message.Message].
+        [Message][msl.equipment.interfaces.message.Message]. For the `so_*` and `tcp_*` socket options,
+        a value of `None` keeps the default value of the operating system. The `tcp_*` options are ignored
+        for a UDP socket.
 
         Attributes: Connection Properties:
             buffer_size (int): The maximum number of bytes to read at a time. _Default: `4096`_
+            so_keepalive (bool | None): Whether to enable keep-alive packets. Automatically enabled
+                if `tcp_keepcnt`, `tcp_keepidle` or `tcp_keepintvl` is specified. _Default: `None`_
+            so_rcvbuf (int | None): The size, in bytes, of the receive buffer of the operating system.
+                _Default: `None`_
+            so_sndbuf (int | None): The size, in bytes, of the send buffer of the operating system.
+                _Default: `None`_
+            tcp_keepcnt (int | None): The number of unacknowledged keep-alive packets to send before
+                the connection is considered to be broken. _Default: `None`_
+            tcp_keepidle (int | None): The number of seconds that the connection must be idle before
+                keep-alive packets are sent. _Default: `None`_
+            tcp_keepintvl (int | None): The number of seconds between keep-alive packets. _Default: `None`_
+            tcp_nodelay (bool | None): Whether to disable Nagle's algorithm, so that a short message
+                (e.g., a SCPI command) is sent immediately instead of waiting for the acknowledgement of
+                the previous packet. _Default: `None`_
+            tcp_quickack (bool | None): Whether to send acknowledgements immediately instead of delaying
+                them (Linux only). _Default: `None`_
         """
         super().__init__(equipment)
 
@@ -52,11 +113,21 @@ class Socket(Message, regex=REGEX):
         typ: int = socket.SOCK_DGRAM if equipment.connection.address.startswith("UDP") else socket.SOCK_STREAM
         self._is_stream: bool = typ == socket.SOCK_STREAM
         self._socket: socket.socket = socket.socket(family=socket.AF_INET, type=typ)
+        self._slots: list[bytearray] = []  # preallocated buffers for read_datagrams()
+
+        # Linux resets TCP_QUICKACK after some packets, so it must be re-enabled after every recv()
+        quickack: int = getattr(socket, "TCP_QUICKACK", 0)
+        self._quickack: int = quickack if self._is_stream and props.get("tcp_quickack") else 0
         self._connect()
 
     def _connect(self) -> None:
-        # it is recommended to set the timeout before calling connect()
+        # it is recommended to set the timeout (and the size of the buffers) before calling connect()
         self._set_interface_timeout()
+        assert self.equipment.connection is not None  # noqa: S101
+        set_socket_options(self._socket, self.equipment.connection.properties)
+        if not self._is_stream and IS_LINUX:
+            with contextlib.suppress(OSError):
+                self._socket.setsockopt(socket.SOL_SOCKET, _SO_TIMESTAMP, 1)
         if self._is_stream:
             try:
                 self._socket.connect(self._info)
@@ -69,52 +140,75 @@ class Socket(Message, regex=REGEX):
 
     def _read(self, size: int | None) -> bytes:  # pyright: ignore[reportImplicitOverride]  # noqa: C901, PLR0912
         """Overrides method in `Message`."""
-        original_timeout = self._socket.gettimeout()
-        t0 = time.time()
-        while True:
-            if size is not None:
-                if len(self._byte_buffer) >= size:
-                    msg = self._byte_buffer[:size]
-                    self._byte_buffer = self._byte_buffer[size:]
-                    break
-
-            elif self._read_termination:
-                index = self._byte_buffer.find(self._read_termination)
-                if index != -1:
-                    index += len(self._read_termination)
-                    msg = self._byte_buffer[:index]
-                    self._byte_buffer = self._byte_buffer[index:]
-                    break
+        # the socket is non-blocking while reading and poll() waits for data until the deadline,
+        # so the socket timeout is only modified twice per read rather than after every packet
+        deadline = Deadline(self._socket.gettimeout())
+        if deadline.timeout is not None:
+            self._socket.settimeout(0)
+
+        try:
+            while True:
+                if size is not None:
+                    if len(self._byte_buffer) >= size:
+                        msg = self._byte_buffer[:size]
+                        self._byte_buffer = self._byte_buffer[size:]
+                        break
+
+                elif self._read_termination:
+                    index = self._byte_buffer.find(self._read_termination)
+                    if index != -1:
+                        index += len(self._read_termination)
+                        msg = self._byte_buffer[:index]
+                        self._byte_buffer = self._byte_buffer[index:]
+                        break
+
+                try:
+                    if self._is_stream:
+                        data = self._socket.recv(self._buffer_size)
+                        if self._quickack:
+                            self._socket.setsockopt(socket.IPPROTO_TCP, self._quickack, 1)
+                    else:
+                        data, _ = self._socket.recvfrom(self._buffer_size)
+                except BlockingIOError:
+                    if not deadline.wait_readable(self._socket):
+                        raise MSLTimeoutError(self) from None
+                    continue
 
-            try:
-                if self._is_stream:
-                    data = self._socket.recv(self._buffer_size)
-                else:
-                    data, _ = self._socket.recvfrom(self._buffer_size)
-            except:
-                self._socket.settimeout(original_timeout)
-                raise
-            else:
                 self._byte_buffer.extend(data)
 
-            if len(self._byte_buffer) > self._max_read_size:
-                self._socket.settimeout(original_timeout)
-                error = f"len(message) [{len(self._byte_buffer)}] > max_read_size [{self._max_read_size}]"
-                raise RuntimeError(error)
-
-            if original_timeout is not None:
-                # decrease the timeout when reading each packet so that the total
-                # time to receive all packets preserves what was specified
-                elapsed_time = time.time() - t0
-                if elapsed_time > original_timeout:
-                    self._socket.settimeout(original_timeout)
+                if len(self._byte_buffer) > self._max_read_size:
+                    error = f"len(message) [{len(self._byte_buffer)}] > max_read_size [{self._max_read_size}]"
+                    raise RuntimeError(error)
+
+                # the total time to receive all packets preserves what was specified
+                if deadline.expired:
                     raise MSLTimeoutError(self)
-                self._socket.settimeout(max(0, original_timeout - elapsed_time))
+        finally:
+            if deadline.timeout is not None:
+                self._socket.settimeout(deadline.timeout)
 
-        if original_timeout is not None:
-            self._socket.settimeout(original_timeout)
         return bytes(msg)
 
+    def _recv_datagram(self, slot: bytearray) -> Datagram:
+        """Receive a datagram into a preallocated buffer."""
+        if not IS_LINUX:
+            size, address = self._socket.recvfrom_into(slot)
+            return Datagram(memoryview(slot)[:size].tobytes(), address, time.time())
+
+        # the ancillary data contains the timestamp from the kernel
+        # (the type checkers use the win32 platform, which does not define these functions)
+        ancillary_size = cast("int", socket.CMSG_SPACE(_TIMEVAL.size))  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+        received = self._socket.recvmsg_into([slot], ancillary_size)  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType]
+        size, ancillary, flags, address = cast("tuple[int, list[tuple[int, int, bytes]], int, Any]", received)
+        timestamp = 0.0
+        for level, typ, data in ancillary:
+            if level == socket.SOL_SOCKET and typ == _SO_TIMESTAMP:
+                seconds, microseconds = _TIMEVAL.unpack_from(data)
+                timestamp = seconds + microseconds * 1e-6
+        if flags & socket.MSG_TRUNC:
+            logger.warning("%s datagram truncated to %d bytes, increase the buffer_size", self, size)
+        return Datagram(memoryview(slot)[:size].tobytes(), address, timestamp or time.time())
+
     def _set_interface_timeout(self) -> None:  # pyright: ignore[reportImplicitOverride]
         """Overrides method in `Message`."""
         if hasattr(self, "_socket"):
@@ -154,12 +248,98 @@ class Socket(Message, regex=REGEX):
                 if 0 < max_attempts <= attempt:
                     raise
 
+    @property
+    def dropped_datagrams(self) -> int:
+        """The number of datagrams that were lost because the receive buffer of the operating system was full.
+
+        Only supported for a UDP socket on Linux, the value is always 0 otherwise. Increase the `so_rcvbuf`
+        property, or call [read_datagrams][msl.equipment.interfaces.socket.Socket.read_datagrams] more often,
+        if datagrams are being dropped.
+        """
+        if self._is_stream or not IS_LINUX:
+            return 0
+        try:
+            info = self._socket.getsockopt(socket.SOL_SOCKET, _SO_MEMINFO, _SK_MEMINFO.size)
+        except OSError:
+            return 0
+        drops: int = _SK_MEMINFO.unpack(info)[-1]
+        return drops
+
+    def read_datagrams(self, n: int = 1) -> list[Datagram]:
+        """Read datagrams from a UDP socket.
+
+        Unlike [read][msl.equipment.interfaces.message.Message.read], the boundaries of the messages
+        are kept (the read termination characters are ignored). Waits for the first datagram to
+        arrive, up to the [timeout][msl.equipment.interfaces.message.Message.timeout], and then
+        receives the datagrams that are already waiting in the receive buffer of the operating system,
+        without blocking, until `n` datagrams have been received. Each datagram is received into a
+        preallocated buffer of `buffer_size` bytes.
+
+        Args:
+            n: The maximum number of datagrams to read.
+
+        Returns:
+            The datagrams (at least one) that were received.
+        """
+        if self._is_stream:
+            raise MSLConnectionError(self, "Reading datagrams requires a UDP socket")
+
+        n = max(1, int(n))
+        while len(self._slots) < n:
+            self._slots.append(bytearray(self._buffer_size))
+
+        try:
+            datagrams = [self._recv_datagram(self._slots[0])]
+        except (socket.timeout, TimeoutError):
+            raise MSLTimeoutError(self) from None
+
+        original_timeout = self._socket.gettimeout()
+        self._socket.settimeout(0)  # non-blocking
+        try:
+            for slot in self._slots[1:n]:
+                datagram = self._recv_datagram(slot)
+                datagrams.append(datagram)
+        except BlockingIOError:  # no more datagrams are waiting
+            pass
+        finally:
+            self._socket.settimeout(original_timeout)
+
+        logger.debug("%s.read_datagrams(%d) -> %d datagram(s)", self, n, len(datagrams))
+        return datagrams
+
     @property
     def socket(self) -> socket.socket:
         """Returns a reference to the underlying socket."""
         return self._socket
 
 
+def set_socket_options(sock: socket.socket, properties: dict[str, Any]) -> None:
+    """Set the options of a socket from the _properties_ of a [Connection][msl.equipment.schema.Connection].
+
+    See [Socket][msl.equipment.interfaces.socket.Socket] for the supported properties. The options
+    should be set before the socket is connected.
+
+    Args:
+        sock: The socket.
+        properties: Connection properties.
+    """
+    is_stream = sock.type == socket.SOCK_STREAM
+    for name, (level, constants) in _SOCKET_OPTIONS.items():
+        value = properties.get(name)
+        if value is None or (level == socket.IPPROTO_TCP and not is_stream):
+            continue
+
+        option: int | None = next((getattr(socket, c) for c in constants if hasattr(socket, c)), None)
+        if option is None:
+            logger.warning("The %r socket option is not supported on this platform", name)
+            continue
+
+        if name.startswith("tcp_keep") and properties.get("so_keepalive") is None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        sock.setsockopt(level, option, int(value))
+
+
 class ParsedSocketAddress(NamedTuple):
     """The parsed result of a VISA-style address for the socket interface.
 
@@ -0,0 +1,410 @@
+"""Publish live readings to many consumers using the ZeroMQ PUB/SUB pattern."""
+
+from __future__ import annotations
+
+import struct
+import time
+from threading import Event, Thread
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import zmq
+
+from msl.equipment.utils import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+    from typing import Any
+
+    from numpy.typing import ArrayLike, NDArray
+    from zmq.sugar.context import Context
+    from zmq.sugar.socket import SyncSocket
+
+# the number of readings and the number of values in each reading (0 if each reading is a scalar)
+_HEADER = struct.Struct("<II")
+
+
+class TelemetryBatch(NamedTuple):
+    """A batch of readings that was published for a channel.
+
+    Attributes:
+        channel (str): The name of the channel.
+        timestamps (NDArray[np.float64]): The [monotonic][time.monotonic] time, in seconds, of each reading.
+        values (NDArray[np.float64]): The readings. The shape is `(n,)` if each reading is a scalar,
+            otherwise the shape is `(n, m)`, where `n` is the number of readings and `m` is the
+            number of values in each reading.
+    """
+
+    channel: str
+    timestamps: NDArray[np.float64]
+    values: NDArray[np.float64]
+
+
+class _Channel:
+    """The readings of a channel that have not been published yet."""
+
+    __slots__: tuple[str, ...] = ("reader", "timestamps", "topic", "values")
+
+    def __init__(self, name: str, reader: Callable[[], ArrayLike]) -> None:
+        if "\x00" in name:
+            msg = f"A channel name cannot contain a null character, got {name!r}"
+            raise ValueError(msg)
+        self.reader: Callable[[], ArrayLike] = reader
+        self.timestamps: list[float] = []
+        self.topic: bytes = name.encode()
+        self.values: list[NDArray[np.float64]] = []
+
+
+class TelemetryPublisher:
+    """Publish live readings to many consumers using the ZeroMQ PUB/SUB pattern."""
+
+    def __init__(
+        self,
+        channels: Mapping[str, Callable[[], ArrayLike]] | None = None,
+        *,
+        batch_size: int = 100,
+        conflate: bool = False,
+        host: str = "*",
+        hwm: int = 1000,
+        port: int = 0,
+        protocol: str = "tcp",
+    ) -> None:
+        """Publish live readings to many consumers using the ZeroMQ PUB/SUB pattern.
+
+        The readings of each channel are taken by calling a function (e.g., a method of a
+        connected device) and are batched together with the [monotonic][time.monotonic]
+        time of each reading. A batch is published as a compact binary frame that uses the
+        channel name as the topic, so one acquisition process can fan out the readings to any
+        number of [TelemetrySubscriber][msl.equipment.interfaces.telemetry.TelemetrySubscriber]s
+        (dashboards, loggers, control loops) without loading the equipment.
+
+        Publishing never blocks. If a subscriber is too slow to receive the batches, the
+        batches for that subscriber are dropped when the high-water mark is reached.
+
+        Args:
+            channels: The name of each channel and the function that returns a reading. A reading
+                must be a number or a sequence of numbers (that has the same length for every reading).
+            batch_size: The number of readings of a channel to publish in a batch.
+            conflate: Whether to only keep the most recent batch in the outgoing queue of each
+                subscriber. Conflation applies to the socket, not to a topic, so if enabled a
+                subscriber that falls behind only receives the most recent batch of *any* channel.
+                Use a separate publisher for each channel that must be conflated.
+            host: The network interface (IP address) to bind the publisher to. If `*`, the publisher
+                binds to all available network interfaces simultaneously.
+            hwm: The high-water mark, i.e., the maximum number of batches that are queued for
+                each subscriber.
+            port: The port to bind the publisher to. If `0`, binds the publisher to any available port.
+            protocol: The ZeroMQ protocol to use (`tcp`, `ipc`, `inproc`).
+
+        **Example:**
+        ```python
+        from msl.equipment.interfaces.telemetry import TelemetryPublisher
+
+        with TelemetryPublisher({"voltage": dmm.voltage, "temperature": probe.temperature}, port=5560) as pub:
+            pub.start(interval=0.1)
+            input("Press Enter to stop publishing...")
+        ```
+        """
+        if batch_size < 1:
+            msg = f"The batch size must be >= 1, got {batch_size}"
+            raise ValueError(msg)
+
+        self._batch_size: int = batch_size
+        self._channels: dict[str, _Channel] = {}
+        self._stop: Event = Event()
+        self._thread: Thread | None = None
+
+        self._context: Context[SyncSocket] = zmq.Context()
+        self._socket: SyncSocket = self._context.socket(zmq.PUB)
+
+        # socket options must be set before binding
+        self._socket.setsockopt(zmq.SNDHWM, hwm)
+        self._socket.setsockopt(zmq.LINGER, 0)
+        if conflate:
+            self._socket.setsockopt(zmq.CONFLATE, 1)
+
+        _ = self._socket.bind(f"{protocol}://{host}:{port or '*'}")
+
+        self.address: str = self._socket.getsockopt_string(zmq.LAST_ENDPOINT)
+        """[str][] &mdash; The ZeroMQ address that the publisher is bound to, i.e., `protocol://host:port`."""
+
+        self.port: int = int(self.address.rsplit(":", 1)[1]) if port <= 0 else port
+        """[int][] &mdash; The port number that the publisher is bound to."""
+
+        for name, reader in (channels or {}).items():
+            self.add_channel(name, reader)
+
+    def __enter__(self) -> TelemetryPublisher:  # noqa: PYI034
+        """Enter a context manager."""
+        return self
+
+    def __exit__(self, *ignore: object) -> None:
+        """Exit the context manager."""
+        self.close()
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"<{self.__class__.__name__} address={self.address!r} channels={len(self._channels)}>"
+
+    def _run(self, interval: float) -> None:
+        """Take readings at the requested interval until stopped."""
+        next_time = time.monotonic()
+        while True:
+            try:
+                self.sample()
+            except Exception:  # noqa: BLE001
+                # the background thread must not stop because of one failed batch
+                logger.exception("%s could not publish the readings", self.__class__.__name__)
+            next_time += interval
+            if self._stop.wait(max(0.0, next_time - time.monotonic())):
+                break
+
+    def _send(self, channel: _Channel) -> None:
+        """Publish the readings of a channel and clear the batch."""
+        if not channel.timestamps:
+            return
+        try:
+            frame = _pack(channel.topic, channel.timestamps, channel.values)
+        finally:
+            channel.timestamps.clear()
+            channel.values.clear()
+        _ = self._socket.send(frame, flags=zmq.NOBLOCK, copy=False)
+
+    def add_channel(self, name: str, reader: Callable[[], ArrayLike]) -> None:
+        """Add a channel to publish.
+
+        Args:
+            name: The name of the channel. The name is the topic that a subscriber subscribes to.
+            reader: The function that returns a reading.
+        """
+        if name in self._channels:
+            msg = f"A channel named {name!r} already exists"
+            raise ValueError(msg)
+        self._channels[name] = _Channel(name, reader)
+
+    @property
+    def channels(self) -> list[str]:
+        """Returns the names of the channels that are published."""
+        return list(self._channels)
+
+    def close(self) -> None:
+        """Stop taking readings, publish the readings that have not been published yet and close the socket."""
+        if self._socket.closed:
+            return
+        self.stop()
+        self.flush()
+        self._socket.close()
+        self._context.term()
+
+    def flush(self) -> None:
+        """Publish the readings that have not been published yet, even if a batch is not full."""
+        for channel in self._channels.values():
+            self._send(channel)
+
+    def publish(self, channel: str, timestamps: ArrayLike, values: ArrayLike) -> None:
+        """Publish readings that were acquired elsewhere (i.e., not by calling the reader of a channel).
+
+        Args:
+            channel: The name of the channel. The channel does not need to be added to the publisher.
+            timestamps: The time of each reading.
+            values: The readings.
+        """
+        _ = self._socket.send(_pack(channel.encode(), timestamps, values), flags=zmq.NOBLOCK, copy=False)
+
+    def sample(self) -> None:
+        """Take one reading of each channel and publish the batches that are full.
+
+        If a reader raises an exception, or returns a reading that is not a number or a sequence of
+        numbers that has the same length as the other readings in the batch, the error is logged and
+        the reading is skipped.
+
+        !!! note
+            ZeroMQ sockets are not thread safe. Do not call this method while the publisher
+            is taking readings in a background thread, see [start][..start].
+        """
+        for name, channel in self._channels.items():
+            try:
+                value = np.asarray(channel.reader(), dtype="<f8")
+            except Exception:  # noqa: BLE001
+                logger.exception("%s could not read channel %r", self.__class__.__name__, name)
+                continue
+
+            expected = channel.values[0].shape if channel.values else value.shape
+            if value.ndim > 1 or value.shape != expected:
+                logger.error(
+                    "%s skipped a reading of channel %r with shape %s, expected shape %s",
+                    self.__class__.__name__,
+                    name,
+                    value.shape,
+                    expected if value.ndim <= 1 else "() or (m,)",
+                )
+                continue
+
+            channel.timestamps.append(time.monotonic())
+            channel.values.append(value)
+            if len(channel.timestamps) >= self._batch_size:
+                self._send(channel)
+
+    def start(self, interval: float) -> None:
+        """Start taking readings of every channel in a background thread.
+
+        Args:
+            interval: The number of seconds between readings.
+        """
+        if self._thread is not None:
+            msg = f"{self.__class__.__name__} has already been started"
+            raise RuntimeError(msg)
+        self._stop.clear()
+        self._thread = Thread(target=self._run, args=(interval,), daemon=True, name=self.__class__.__name__)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop taking readings in the background thread.
+
+        The readings that have not been published yet remain in the batches, see [flush][..flush].
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+
+class TelemetrySubscriber:
+    """Receive the readings that a telemetry publisher publishes."""
+
+    def __init__(
+        self,
+        address: str,
+        channels: str | Iterable[str] | None = None,
+        *,
+        conflate: bool = False,
+        hwm: int = 1000,
+        timeout: float | None = None,
+    ) -> None:
+        """Receive the readings that a telemetry publisher publishes.
+
+        The readings are published by a [TelemetryPublisher][msl.equipment.interfaces.telemetry.TelemetryPublisher].
+
+        Args:
+            address: The ZeroMQ address of the publisher, e.g., `tcp://192.168.1.100:5560`.
+            channels: The name(s) of the channel(s) to subscribe to. If not specified,
+                subscribes to all channels.
+            conflate: Whether to only keep the most recent batch in the incoming queue.
+            hwm: The high-water mark, i.e., the maximum number of batches that are queued
+                before batches are dropped.
+            timeout: The maximum number of seconds to wait to receive a batch. If `None`, wait forever.
+
+        **Example:**
+        ```python
+        from msl.equipment.interfaces.telemetry import TelemetrySubscriber
+
+        with TelemetrySubscriber("tcp://192.168.1.100:5560", "voltage") as sub:
+            for batch in sub:
+                print(batch.channel, batch.timestamps[-1], batch.values.mean())
+        ```
+        """
+        self._context: Context[SyncSocket] = zmq.Context()
+        self._socket: SyncSocket = self._context.socket(zmq.SUB)
+        self._socket.setsockopt(zmq.RCVHWM, hwm)
+        self._socket.setsockopt(zmq.LINGER, 0)
+        self._timeout: float | None = timeout
+        self._socket.setsockopt(zmq.RCVTIMEO, -1 if timeout is None else int(timeout * 1000))
+        if conflate:
+            self._socket.setsockopt(zmq.CONFLATE, 1)
+
+        if channels is None:
+            self._socket.setsockopt(zmq.SUBSCRIBE, b"")
+        else:
+            for channel in [channels] if isinstance(channels, str) else channels:
+                # the null terminator prevents a subscription to "temp" from matching "temperature"
+                self._socket.setsockopt(zmq.SUBSCRIBE, channel.encode() + b"\x00")
+
+        _ = self._socket.connect(address)
+
+        self.address: str = address
+        """[str][] &mdash; The ZeroMQ address of the publisher."""
+
+    def __enter__(self) -> TelemetrySubscriber:  # noqa: PYI034
+        """Enter a context manager."""
+        return self
+
+    def __exit__(self, *ignore: object) -> None:
+        """Exit the context manager."""
+        self.close()
+
+    def __iter__(self) -> Iterator[TelemetryBatch]:
+        """Receive batches forever (or until the timeout is exceeded)."""
+        while True:
+            yield self.receive()
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"<{self.__class__.__name__} address={self.address!r}>"
+
+    def close(self) -> None:
+        """Close the socket."""
+        if not self._socket.closed:
+            self._socket.close()
+            self._context.term()
+
+    def receive(self) -> TelemetryBatch:
+        """Receive the next batch of readings.
+
+        The arrays are views of the received frame, so the data is not copied.
+
+        Returns:
+            The batch of readings.
+        """
+        try:
+            frame = self._socket.recv(copy=False)
+        except zmq.Again:
+            msg = f"No telemetry received from {self.address!r} after {self._timeout} seconds"
+            raise TimeoutError(msg) from None
+        return unpack_telemetry(frame.buffer)
+
+
+def _pack(topic: bytes, timestamps: ArrayLike, values: ArrayLike | list[ArrayLike]) -> bytes:
+    """Pack a batch of readings into a frame: topic, null character, header, timestamps, values."""
+    t = np.asarray(timestamps, dtype="<f8")
+    v = np.asarray(values, dtype="<f8")
+    if t.ndim != 1 or v.ndim not in (1, 2) or len(v) != len(t):
+        msg = f"Invalid shapes for the telemetry timestamps {t.shape} and values {v.shape}"
+        raise ValueError(msg)
+    header = _HEADER.pack(len(t), 0 if v.ndim == 1 else v.shape[1])
+    return b"".join((topic, b"\x00", header, t.tobytes(), v.tobytes()))
+
+
+def unpack_telemetry(frame: bytes | memoryview) -> TelemetryBatch:
+    """Unpack a frame that a [TelemetryPublisher][msl.equipment.interfaces.telemetry.TelemetryPublisher] published.
+
+    Useful if the frame was received by a [SUB][zmq.SocketType.SUB] socket that is not a
+    [TelemetrySubscriber][msl.equipment.interfaces.telemetry.TelemetrySubscriber], e.g., an
+    [asyncio socket][zmq.asyncio.Socket]. The data is not copied.
+
+    Args:
+        frame: The received frame.
+
+    Returns:
+        The batch of readings.
+    """
+    view = memoryview(frame)
+
+    # only copy the bytes at the start of the frame to find the end of the channel name
+    size = 64
+    while (end := bytes(view[:size]).find(b"\x00")) == -1:
+        if size >= len(view):
+            msg = "Invalid telemetry frame, the channel name is not null terminated"
+            raise ValueError(msg)
+        size *= 4
+
+    channel = bytes(view[:end]).decode()
+    offset = end + 1
+    n, m = _HEADER.unpack_from(view, offset)
+    offset += _HEADER.size
+    timestamps: NDArray[Any] = np.frombuffer(view, dtype="<f8", count=n, offset=offset)
+    offset += timestamps.nbytes
+    values: NDArray[Any] = np.frombuffer(view, dtype="<f8", count=n * max(m, 1), offset=offset)
+    if m > 0:
+        values = values.reshape(n, m)
+    return TelemetryBatch(channel=channel, timestamps=timestamps, values=values)
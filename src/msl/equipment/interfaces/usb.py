@@ -8,17 +8,17 @@ import contextlib
 import os
 import re
 import sys
-import time
 from dataclasses import dataclass
 from enum import IntEnum
 from itertools import combinations
+from threading import Event, Thread
 from typing import TYPE_CHECKING, overload
 
 import usb  # type: ignore[import-untyped]  # pyright: ignore[reportMissingTypeStubs]
 
 from msl.equipment.utils import logger
 
-from .message import Message, MSLConnectionError, MSLTimeoutError
+from .message import Deadline, Message, MSLConnectionError, MSLTimeoutError
 
 if TYPE_CHECKING:
     from array import array
@@ -36,6 +36,8 @@ REGEX = re.compile(
 IS_WINDOWS = sys.platform == "win32"
 UNKNOWN_USB_DEVICE = "Unknown USB Device"
 
+_STREAM_POLL_TIMEOUT = 100  # milliseconds
+
 
 def _is_linux_and_not_sudo() -> bool:
     return sys.platform == "linux" and os.geteuid() != 0
@@ -248,6 +250,160 @@ def _endpoint(cls: USB, interface: Any, direction: int, typ: int) -> Endpoint |
     )
 
 
+class USBStreamReader:
+    """Continuously reads from the bulk-IN endpoint of a USB device into a ring buffer.
+
+    Do not instantiate this class directly, call [start_streaming][msl.equipment.interfaces.usb.USB.start_streaming]
+    to create a reader.
+
+    A background thread repeatedly submits a synchronous bulk-IN transfer (of `transfer_size` bytes) and,
+    after each transfer completes, copies the data into a fixed-size ring buffer before it submits the next
+    transfer. Only one transfer is submitted at a time, so no transfer is pending on the endpoint while the
+    data is copied (the device must buffer any data that it produces during that time). The thread is the
+    only writer and the consumer is the only reader of the ring buffer, so neither side needs to acquire a
+    lock to move data.
+    """
+
+    def __init__(self, device: USB, *, capacity: int, transfer_size: int) -> None:
+        """Continuously reads from the bulk-IN endpoint of a USB device into a ring buffer.
+
+        Args:
+            device: The USB device to read from.
+            capacity: The size, in bytes, of the ring buffer.
+            transfer_size: The number of bytes to request in each bulk-IN transfer.
+        """
+        if capacity < transfer_size:
+            msg = f"The ring buffer capacity [{capacity}] must be >= the transfer size [{transfer_size}]"
+            raise ValueError(msg)
+
+        self._device: USB = device
+        self._capacity: int = capacity
+        self._transfer_size: int = transfer_size
+        self._ring: bytearray = bytearray(capacity)
+        self._view: memoryview = memoryview(self._ring)
+        self._head: int = 0  # total number of bytes written by the reader thread
+        self._tail: int = 0  # total number of bytes consumed
+        self._error: str = ""
+        self._ready: Event = Event()
+        self._stop: Event = Event()
+        self._thread: Thread = Thread(target=self._worker, name=f"{device}-stream", daemon=True)
+        self._thread.start()
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"<{self.__class__.__name__} available={self.available} capacity={self._capacity}>"
+
+    def _take(self, size: int) -> bytes:
+        """Remove `size` bytes from the ring buffer (the caller guarantees that `size` bytes are available)."""
+        start = self._tail % self._capacity
+        end = start + size
+        if end <= self._capacity:
+            data = self._view[start:end].tobytes()
+        else:
+            data = self._view[start:].tobytes() + self._view[: end - self._capacity].tobytes()
+        self._tail += size
+        return data
+
+    def _wait(self, size: int, timeout: float | None) -> None:
+        """Wait until at least `size` bytes are available in the ring buffer."""
+        deadline = Deadline(timeout)
+        while self.available < size:
+            if self._error:
+                raise MSLConnectionError(self._device, self._error)
+            if not self._thread.is_alive():
+                raise MSLConnectionError(self._device, "The USB stream has stopped")
+
+            # clear before checking again, the reader thread sets the event after every transfer
+            self._ready.clear()
+            if self.available >= size:
+                break
+
+            if deadline.expired:
+                raise MSLTimeoutError(self._device)
+            _ = self._ready.wait(deadline.remaining())
+
+    def _worker(self) -> None:
+        """Runs in the background thread to read packets and append them to the ring buffer."""
+        read = self._device._device.read  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        address = self._device._bulk_in.address  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        buffer: array[int] = usb.util.create_buffer(self._transfer_size)
+        packet = memoryview(buffer)
+        capacity = self._capacity
+        ring = self._view
+        while not self._stop.is_set():
+            try:
+                # use a finite timeout so that the stop flag is checked periodically
+                transferred: int = read(address, buffer, _STREAM_POLL_TIMEOUT)
+            except usb.core.USBTimeoutError:
+                continue
+            except usb.core.USBError as e:
+                self._error = f"The USB stream stopped, {e}"
+                break
+
+            if transferred == 0:
+                continue
+
+            if capacity - (self._head - self._tail) < transferred:
+                self._error = (
+                    f"The USB stream ring buffer overflowed, the consumer must drain the data "
+                    f"faster or the capacity [{capacity}] must be increased"
+                )
+                break
+
+            start = self._head % capacity
+            first = min(transferred, capacity - start)
+            ring[start : start + first] = packet[:first]
+            if first < transferred:
+                ring[: transferred - first] = packet[first:transferred]
+            self._head += transferred
+            self._ready.set()
+
+        if self._error:
+            logger.error("%s %s", self._device, self._error)
+        self._ready.set()
+
+    @property
+    def available(self) -> int:
+        """The number of bytes that are in the ring buffer and can be read without waiting."""
+        return self._head - self._tail
+
+    @property
+    def capacity(self) -> int:
+        """The size, in bytes, of the ring buffer."""
+        return self._capacity
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is reading from the bulk-IN endpoint."""
+        return self._thread.is_alive()
+
+    def read(self, size: int | None = None, *, timeout: float | None = None) -> bytes:
+        """Drain data from the ring buffer.
+
+        If the background thread stopped because of an error, the data that is still in the ring buffer
+        may be read before an [MSLConnectionError][msl.equipment.interfaces.message.MSLConnectionError]
+        is raised.
+
+        Args:
+            size: The number of bytes to read. If `None`, wait for at least one byte and then
+                return all bytes that are available.
+            timeout: The maximum number of seconds to wait for the data. If `None`, uses the
+                [timeout][msl.equipment.interfaces.message.Message.timeout] of the USB device.
+
+        Returns:
+            The bytes that were read.
+        """
+        if timeout is None:
+            timeout = self._device.timeout
+        self._wait(1 if size is None else size, timeout)
+        return self._take(self.available if size is None else size)
+
+    def stop(self) -> None:
+        """Stop the background thread that reads from the bulk-IN endpoint."""
+        self._stop.set()
+        self._thread.join()
+
+
 class USB(Message, regex=REGEX):
     """Base class for (raw) USB communication."""
 
@@ -311,6 +467,7 @@ class USB(Message, regex=REGEX):
         self._interface_number: int = 0
         self._timeout_ms: int = 0
         self._byte_buffer: bytearray = bytearray()
+        self._stream: USBStreamReader | None = None
         super().__init__(equipment)
 
         assert equipment.connection is not None  # noqa: S101
@@ -395,13 +552,13 @@ class USB(Message, regex=REGEX):
 
     def _read(self, size: int | None) -> bytes:  # pyright: ignore[reportImplicitOverride]
         """Overrides method in `Message`."""
-        original_timeout = self._timeout_ms
-        timeout = original_timeout
+        timeout = self._timeout_ms
         address = self._bulk_in.address
         buffer: array[int] = usb.util.create_buffer(self._buffer_size)
         termination = self._read_termination
         read = self._device.read
-        t0 = time.time()
+        stream = self._stream
+        deadline = Deadline(timeout / 1000 if timeout > 0 else None)  # libusb considers 0 as no timeout
         while True:
             if size is not None:
                 if len(self._byte_buffer) >= size:
@@ -417,21 +574,22 @@ class USB(Message, regex=REGEX):
                     self._byte_buffer = self._byte_buffer[index:]
                     break
 
-            transferred: int = read(address, buffer, timeout)
-            self._byte_buffer.extend(buffer[:transferred])
+            if stream is None:
+                transferred: int = read(address, buffer, timeout)
+                self._byte_buffer.extend(buffer[:transferred])
+            else:
+                self._byte_buffer.extend(stream.read(timeout=deadline.remaining()))
 
             if len(self._byte_buffer) > self._max_read_size:
                 error = f"len(message) [{len(self._byte_buffer)}] > max_read_size [{self._max_read_size}]"
                 raise RuntimeError(error)
 
-            if original_timeout > 0:
+            if deadline.timeout is not None:
                 # decrease the timeout when reading each packet so that the total
                 # time to receive all packets preserves what was specified
-                elapsed_time = int((time.time() - t0) * 1000)
-                if elapsed_time >= original_timeout:
+                if deadline.expired:
                     raise MSLTimeoutError(self)
-                # use at least 1 ms, since libusb considers 0 as no timeout
-                timeout = max(1, original_timeout - elapsed_time)
+                timeout = deadline.remaining_ms()
 
         return bytes(msg)
 
@@ -443,13 +601,12 @@ class USB(Message, regex=REGEX):
     def _write(self, message: bytes) -> int:  # pyright: ignore[reportImplicitOverride]
         """Overrides method in `Message`."""
         address = self._bulk_out.address
-        original_timeout = self._timeout_ms
-        timeout = original_timeout
+        timeout = self._timeout_ms
         write = self._device.write
         wrote: int = 0
         size = len(message)
         view = memoryview(message)
-        t0 = time.time()
+        deadline = Deadline(timeout / 1000 if timeout > 0 else None)  # libusb considers 0 as no timeout
         while True:
             # PyUSB should handle packet fragmentation automatically
             # https://github.com/pyusb/pyusb/discussions/427
@@ -457,14 +614,12 @@ class USB(Message, regex=REGEX):
             if wrote >= size:
                 break
 
-            if original_timeout > 0:
+            if deadline.timeout is not None:
                 # decrease the timeout when writing each packet so that the total
                 # time to write all packets preserves what was specified
-                elapsed_time = int((time.time() - t0) * 1000)
-                if elapsed_time >= original_timeout:
+                if deadline.expired:
                     raise MSLTimeoutError(self)
-                # use at least 1 ms, since libusb considers 0 as no timeout
-                timeout = max(1, original_timeout - elapsed_time)
+                timeout = deadline.remaining_ms()
 
         return wrote
 
@@ -602,6 +757,8 @@ class USB(Message, regex=REGEX):
         if not hasattr(self, "_device") or self._device is None:
             return None
 
+        self.stop_streaming()
+
         if self._detached:
             with contextlib.suppress(usb.core.USBError):
                 self._device.attach_kernel_driver(self._interface_number)
@@ -631,6 +788,55 @@ class USB(Message, regex=REGEX):
         logger.debug("%s.reset_device()", self)
         self._device.reset()
 
+    def start_streaming(self, *, capacity: int = 4_194_304, transfer_size: int | None = None) -> USBStreamReader:
+        """Start continuously reading from the bulk-IN endpoint.
+
+        A background thread reads from the endpoint, one synchronous bulk-IN transfer after another, so
+        the endpoint is read independently of calls to [read][msl.equipment.interfaces.message.Message.read],
+        which helps prevent the FIFO of a high-rate device (e.g., a data acquisition card or a spectrometer)
+        from overflowing. There is a short gap between transfers, while the data of the completed transfer
+        is copied into the ring buffer, during which no transfer is pending on the endpoint. While
+        streaming, [read][msl.equipment.interfaces.message.Message.read] consumes data from the ring
+        buffer of the returned reader and large chunks may be drained directly by calling
+        [USBStreamReader.read][msl.equipment.interfaces.usb.USBStreamReader.read].
+
+        Args:
+            capacity: The size, in bytes, of the ring buffer.
+            transfer_size: The number of bytes to request in each bulk-IN transfer. Requesting many packets
+                per transfer allows the USB host controller to queue the packets back to back. If `None`,
+                uses the larger of 16384 and the `buffer_size`, rounded up to a multiple of `wMaxPacketSize`.
+
+        Returns:
+            The reader that is streaming data. If streaming has already started, the existing reader is returned.
+        """
+        if self._stream is not None and self._stream.running:
+            return self._stream
+
+        if transfer_size is None:
+            mps = max(1, self._bulk_in.max_packet_size)
+            transfer_size = -(-max(16384, self._buffer_size) // mps) * mps
+
+        logger.debug("%s.start_streaming(capacity=%d, transfer_size=%d)", self, capacity, transfer_size)
+        self._stream = USBStreamReader(self, capacity=capacity, transfer_size=transfer_size)
+        return self._stream
+
+    def stop_streaming(self) -> None:
+        """Stop continuously reading from the bulk-IN endpoint.
+
+        Any data that is still in the ring buffer is discarded.
+        """
+        if self._stream is None:
+            return
+
+        logger.debug("%s.stop_streaming()", self)
+        self._stream.stop()
+        self._stream = None
+
+    @property
+    def stream(self) -> USBStreamReader | None:
+        """The reader that is continuously reading from the bulk-IN endpoint, if streaming has started."""
+        return self._stream
+
 
 @dataclass
 class ParsedUSBAddress:
@@ -18,17 +18,23 @@ from __future__ import annotations
 import contextlib
 import re
 import struct
+from array import array
+from threading import Condition, Thread
 from time import sleep
 from typing import TYPE_CHECKING
 
+from usb.core import (  # type: ignore[import-untyped]  # pyright: ignore[reportMissingTypeStubs]
+    USBTimeoutError,  # pyright: ignore[reportUnknownVariableType]
+)
+
 from msl.equipment.enumerations import RENMode
 from msl.equipment.utils import logger, to_enum
 
-from .message import MSLConnectionError
+from .message import MSLConnectionError, MSLTimeoutError
 from .usb import USB
 
 if TYPE_CHECKING:
-    from array import array
+    from typing import Callable
 
     from msl.equipment.schema import Equipment
 
@@ -38,6 +44,33 @@ REGEX = re.compile(
     flags=re.IGNORECASE,
 )
 
+_INTR_POLL_TIMEOUT = 100  # milliseconds
+
+# USBTMC_1_00.pdf, Section 3.3.1.1, Table 9: MsgID, bTag, TransferSize, bmTransferAttributes
+_HEADER = struct.Struct("<BBxxLBxxx")
+
+
+def _definite_length(message: bytes | bytearray) -> int | None:
+    """Returns the total length of a message that contains an IEEE-488.2 definite-length block.
+
+    Only the start of the message is searched for the # character (a response header may precede it).
+    Returns `None` if the length is not known.
+    """
+    offset = message.find(b"#", 0, 64)
+    if offset == -1:
+        return None
+
+    # Section 8.7.9, IEEE 488.2-1992, <DEFINITE LENGTH ARBITRARY BLOCK RESPONSE DATA>
+    try:
+        len_nbytes = int(message[offset + 1 : offset + 2])
+        nbytes = int(message[offset + 2 : offset + 2 + len_nbytes])
+    except ValueError:
+        return None
+
+    if len_nbytes == 0 or len(message) < offset + 2 + len_nbytes:  # indefinite length or incomplete
+        return None
+    return offset + 2 + len_nbytes + nbytes
+
 
 class _Message:
     """Prepare Bulk IN/OUT messages."""
@@ -179,6 +212,171 @@ class Capabilities:
         )
 
 
+def _call_srq_callback(device: USBTMC, callback: Callable[[int], None], status: int) -> None:
+    """Call a service-request callback, an exception does not stop the background thread."""
+    try:
+        callback(status)
+    except Exception as e:  # noqa: BLE001
+        logger.debug("%r SRQ callback %s: %s", device, e.__class__.__name__, e)
+
+
+class USBTMCInterruptListener:
+    """Listens for USB488 notifications on the Interrupt-IN endpoint of a USBTMC device."""
+
+    def __init__(self, device: USBTMC) -> None:
+        """Listens for USB488 notifications on the Interrupt-IN endpoint of a USBTMC device.
+
+        A background thread reads the Interrupt-IN endpoint and decodes the notification packets
+        (USBTMC-USB488, Section 3.4). A service-request notification (`bNotify1` is `0x81`) calls the
+        registered callbacks and wakes any thread that is waiting in
+        [wait_for_srq][msl.equipment.interfaces.usbtmc.USBTMCInterruptListener.wait_for_srq].
+        A READ_STATUS_BYTE response (`bNotify1` is `0x80` plus the `bTag` of the request) is handed to
+        [serial_poll][msl.equipment.interfaces.usbtmc.USBTMC.serial_poll]. Neither requires busy
+        polling or additional control transfers.
+
+        You do not need to create an instance of this class, use
+        [add_srq_callback][msl.equipment.interfaces.usbtmc.USBTMC.add_srq_callback] or
+        [wait_for_srq][msl.equipment.interfaces.usbtmc.USBTMC.wait_for_srq].
+
+        Args:
+            device: The USBTMC device to listen to.
+        """
+        if device.intr_in_endpoint is None:
+            msg = "The USBTMC device does not have an Interrupt-IN endpoint"
+            raise MSLConnectionError(device, msg)
+
+        self._device: USBTMC = device
+        self._address: int = device.intr_in_endpoint.address
+        self._packet_size: int = max(2, device.intr_in_endpoint.max_packet_size)
+        self._callbacks: list[Callable[[int], None]] = []
+        self._condition: Condition = Condition()
+        self._responses: dict[int, int] = {}  # bTag -> status byte
+        self._srq: int | None = None  # status byte of the latest, unconsumed, service request
+        self._error: str = ""
+        self._stop: bool = False
+        self._thread: Thread = Thread(target=self._worker, name=f"{device}-interrupt", daemon=True)
+        self._thread.start()
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Returns the string representation."""
+        return f"<{self.__class__.__name__} callbacks={len(self._callbacks)} running={self.running}>"
+
+    def _notify(self, notify1: int, notify2: int) -> None:
+        """Decode a notification packet (USBTMC_usb488_subclass_1_00.pdf: Section 3.4.2, Table 7)."""
+        if not notify1 & 0x80:
+            logger.debug("%s ignored Interrupt-IN packet [bNotify1=0x%02X]", self._device, notify1)
+            return
+
+        tag = notify1 & 0x7F
+        with self._condition:
+            if tag == 1:  # SRQ notification
+                self._srq = notify2
+                callbacks = list(self._callbacks)
+            else:  # READ_STATUS_BYTE response
+                self._responses[tag] = notify2
+                callbacks = []
+            self._condition.notify_all()
+
+        for callback in callbacks:
+            _call_srq_callback(self._device, callback, notify2)
+
+    def _wait(self, predicate: Callable[[], bool], timeout: float | None) -> None:
+        """Wait for the predicate to be true, must be called while the condition is acquired."""
+        if not self._condition.wait_for(lambda: predicate() or self._error != "", timeout=timeout):
+            raise MSLTimeoutError(self._device)
+        if not predicate():
+            raise MSLConnectionError(self._device, self._error)
+
+    def _worker(self) -> None:
+        """Runs in the background thread to read the Interrupt-IN endpoint."""
+        read = self._device._device.read  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        while not self._stop:
+            try:
+                # use a finite timeout so that the stop flag is checked periodically
+                data = read(self._address, self._packet_size, _INTR_POLL_TIMEOUT)
+            except USBTimeoutError:
+                continue
+            except OSError as e:
+                with self._condition:
+                    self._error = f"The Interrupt-IN listener stopped, {e}"
+                    self._condition.notify_all()
+                logger.error("%s %s", self._device, self._error)
+                return
+
+            if len(data) >= 2:  # noqa: PLR2004
+                self._notify(data[0], data[1])
+
+    def add_callback(self, callback: Callable[[int], None]) -> None:
+        """Add a callback that is called when the device requests service.
+
+        Args:
+            callback: A callable that accepts the status byte of the device. The callback
+                is called from the background thread.
+        """
+        with self._condition:
+            self._callbacks.append(callback)
+
+    @property
+    def callbacks(self) -> list[Callable[[int], None]]:
+        """Returns the callbacks that are called when the device requests service."""
+        with self._condition:
+            return list(self._callbacks)
+
+    def remove_callback(self, callback: Callable[[int], None] | None = None) -> None:
+        """Remove a callback.
+
+        Args:
+            callback: The callback to remove. If `None`, remove all callbacks.
+        """
+        with self._condition:
+            if callback is None:
+                self._callbacks.clear()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._callbacks.remove(callback)
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is reading the Interrupt-IN endpoint."""
+        return self._thread.is_alive()
+
+    def status_byte(self, tag: int, timeout: float | None = None) -> int:
+        """Wait for the response to a READ_STATUS_BYTE request.
+
+        Args:
+            tag: The `bTag` value of the READ_STATUS_BYTE request.
+            timeout: The maximum number of seconds to wait. If `None`, wait forever.
+
+        Returns:
+            The status byte.
+        """
+        with self._condition:
+            self._wait(lambda: tag in self._responses, timeout)
+            return self._responses.pop(tag)
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop = True
+        self._thread.join()
+
+    def wait_for_srq(self, timeout: float | None = None) -> int:
+        """Wait for a service request.
+
+        A service request that was received, but not yet waited for, is returned immediately.
+
+        Args:
+            timeout: The maximum number of seconds to wait. If `None`, wait forever.
+
+        Returns:
+            The status byte that was sent with the service request.
+        """
+        with self._condition:
+            self._wait(lambda: self._srq is not None, timeout)
+            status, self._srq = self._srq, None
+            assert status is not None  # noqa: S101
+            return status
+
+
 class USBTMC(USB, regex=REGEX):
     """Base class for the USBTMC communication protocol."""
 
@@ -191,8 +389,10 @@ class USBTMC(USB, regex=REGEX):
         A [Connection][msl.equipment.schema.Connection] instance supports the same _properties_
         as those specified in [USB][msl.equipment.interfaces.usb.USB].
         """
+        self._listener: USBTMCInterruptListener | None = None
         super().__init__(equipment)
         self._tag_status: int = 1  # bTag for READ_STATUS_BYTE control transfer
+        self._transfer_buffer: array[int] = array("B")
         self._msg: _Message = _Message()
 
         # USBTMC_1_00.pdf: Section 4.2.1.8, Table 36
@@ -288,11 +488,11 @@ class USBTMC(USB, regex=REGEX):
             msg = "The USBTMC device does not accept a read request"
             raise MSLConnectionError(self, msg)
 
-        read = super()._read
         write = super()._write
 
         message = bytearray()
         msg_in_size = size or self._buffer_size
+        expected = size
 
         try:
             # USBTMC_1_00.pdf, Section 3.3
@@ -307,19 +507,7 @@ class USBTMC(USB, regex=REGEX):
                 # Send the REQUEST_DEV_DEP_MSG_IN USBTMC command message
                 _ = write(self._msg.request_dev_dep_msg_in(msg_in_size))
 
-                # USBTMC_1_00.pdf, Section 3.3.1.1, Table 9
-                # Parse Bulk-IN header, ignore bTagInverse (only check bTag)
-                msg_id, tag, transfer_size, attributes = struct.unpack("<BBxxLBxxx", read(12))
-
-                if msg_id != 2 or tag != self._msg.tag:  # Table 2, DEV_DEP_MSG_IN=2  # noqa: PLR2004
-                    msg = "Unexpected USBTMC response header"
-                    if msg_id != 2:  # noqa: PLR2004
-                        msg += f", wrong DEV_DEP_MSG_IN value {msg_id} (expect 2)"
-                    if tag != self._msg.tag:
-                        msg += f", received bTag [{tag}] != sent bTag [{self._msg.tag}]"
-                    raise MSLConnectionError(self, msg)
-
-                message.extend(read(transfer_size))
+                attributes, data = self._read_transfer(msg_in_size)
                 if attributes & 1:  # EOM condition satisfied?
                     # USBTMC_1_00.pdf
                     # Section 3.3, Rule 10 states:
@@ -328,15 +516,67 @@ class USBTMC(USB, regex=REGEX):
                     #   This does not include the number of bytes in this header or alignment bytes.
                     # Therefore, the buffer "may" have alignment bytes to discard
                     self._byte_buffer.clear()
+                    if message:
+                        message.extend(data)
+                        data = bytes(message)
+
                     if size is not None:
                         # Must read the full Bulk-IN USBTMC response message (so the USB device is happy)
                         # but only return the requested size
-                        return bytes(message[:size])
-                    return bytes(message)
+                        return data[:size]
+                    return data
+
+                message.extend(data)
+
+                # If the size of the message is known, request the remainder in a single transfer
+                # (e.g., a multi-megabyte trace that is an IEEE-488.2 definite-length block)
+                if expected is None:
+                    expected = _definite_length(message)
+                if expected is not None:
+                    # +1 for a trailing termination character
+                    msg_in_size = max(self._buffer_size, expected - len(message) + 1)
         except OSError:
             self._abort_transfer(USB.CtrlDirection.IN)
             raise
 
+    def _read_transfer(self, msg_in_size: int) -> tuple[int, bytes]:
+        """Read a Bulk-IN transfer and return the bmTransferAttributes and the message data bytes."""
+        # USBTMC_1_00.pdf, Section 3.3.1.1, Table 9
+        # Read the 12-byte header, the message data bytes and up to 3 alignment bytes in a single
+        # transfer into a preallocated buffer. The header and the alignment bytes are removed by
+        # slicing a memoryview of the buffer so only the message data bytes are copied.
+        mps = self.bulk_in_endpoint.max_packet_size
+        n = -(-(12 + msg_in_size + 3) // mps) * mps
+        if len(self._transfer_buffer) < n:
+            self._transfer_buffer = array("B", bytes(n))
+
+        buffer = self._transfer_buffer
+        transferred: int = self._device.read(self.bulk_in_endpoint.address, buffer, self._timeout_ms)
+        with memoryview(buffer) as view:
+            if transferred >= 12:  # noqa: PLR2004
+                msg_id, tag, transfer_size, attributes = _HEADER.unpack_from(view)
+                if 12 + transfer_size <= transferred:
+                    self._check_header(msg_id, tag)
+                    return attributes, view[12 : 12 + transfer_size].tobytes()
+
+            # The device sent the Bulk-IN message using multiple transfers, USB._read gets the remainder
+            self._byte_buffer.extend(view[:transferred])
+
+        read = super()._read
+        msg_id, tag, transfer_size, attributes = _HEADER.unpack(read(12))
+        self._check_header(msg_id, tag)
+        return attributes, read(transfer_size)
+
+    def _check_header(self, msg_id: int, tag: int) -> None:
+        """Check the MsgID and bTag values of a Bulk-IN header, ignore bTagInverse."""
+        if msg_id != 2 or tag != self._msg.tag:  # Table 2, DEV_DEP_MSG_IN=2  # noqa: PLR2004
+            msg = "Unexpected USBTMC response header"
+            if msg_id != 2:  # noqa: PLR2004
+                msg += f", wrong DEV_DEP_MSG_IN value {msg_id} (expect 2)"
+            if tag != self._msg.tag:
+                msg += f", received bTag [{tag}] != sent bTag [{self._msg.tag}]"
+            raise MSLConnectionError(self, msg)
+
     def _write(self, message: bytes) -> int:  # pyright: ignore[reportImplicitOverride]
         """Overrides method in USB."""
         if self._capabilities.is_talk_only:
@@ -461,11 +701,45 @@ class USBTMC(USB, regex=REGEX):
                 )
             )
 
+    def _interrupt_listener(self) -> USBTMCInterruptListener:
+        """Returns the Interrupt-IN listener, starting it if necessary."""
+        if not self._capabilities.is_488_interface:
+            msg = "The USBTMC device is not a USB488 interface"
+            raise MSLConnectionError(self, msg)
+
+        if self._listener is None or not self._listener.running:
+            logger.debug("%s starting the Interrupt-IN listener", self)
+            self._listener = USBTMCInterruptListener(self)
+        return self._listener
+
+    def add_srq_callback(self, callback: Callable[[int], None]) -> None:
+        """Add a callback that is called when the device requests service.
+
+        The Interrupt-IN endpoint is read in a background thread and the callback is called from that
+        thread when a USB488 SRQ notification packet is received, so waiting for an operation to complete
+        (e.g., `*OPC` with the service-request enable register configured) does not require polling.
+
+        !!! note "See Also"
+            [remove_srq_callback][msl.equipment.interfaces.usbtmc.USBTMC.remove_srq_callback]
+
+        Args:
+            callback: A callable that accepts the status byte of the device.
+        """
+        self._interrupt_listener().add_callback(callback)
+
     @property
     def capabilities(self) -> Capabilities:
         """Returns the [Capabilities][msl.equipment.interfaces.usbtmc.Capabilities] of the USBTMC device."""
         return self._capabilities
 
+    def disconnect(self) -> None:  # pyright: ignore[reportImplicitOverride]
+        """Disconnect from the USBTMC device."""
+        if getattr(self, "_listener", None) is not None:
+            assert self._listener is not None  # noqa: S101
+            self._listener.stop()
+            self._listener = None
+        super().disconnect()
+
     def indicator_pulse(self) -> None:
         """Request to turn on an activity indicator for identification purposes.
 
@@ -488,6 +762,18 @@ class USBTMC(USB, regex=REGEX):
             )
         )
 
+    def remove_srq_callback(self, callback: Callable[[int], None] | None = None) -> None:
+        """Remove a service-request callback.
+
+        The callback must have been added by
+        [add_srq_callback][msl.equipment.interfaces.usbtmc.USBTMC.add_srq_callback].
+
+        Args:
+            callback: The callback to remove. If `None`, remove all callbacks.
+        """
+        if self._listener is not None:
+            self._listener.remove_callback(callback)
+
     def serial_poll(self) -> int:
         """Read status byte / serial poll.
 
@@ -504,6 +790,11 @@ class USBTMC(USB, regex=REGEX):
         if self._tag_status > 127:  # noqa: PLR2004
             self._tag_status = 2
 
+        listener = self._listener
+        if listener is not None:
+            with listener._condition:  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+                _ = listener._responses.pop(self._tag_status, None)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
         # USBTMC_usb488_subclass_1_00.pdf: Section 4.3.1, Table 11
         _, tag, data = self._check_ctrl_in_status(
             self.ctrl_transfer(
@@ -523,6 +814,10 @@ class USBTMC(USB, regex=REGEX):
         if self.intr_in_endpoint is None:
             return data
 
+        if listener is not None and listener.running:
+            # the response is read from the Interrupt-IN endpoint by the listener
+            return listener.status_byte(self._tag_status, timeout=self._timeout)
+
         # USBTMC_usb488_subclass_1_00.pdf: Section 3.4.2, Table 7
         status: int
         notify1, status = self._device.read(self.intr_in_endpoint.address, 2, self._timeout_ms)
@@ -545,3 +840,19 @@ class USBTMC(USB, regex=REGEX):
             raise MSLConnectionError(self, msg)
 
         _ = super()._write(self._msg.trigger())
+
+    def wait_for_srq(self, timeout: float | None = None) -> int:
+        """Wait for the device to request service.
+
+        The Interrupt-IN endpoint is read in a background thread, see
+        [USBTMCInterruptListener][msl.equipment.interfaces.usbtmc.USBTMCInterruptListener].
+        A service request that was received, but not yet waited for, is returned immediately.
+
+        Args:
+            timeout: The maximum number of seconds to wait. If `None`, uses the
+                [timeout][msl.equipment.interfaces.message.Message.timeout] of the device.
+
+        Returns:
+            The status byte that was sent with the service request.
+        """
+        return self._interrupt_listener().wait_for_srq(timeout=self._timeout if timeout is None else timeout)
@@ -23,7 +23,6 @@ import re
 import select
 import socket
 import threading
-import time
 from dataclasses import dataclass
 from enum import IntEnum
 from struct import Struct, pack, unpack
@@ -31,9 +30,12 @@ from typing import TYPE_CHECKING, overload
 
 from msl.equipment.utils import LXIDevice, ipv4_addresses, logger, parse_lxi_webserver
 
-from .message import Message, MSLConnectionError, MSLTimeoutError
+from .message import Deadline, Message, MSLConnectionError, MSLTimeoutError
+from .socket import set_socket_options
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from msl.equipment.schema import Equipment
 
 
@@ -287,16 +289,19 @@ class RPCClient:
             self._sock.close()
             self._sock = None
 
-    def connect(self, port: int, timeout: float | None = 10) -> None:
+    def connect(self, port: int, timeout: float | None = 10, options: dict[str, Any] | None = None) -> None:
         """Connect to a specific port on the device.
 
         Args:
             port: The port number to connect to.
             timeout: The maximum number of seconds to wait for the connection to be established.
+            options: The socket options, see [set_socket_options][msl.equipment.interfaces.socket.set_socket_options].
         """
         self.close()
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._sock.settimeout(timeout)
+        if options:
+            set_socket_options(self._sock, options)
         self._sock.connect((self._host, port))
 
     def get_buffer(self) -> bytearray:
@@ -801,7 +806,9 @@ class VXI11(Message, regex=REGEX):
 
         A [Connection][msl.equipment.schema.Connection] instance supports the following _properties_
         for the [VXI-11](http://www.vxibus.org/specifications.html) communication protocol, as well
-        as the _properties_ defined in [Message][msl.equipment.interfaces.message.Message].
+        as the _properties_ defined in [Message][msl.equipment.interfaces.message.Message] and the
+        `so_*` and `tcp_*` socket options (e.g., `tcp_nodelay`) defined in
+        [Socket][msl.equipment.interfaces.socket.Socket].
 
         Attributes: Connection Properties:
             buffer_size (int): The maximum number of bytes to read at a time. _Default: `4096`_
@@ -854,7 +861,10 @@ class VXI11(Message, regex=REGEX):
 
             self._core_client = CoreClient(self._info.host)
             self._core_client.chunk_size = self._buffer_size
-            self._core_client.connect(self._core_port, timeout=self.timeout)
+            assert self.equipment.connection is not None  # noqa: S101
+            self._core_client.connect(
+                self._core_port, timeout=self.timeout, options=self.equipment.connection.properties
+            )
 
             params = self._core_client.create_link(
                 device=self._info.name, lock_device=False, lock_timeout=self._lock_timeout_ms
@@ -885,12 +895,11 @@ class VXI11(Message, regex=REGEX):
             term_char = ord(self._read_termination)
             flags |= OperationFlag.TERMCHRSET
 
-        now = time.time
         io_timeout = self._io_timeout_ms
+        deadline = Deadline(io_timeout / 1000)
         reason = 0
         done_flag = RX_END | RX_CHR
         msg = bytearray()
-        t0 = now()
         while reason & done_flag == 0:
             try:
                 reason, data = self._core_client.device_read(
@@ -919,8 +928,8 @@ class VXI11(Message, regex=REGEX):
 
             # decrease io_timeout before reading the next chunk so that the
             # total time to receive all data preserves what was specified
-            if self._io_timeout_ms > 0:
-                io_timeout = max(0, self._io_timeout_ms - int((now() - t0) * 1000))
+            if io_timeout > 0:
+                io_timeout = round((deadline.remaining() or 0.0) * 1000)
 
         return bytes(msg)
 
@@ -1275,10 +1284,10 @@ def find_vxi11(  # noqa: C901, PLR0915
         except OSError:
             return
         select_timeout = min(timeout * 0.1, 0.1)
-        t0 = time.time()
+        deadline = Deadline(timeout)
         while True:
             r, _, _ = select.select([sock], [], [], select_timeout)
-            if time.time() - t0 > timeout:
+            if deadline.expired:
                 break
             if not r:
                 continue
@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+import ast
+import asyncio
+import inspect
 import re
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, NamedTuple, overload
 
+import numpy as np
 import zmq
 import zmq.asyncio
 
-from msl.equipment.utils import to_enum
+from msl.equipment.utils import logger, to_enum
 
 from .message import Message, MSLConnectionError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
-    from typing import Literal
+    from collections.abc import Awaitable, Iterable, Sequence
+    from typing import Any, Literal
 
+    from numpy.typing import ArrayLike, NDArray
     from zmq.auth.asyncio import AsyncioAuthenticator
     from zmq.sugar.context import Context
     from zmq.sugar.socket import SyncSocket
@@ -45,6 +52,9 @@ class ZeroMQ(Message, regex=REGEX):
         The [ZeroMQ](https://zeromq.org/) protocol does not use termination characters, so if
         termination characters are specified the value is ignored and is set to `None`.
 
+        If the `remote` _property_ is `True`, a [RemoteEquipment][msl.equipment.interfaces.remote.RemoteEquipment]
+        instance is created instead of a [ZeroMQ][msl.equipment.interfaces.zeromq.ZeroMQ] instance.
+
         Attributes: Connection Properties:
             protocol (str): ZeroMQ protocol (`tcp`, `udp`, `pgm`, `inproc`, `ipc`) _Default: `tcp`_
             socket_type (int | str | zmq.SocketType): ZeroMQ socket type. Can also be a
@@ -177,6 +187,23 @@ class ZeroMQ(Message, regex=REGEX):
             time.sleep(delay)
         return self._socket.recv_multipart(flags=flags, copy=copy, track=track)
 
+    def read_array(self, flags: int = 0) -> NDArray[Any]:
+        """Read a numpy array that was written by [write_array][..write_array].
+
+        An array that was packed by [pack_array][msl.equipment.interfaces.zeromq.pack_array] (e.g.,
+        the response from a [ZeroMQServer][msl.equipment.interfaces.zeromq.ZeroMQServer]) may also be read.
+        The array is created from the buffer of the received [Frame][zmq.Frame] without
+        copying the data.
+
+        Args:
+            flags: The only supported flag is [DONTWAIT][zmq.Flag.DONTWAIT]
+                (which has a `zmq.NOBLOCK` alias).
+
+        Returns:
+            The array.
+        """
+        return unpack_array(self._socket.recv_multipart(flags=flags, copy=False))
+
     @overload
     def read_multipart(self, flags: int = ..., *, copy: Literal[True], track: bool = ...) -> list[bytes]: ...
 
@@ -210,6 +237,27 @@ class ZeroMQ(Message, regex=REGEX):
         """Returns a reference to the underlying socket."""
         return self._socket
 
+    def write_array(self, array: ArrayLike, *, flags: int = 0, track: bool = True) -> MessageTracker | None:
+        """Write a numpy array without copying the data of the array.
+
+        The array is written as a two-part message, see [pack_array][msl.equipment.interfaces.zeromq.pack_array].
+        Use [read_array][..read_array] to read the array.
+
+        Args:
+            array: The array to write.
+            flags: The only supported flag is [DONTWAIT][zmq.Flag.DONTWAIT]
+                (which has a `zmq.NOBLOCK` alias).
+            track: Should the message frame(s) be tracked for notification that ZeroMQ has
+                finished with it?
+
+        Returns:
+            If `track=True`, a [MessageTracker][zmq.MessageTracker] object. The data of the array must
+                not be modified until the [done][zmq.MessageTracker.done] property of the tracker is `True`.
+        """
+        msg_parts = pack_array(array)
+        out: MessageTracker | None = self._socket.send_multipart(msg_parts, flags=flags, copy=False, track=track)
+        return out
+
     @overload
     def write_multipart(
         self, msg_parts: Sequence[ZMQBuffer], *, flags: int = ..., copy: Literal[True], track: bool = ...
@@ -267,36 +315,68 @@ class ZeroMQServer(ABC):
     See [here][equipment-server] for examples on how to use this class.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         allow: str | Iterable[str] | None = None,
+        copy: bool = True,
         host: str = "*",
+        max_in_flight: int = 100,
         port: int = 0,
         protocol: str = "tcp",
         socket_type: int | str | zmq.SocketType = "REP",
+        workers: int | None = None,
     ) -> None:
         """Start a server to handle requests for the [ZeroMQ](https://zeromq.org/) protocol.
 
+        With the default [REP][zmq.SocketType.REP] socket type, requests are handled one at a time
+        in the order that they are received. With a [ROUTER][zmq.SocketType.ROUTER] socket type,
+        the server handles requests from different clients concurrently. A
+        [handle_request][msl.equipment.interfaces.zeromq.ZeroMQServer.handle_request] method that
+        is defined with `async def` is awaited in the event loop of the server, otherwise the method
+        is called in a pool of worker threads. The requests from the same client are always handled
+        in the order that they were received and each reply is routed back to the client that
+        sent the request. For the `inproc` protocol, ZeroMQ does not provide the socket type of a
+        client to the server, so a request with an empty first frame is assumed to be from a
+        [REQ][zmq.SocketType.REQ] client and a [DEALER][zmq.SocketType.DEALER] client must not
+        send an empty first frame.
+
         Args:
             allow: The IPv4 address(es), or hostname(s), that are allowed to connect to the server.
                 If not specified, all IP addresses can connect. If a hostname cannot be resolved
                 to an IPv4 address a [gaierror][socket.gaierror] is raised, in which case you must
                 explicitly specify the IPv4 address instead of the hostname.
+            copy: Whether each part of a request is copied into [bytes][] before it is passed to
+                [handle_request][msl.equipment.interfaces.zeromq.ZeroMQServer.handle_request]. If `False`,
+                each part is a [Frame][zmq.Frame], so that, e.g.,
+                [unpack_array][msl.equipment.interfaces.zeromq.unpack_array] can create an array
+                from the buffer of the frame without copying the data.
             host: The network interface (IP address) to bind the server to. If `*`, the server
                 listens on all available network interfaces simultaneously.
+            max_in_flight: The maximum number of requests that a [ROUTER][zmq.SocketType.ROUTER]
+                server accepts but has not replied to yet. When the limit is reached, the server
+                stops receiving requests (the requests are queued by ZeroMQ) until a reply is sent.
             port: The port to bind the server to. If `0`, binds the server to any available port.
             protocol: The ZeroMQ protocol to use (`tcp`, `udp`, `pgm`, `inproc`, `ipc`).
             socket_type: The ZeroMQ socket type. Can also be a [SocketType][zmq.SocketType] enum
                 member name (case insensitive) or value.
+            workers: The number of worker threads that a [ROUTER][zmq.SocketType.ROUTER] server uses
+                to call a synchronous `handle_request` method. If `None`, the default number of
+                workers of a [ThreadPoolExecutor][concurrent.futures.ThreadPoolExecutor] is used.
         """
         self._auth: AsyncioAuthenticator | None = None
+        self._copy: bool = copy
         self._interrupt: _Interrupter = _Interrupter()
+        self._max_in_flight: int = max_in_flight
+        self._workers: int | None = workers
 
         self.context: zmq.asyncio.Context = zmq.asyncio.Context()
         """[Context][zmq.asyncio.Context] &mdash; The asynchronous ZeroMQ context."""
 
         self._socket_type: zmq.SocketType = to_enum(socket_type, zmq.SocketType, to_upper=True)
+        if max_in_flight < 1:
+            msg = f"The maximum number of requests in flight must be >= 1, got {max_in_flight}"
+            raise ValueError(msg)
 
         self.socket: zmq.asyncio.Socket = self.context.socket(self._socket_type)
         """[Socket][zmq.asyncio.Socket] &mdash; The asynchronous ZeroMQ socket."""
@@ -334,7 +414,9 @@ class ZeroMQServer(ABC):
 
     def __del__(self) -> None:
         """Calls `_shutdown`."""
-        self._shutdown()
+        # a subclass may raise an exception before calling super().__init__()
+        if hasattr(self, "context"):
+            self._shutdown()
 
     def _shutdown(self) -> None:
         """Shut down the server."""
@@ -369,36 +451,172 @@ class ZeroMQServer(ABC):
             )
             print(msg)  # noqa: T201
 
+        with allow_interrupt(self._interrupt):
+            if self._socket_type == zmq.ROUTER:
+                await self._serve_concurrent()
+            else:
+                await self._serve()
+
+    async def _serve(self) -> None:
+        """Handle one request at a time."""
         p = self._poller
         s = self.socket
-        with allow_interrupt(self._interrupt):
-            while True:
-                socks = dict(await p.poll())
-                if socks.get(s) == zmq.POLLIN:
-                    request = await s.recv_multipart()
-                    reply = self.handle_request(request)
-                    if reply is None:
-                        pass
-                    elif isinstance(reply, (list, tuple)):
-                        _ = await s.send_multipart(reply)  # pyright: ignore[reportUnknownMemberType]
-                    else:
-                        _ = await s.send(reply)
+        while True:
+            socks = dict(await p.poll())
+            if socks.get(s) == zmq.POLLIN:
+                request: list[Any] = await s.recv_multipart(copy=self._copy)
+                reply = self.handle_request(request)
+                if inspect.isawaitable(reply):
+                    reply = await reply
+                if reply is None:
+                    pass
+                elif isinstance(reply, (list, tuple)):
+                    _ = await s.send_multipart(reply)  # pyright: ignore[reportUnknownMemberType]
                 else:
+                    _ = await s.send(reply)
+            else:
+                break
+
+    async def _serve_concurrent(self) -> None:
+        """Handle the requests from different clients concurrently."""
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix=self.__class__.__name__)
+        pending: dict[bytes, deque[tuple[list[bytes], list[Any]]]] = {}
+        tasks: set[asyncio.Task[None]] = set()
+        in_flight = 0
+
+        # while the maximum number of requests are in flight, only poll for the interrupt
+        # and wait for a client to be sent a reply
+        interrupt_poller = zmq.asyncio.Poller()
+        interrupt_poller.register(self._interrupt.receiver, zmq.POLLIN)
+        below_limit = asyncio.Event()
+
+        async def serve_client(client: bytes) -> None:
+            # handle the requests from a client in the order that they were received
+            nonlocal in_flight
+            queue = pending[client]
+            while queue:
+                envelope, request = queue.popleft()
+                await self._reply(envelope, request, executor)
+                in_flight -= 1
+                if in_flight < self._max_in_flight:
+                    below_limit.set()
+            del pending[client]
+
+        s = self.socket
+        try:
+            while True:
+                if in_flight >= self._max_in_flight:
+                    below_limit.clear()
+                    if await self._wait_below_limit(interrupt_poller, below_limit):
+                        break
+                    continue
+
+                socks = dict(await self._poller.poll())
+                if socks.get(s) != zmq.POLLIN:
                     break
 
+                frames = await s.recv_multipart(copy=False)
+                envelope, request = _split_envelope(frames, copy=self._copy)
+                in_flight += 1
+                client = envelope[0]
+                if client in pending:
+                    pending[client].append((envelope, request))
+                else:
+                    pending[client] = deque([(envelope, request)])
+                    task = loop.create_task(serve_client(client))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                _ = task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _wait_below_limit(self, interrupt_poller: zmq.asyncio.Poller, below_limit: asyncio.Event) -> bool:
+        """Wait until a reply is sent (returns False) or until the server is interrupted (returns True)."""
+        interrupted = asyncio.ensure_future(interrupt_poller.poll())
+        replied = asyncio.ensure_future(below_limit.wait())
+        done, _ = await asyncio.wait((interrupted, replied), return_when=asyncio.FIRST_COMPLETED)
+        _ = interrupted.cancel()
+        _ = replied.cancel()
+        # let the cancelled poll stop watching the interrupt before the socket is polled again
+        _ = await asyncio.gather(interrupted, replied, return_exceptions=True)
+        return interrupted in done
+
+    async def _reply(self, envelope: list[bytes], request: list[Any], executor: ThreadPoolExecutor) -> None:
+        """Handle a request that a ROUTER socket received and route the reply back to the client."""
+        handler = self.handle_request
+        reply: ZMQServerResponse
+        try:
+            result = (
+                handler(request)
+                if inspect.iscoroutinefunction(handler)
+                else await asyncio.get_running_loop().run_in_executor(executor, handler, request)
+            )
+            reply = await result if inspect.isawaitable(result) else result
+        except Exception as e:  # noqa: BLE001
+            logger.exception("%s could not handle the request %r", self.__class__.__name__, request)
+            try:
+                reply = self.handle_exception(request, e)
+            except Exception:  # noqa: BLE001
+                logger.exception("%s could not handle the exception", self.__class__.__name__)
+                reply = None
+            if reply is None and len(envelope) > 1:
+                # a REQ client cannot send another request until it receives a reply
+                reply = f"{e.__class__.__name__}: {e}".encode()
+
+        if reply is None:
+            return
+
+        parts = list(reply) if isinstance(reply, (list, tuple)) else [reply]
+        try:
+            _ = await self.socket.send_multipart([*envelope, *parts])  # pyright: ignore[reportUnknownMemberType]
+        except Exception:  # noqa: BLE001
+            logger.exception("%s could not send the reply to the request %r", self.__class__.__name__, request)
+
+    def handle_exception(self, msg_parts: list[bytes], error: Exception) -> ZMQServerResponse:  # pyright: ignore[reportUnusedParameter]  # noqa: ARG002
+        """Handle an exception that was raised while handling a request.
+
+        This method is only called for a [ROUTER][zmq.SocketType.ROUTER] server, after the exception that
+        [handle_request][msl.equipment.interfaces.zeromq.ZeroMQServer.handle_request] raised has been logged.
+        You can override this method to reply to the client with an error message.
+
+        Args:
+            msg_parts: The request message.
+            error: The exception that was raised.
+
+        Returns:
+            The response, see [handle_request][msl.equipment.interfaces.zeromq.ZeroMQServer.handle_request].
+                The default is `None` (do not send a response). A [REQ][zmq.SocketType.REQ] client must
+                always receive a response, so if the response is `None` the name of the exception type
+                and the error message (`b"ValueError: bad request"`) is sent to a REQ client.
+        """
+        return None
+
     @abstractmethod
-    def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse:
+    def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse | Awaitable[ZMQServerResponse]:
         """Handle a *single* request.
 
         !!! warning "Attention"
             You must override this method.
 
+        The method may also be defined with `async def`. For a [ROUTER][zmq.SocketType.ROUTER]
+        server, a synchronous method is called in a worker thread, so it may be called for
+        different clients at the same time. If the method raises an exception, the exception
+        is logged and, for a [ROUTER][zmq.SocketType.ROUTER] server, the reply is determined by
+        [handle_exception][msl.equipment.interfaces.zeromq.ZeroMQServer.handle_exception].
+
+        To receive, or reply with, a numpy array use [unpack_array][msl.equipment.interfaces.zeromq.unpack_array]
+        and [pack_array][msl.equipment.interfaces.zeromq.pack_array]. Unless the server was created with
+        `copy=False`, the data of each part of a request has already been copied into [bytes][].
+
         Args:
             msg_parts: The request message. A client can choose to write a request using the
                 [write_multipart][msl.equipment.interfaces.zeromq.ZeroMQ.write_multipart]
                 method to clearly separate different parts of the request message for the
                 server to process, e.g., separating the name of the function to call from
-                the function parameters.
+                the function parameters. If the server was created with `copy=False`, each
+                part is a [Frame][zmq.Frame] instead of [bytes][].
 
         Returns:
             The response. Can be one or more objects that support the buffer protocol or
@@ -414,7 +632,6 @@ class ZeroMQServer(ABC):
         Args:
             info: Whether to print information about the running server.
         """
-        import asyncio  # noqa: PLC0415
         import sys  # noqa: PLC0415
 
         try:
@@ -447,6 +664,27 @@ class ZeroMQServer(ABC):
         self._interrupt()
 
 
+def _split_envelope(frames: list[zmq.Frame], *, copy: bool) -> tuple[list[bytes], list[bytes] | list[zmq.Frame]]:
+    """Split the frames that a ROUTER socket received into the envelope and the request.
+
+    The envelope contains the identity of the client and, if the client is a REQ socket,
+    the empty delimiter frame. The envelope is prepended to the reply to route it back.
+
+    If `copy` is `False`, the request contains the frames (the data of the frames is not copied).
+
+    A REQ client is identified by the socket type that the client sent when it connected.
+    For a transport that does not provide the socket type of the client (e.g., `inproc`),
+    a client that sends an empty first frame is assumed to be a REQ socket.
+    """
+    try:
+        is_req = frames[-1].get("Socket-Type") == "REQ"
+    except zmq.ZMQError:
+        is_req = len(frames) > 1 and not frames[1].bytes
+    n = 2 if is_req and len(frames) > 1 else 1
+    envelope = [f.bytes for f in frames[:n]]
+    return envelope, [f.bytes for f in frames[n:]] if copy else frames[n:]
+
+
 class _Interrupter:
     """Handle `Ctrl+C` on Windows by creating an interrupt event for the Poller.
 
@@ -486,6 +724,57 @@ class ParsedZMQAddress(NamedTuple):
     port: int
 
 
+def pack_array(array: ArrayLike) -> list[ZMQBuffer]:
+    """Pack a numpy array into a two-part ZeroMQ message without copying the data of the array.
+
+    The first part is a small header that contains the data type, shape and strides of the array
+    (in the same format as the header of a `.npy` file) and the second part is the buffer of the
+    array. An array that is not contiguous in memory is copied into a contiguous array first.
+
+    A [ZeroMQServer][msl.equipment.interfaces.zeromq.ZeroMQServer] may return the packed array
+    from [handle_request][msl.equipment.interfaces.zeromq.ZeroMQServer.handle_request]. Large
+    message parts are sent without being copied, see [copy_threshold][zmq.Socket.copy_threshold].
+
+    Args:
+        array: The array to pack.
+
+    Returns:
+        The message parts.
+    """
+    a = np.asanyarray(array)
+    if a.dtype.hasobject:
+        msg = "Cannot pack an array that contains Python objects"
+        raise ValueError(msg)
+    if not (a.flags.c_contiguous or a.flags.f_contiguous):
+        a = np.ascontiguousarray(a)
+
+    header = {"descr": np.lib.format.dtype_to_descr(a.dtype), "shape": a.shape, "strides": a.strides}
+    return [repr(header).encode(), a.ravel(order="K").data]
+
+
+def unpack_array(msg_parts: Sequence[ZMQBuffer]) -> NDArray[Any]:
+    """Unpack a numpy array from the message parts that were created by [pack_array][..pack_array].
+
+    The array is created from the buffer of the message part without copying the data.
+    If the part is [bytes][], the array is read only.
+
+    Args:
+        msg_parts: The message parts.
+
+    Returns:
+        The array.
+    """
+    if len(msg_parts) != 2:  # noqa: PLR2004
+        msg = f"A packed array is a 2-part message, got {len(msg_parts)} part(s)"
+        raise ValueError(msg)
+
+    header, data = msg_parts
+    info = ast.literal_eval(bytes(header.bytes if isinstance(header, zmq.Frame) else header).decode())
+    buffer = memoryview(data.buffer if isinstance(data, zmq.Frame) else data)
+    dtype = np.lib.format.descr_to_dtype(info["descr"])
+    return np.ndarray(shape=info["shape"], dtype=dtype, buffer=buffer, strides=info["strides"])
+
+
 def parse_zmq_address(address: str) -> ParsedZMQAddress | None:
     """Parse the address for valid ZeroMQ fields.
 
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import codecs
+import hashlib
+import os
 import re
+import struct
 import sys
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import date as _date
 from enum import Enum
 from io import StringIO
 from math import isinf
+from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
-from xml.etree.ElementTree import Element, ElementTree, SubElement
+from xml.etree.ElementTree import Element, ElementTree, ParseError, SubElement, fromstring, tostring
+from xml.parsers.expat import ExpatError, ParserCreate
 
 import numpy as np
 
@@ -18,7 +25,7 @@ from .enumerations import Backend
 from .utils import logger, to_primitive
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
     from typing import Any as _Any
     from typing import Callable, Literal, TypeVar
 
@@ -71,6 +78,60 @@ class _Indent:
     table_data: int = 0
 
 
+class _Deferred:
+    """Mixin for a dataclass that parses the values of some fields the first time that they are accessed.
+
+    A deferred field does not have a value assigned to its slot until it is accessed, so that
+    the XML element is parsed in [__getattr__][object.__getattr__] (which is only called when the
+    normal attribute lookup fails). Without slots (Python < 3.10), the default value of a field is
+    a class attribute and the fields are parsed immediately.
+
+    The parsers are kept in a slot of the mixin (rather than in a dataclass field), so that
+    [fields][dataclasses.fields] and [asdict][dataclasses.asdict] only include the schema fields.
+    """
+
+    __slots__: tuple[str, ...] = ("_deferred",)
+
+    _deferred: dict[str, Callable[[], dict[str, _Any]]] | None  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    if not TYPE_CHECKING:  # type checkers must still report unknown attributes
+
+        def __getattr__(self, name: str) -> _Any:  # noqa: ANN401
+            if name == "_deferred":
+                return None  # the slot has not been assigned, nothing is deferred
+
+            deferred = self._deferred
+            parse = None if deferred is None else deferred.get(name)
+            if parse is None:
+                # raises AttributeError, unless another thread has just assigned the value
+                return object.__getattribute__(self, name)
+
+            values = parse()
+            for key, value in values.items():
+                object.__setattr__(self, key, value)
+                _ = deferred.pop(key, None)
+            return values[name]
+
+    def _defer(self, parse: Callable[[], dict[str, _Any]], *names: str) -> None:
+        """Defer parsing the values of fields until one of the fields is accessed.
+
+        Args:
+            parse: Returns the value of each field in `names`.
+            names: The names of the fields.
+        """
+        if "slots" not in extra_dataclass_kwargs:
+            for key, value in parse().items():
+                object.__setattr__(self, key, value)
+            return
+
+        if self._deferred is None:
+            object.__setattr__(self, "_deferred", {})
+        assert self._deferred is not None  # noqa: S101
+        for name in names:
+            object.__delattr__(self, name)
+            self._deferred[name] = parse
+
+
 def _future_date(relative_to: _date, years: float) -> _date:
     """Calculate a date in the future.
 
@@ -98,6 +159,30 @@ def _future_date(relative_to: _date, years: float) -> _date:
     return relative_to.replace(year=year, month=month, day=day)
 
 
+def _future_dates(relative_to: NDArray[np.datetime64], years: NDArray[np.float64]) -> NDArray[np.datetime64]:
+    """Calculate dates in the future, the vectorised equivalent of _future_date().
+
+    Args:
+        relative_to: The relative-to dates (NaT is preserved).
+        years: The number of years in the future for each date.
+
+    Returns:
+        The future dates.
+    """
+    months = relative_to.astype("datetime64[M]")
+    day = (relative_to - months).astype(np.int64) + 1
+    year, month_decimal = np.divmod(years, 1)
+    month = months.astype(np.int64) + year.astype(np.int64) * 12 + (month_decimal * 12).astype(np.int64)
+
+    month_of_year = month % 12 + 1
+    day = np.where(month_of_year == 2, np.minimum(28, day), day)  # noqa: PLR2004
+    day = np.where(np.isin(month_of_year, (4, 6, 9, 11)), np.minimum(30, day), day)
+
+    future: NDArray[np.datetime64] = month.astype("datetime64[M]").astype("datetime64[D]") + (day - 1)
+    future[np.isnat(relative_to)] = np.datetime64("NaT")
+    return future
+
+
 def _latest(*, items: list[L], quantity: str, name: str) -> L | None:
     """Returns the latest report or performance check."""
     quantity_ok = (not quantity) and (len({item.quantity for item in items}) == 1)
@@ -1566,8 +1651,41 @@ class Table(np.ndarray):
         return e
 
 
+def _parse_data(elements: list[Element[str]]) -> dict[str, _Any]:
+    """Parse the data elements of a report or a performance check."""
+    # Using str.endswith() allows for ignoring XML namespaces that may be associated with each tag
+    cvd_equations: list[CVDEquation] = []
+    deserialisers: list[Deserialised] = []
+    equations: list[Equation] = []
+    files: list[File] = []
+    tables: list[Table] = []
+    for child in elements:
+        tag = child.tag
+        if tag.endswith("equation"):
+            equations.append(Equation.from_xml(child))
+        elif tag.endswith("table"):
+            tables.append(Table.from_xml(child))
+        elif tag.endswith("cvdCoefficients"):
+            cvd_equations.append(CVDEquation.from_xml(child))
+        elif tag.endswith("file"):
+            files.append(File.from_xml(child))
+        else:
+            deserialisers.append(Deserialised.from_xml(child))
+
+    return {
+        "cvd_equations": tuple(cvd_equations),
+        "deserialisers": tuple(deserialisers),
+        "equations": tuple(equations),
+        "files": tuple(files),
+        "tables": tuple(tables),
+    }
+
+
+_DATA_FIELDS = ("cvd_equations", "deserialisers", "equations", "files", "tables")
+
+
 @dataclass(frozen=True, repr=False, **extra_dataclass_kwargs)
-class PerformanceCheck:
+class PerformanceCheck(_Deferred):
     """Represents the [performanceCheck][type_performanceCheck] element in an equipment register.
 
     Args:
@@ -1676,39 +1794,18 @@ class PerformanceCheck:
         """
         # Schema forces order for `competency` and `conditions` but uses xsd:choice,
         # which allows sub-elements to appear (or not appear) in any order, for the data elements.
-        # Using str.endswith() allows for ignoring XML namespaces that may be associated with each tag
-        cvd_equations: list[CVDEquation] = []
-        equations: list[Equation] = []
-        files: list[File] = []
-        deserialisers: list[Deserialised] = []
-        tables: list[Table] = []
-        for child in element[2:]:
-            tag = child.tag
-            if tag.endswith("equation"):
-                equations.append(Equation.from_xml(child))
-            elif tag.endswith("table"):
-                tables.append(Table.from_xml(child))
-            elif tag.endswith("cvdCoefficients"):
-                cvd_equations.append(CVDEquation.from_xml(child))
-            elif tag.endswith("file"):
-                files.append(File.from_xml(child))
-            else:
-                deserialisers.append(Deserialised.from_xml(child))
-
+        # The data elements are parsed when one of the data fields is first accessed.
         a = element.attrib
-        return cls(
+        check = cls(
             completed_date=_date.fromisoformat(a["completedDate"] or ""),
             entered_by=a["enteredBy"] or "",
             checked_by=a.get("checkedBy", ""),
             checked_date=None if not a.get("checkedDate") else _date.fromisoformat(a["checkedDate"]),
             competency=Competency.from_xml(element[0]),
             conditions=Conditions.from_xml(element[1]),
-            cvd_equations=tuple(cvd_equations),
-            deserialisers=tuple(deserialisers),
-            equations=tuple(equations),
-            files=tuple(files),
-            tables=tuple(tables),
         )
+        check._defer(lambda: _parse_data(element[2:]), *_DATA_FIELDS)
+        return check
 
     def to_xml(self) -> Element[str]:
         """Convert the [PerformanceCheck][msl.equipment.schema.PerformanceCheck] class into an XML element.
@@ -1777,7 +1874,7 @@ class IssuingLaboratory:
 
 
 @dataclass(frozen=True, repr=False, **extra_dataclass_kwargs)
-class Report:
+class Report(_Deferred):
     """Represents the [report][type_report] element in an equipment register.
 
     Args:
@@ -1915,27 +2012,9 @@ class Report:
         """
         # Schema forces order until `acceptanceCriteria` and then uses xsd:choice, which
         # allows sub-elements to appear (or not appear) in any order, for the data elements.
-        # Using str.endswith() allows for ignoring XML namespaces that may be associated with each tag
-        cvd_equations: list[CVDEquation] = []
-        deserialisers: list[Deserialised] = []
-        equations: list[Equation] = []
-        files: list[File] = []
-        tables: list[Table] = []
-        for child in element[7:]:
-            tag = child.tag
-            if tag.endswith("equation"):
-                equations.append(Equation.from_xml(child))
-            elif tag.endswith("table"):
-                tables.append(Table.from_xml(child))
-            elif tag.endswith("cvdCoefficients"):
-                cvd_equations.append(CVDEquation.from_xml(child))
-            elif tag.endswith("file"):
-                files.append(File.from_xml(child))
-            else:
-                deserialisers.append(Deserialised.from_xml(child))
-
+        # The data elements are parsed when one of the data fields is first accessed.
         a = element.attrib
-        return cls(
+        report = cls(
             id=a["id"] or "",
             entered_by=a["enteredBy"] or "",
             checked_by=a.get("checkedBy", ""),
@@ -1948,12 +2027,9 @@ class Report:
             technical_procedure=element[4].text or "",
             conditions=Conditions.from_xml(element[5]),
             acceptance_criteria=AcceptanceCriteria.from_xml(element[6]),
-            cvd_equations=tuple(cvd_equations),
-            deserialisers=tuple(deserialisers),
-            equations=tuple(equations),
-            files=tuple(files),
-            tables=tuple(tables),
         )
+        report._defer(lambda: _parse_data(element[7:]), *_DATA_FIELDS)
+        return report
 
     def to_xml(self) -> Element[str]:
         """Convert the [Report][msl.equipment.schema.Report] class into an XML element.
@@ -2373,7 +2449,7 @@ class LatestPerformanceCheck(Latest, PerformanceCheck):
 
 
 @dataclass(frozen=True, repr=False, **extra_dataclass_kwargs)
-class Equipment:
+class Equipment(_Deferred):
     """Represents the [equipment][type_equipment] element in an equipment register.
 
     Args:
@@ -2516,10 +2592,12 @@ class Equipment:
 
         1. If a [Connection][] has a specified [backend][msl.equipment.schema.Connection.backend],
            that is not `MSL`, that [Backend][connections-backend] is used.
-        2. If the [Equipment][] has the appropriate [manufacturer][msl.equipment.schema.Equipment.manufacturer]
+        2. If the [Connection][] has the `remote` _property_ set to `True`, a
+           [RemoteEquipment][msl.equipment.interfaces.remote.RemoteEquipment] instance is returned.
+        3. If the [Equipment][] has the appropriate [manufacturer][msl.equipment.schema.Equipment.manufacturer]
            and [model][msl.equipment.schema.Equipment.model] values for one of the [Resources][],
            that Resource is used.
-        3. If the [Connection][] has an [address][msl.equipment.schema.Connection.address]
+        4. If the [Connection][] has an [address][msl.equipment.schema.Connection.address]
            that is supported by one of the [Interfaces][connections-interfaces], that Interface is used.
         """
         if self.connection is None:
@@ -2532,6 +2610,13 @@ class Equipment:
     def from_xml(cls, element: Element[str]) -> Equipment:
         """Convert an XML element into an [Equipment][msl.equipment.schema.Equipment] instance.
 
+        The [calibrations][msl.equipment.schema.Equipment.calibrations],
+        [maintenance][msl.equipment.schema.Equipment.maintenance],
+        [alterations][msl.equipment.schema.Equipment.alterations] and
+        [firmware][msl.equipment.schema.Equipment.firmware] elements, and the data elements
+        (e.g., tables) of each report and performance check, are parsed the first time that
+        the corresponding attribute is accessed.
+
         Args:
             element: An [equipment][type_equipment] XML element from an equipment register.
 
@@ -2540,7 +2625,7 @@ class Equipment:
         """
         # Schema forces order
         a = element.attrib
-        return cls(
+        equipment = cls(
             entered_by=a["enteredBy"],
             checked_by=a.get("checkedBy", ""),
             checked_date=None if not a.get("checkedDate") else _date.fromisoformat(a["checkedDate"]),
@@ -2556,14 +2641,15 @@ class Equipment:
             status=Status(element[7].text),
             loggable=element[8].text in {"1", "true"},
             traceable=element[9].text in {"1", "true"},
-            calibrations=tuple(Measurand.from_xml(e) for e in element[10]),
-            maintenance=Maintenance.from_xml(element[11]),
-            alterations=tuple(Alteration.from_xml(e) for e in element[12]),
-            firmware=tuple(Firmware.from_xml(e) for e in element[13]),
             specified_requirements=SpecifiedRequirements.from_xml(element[14]),
             reference_materials=ReferenceMaterials.from_xml(element[15]),
             quality_manual=QualityManual.from_xml(element[16]),
         )
+        equipment._defer(lambda: {"calibrations": tuple(Measurand.from_xml(e) for e in element[10])}, "calibrations")
+        equipment._defer(lambda: {"maintenance": Maintenance.from_xml(element[11])}, "maintenance")
+        equipment._defer(lambda: {"alterations": tuple(Alteration.from_xml(e) for e in element[12])}, "alterations")
+        equipment._defer(lambda: {"firmware": tuple(Firmware.from_xml(e) for e in element[13])}, "firmware")
+        return equipment
 
     def to_xml(self) -> Element[str]:
         """Convert the [Equipment][msl.equipment.schema.Equipment] class into an XML element.
@@ -2786,13 +2872,290 @@ class Equipment:
         return latest
 
 
+class _StreamedFile:
+    """An equipment-register file that an `<equipment>` element is read from when it is requested."""
+
+    __slots__: tuple[str, ...] = ("mtime_ns", "path", "prefix", "size", "suffix")
+
+    def __init__(self, path: Path, *, mtime_ns: int, prefix: bytes, size: int, suffix: bytes) -> None:
+        """An equipment-register file that an `<equipment>` element is read from when it is requested.
+
+        Args:
+            path: The path of the XML file.
+            mtime_ns: The modification time of the file when it was indexed.
+            prefix: The bytes in the file before the first `<equipment>` element (i.e., the XML
+                declaration and the start tag of the root element, which may declare namespaces).
+            size: The size of the file when it was indexed.
+            suffix: The end tag of the root element.
+        """
+        self.path: Path = path
+        self.mtime_ns: int = mtime_ns
+        self.prefix: bytes = prefix
+        self.size: int = size
+        self.suffix: bytes = suffix
+
+    def read(self, start: int, stop: int) -> Element[str]:
+        """Read an `<equipment>` element from the file.
+
+        Args:
+            start: The byte offset of the start of the element.
+            stop: The byte offset after the end of the element.
+
+        Returns:
+            The element.
+        """
+        stat = self.path.stat()
+        if stat.st_size != self.size or stat.st_mtime_ns != self.mtime_ns:
+            msg = f"The equipment register {str(self.path)!r} has been modified since it was loaded"
+            raise ValueError(msg)
+
+        with self.path.open("rb") as f:
+            _ = f.seek(start)
+            data = f.read(stop - start)
+
+        root = fromstring(self.prefix + data + self.suffix)  # noqa: S314
+        return root[0]
+
+
+class _Location(NamedTuple):
+    """The location of an `<equipment>` element in an equipment-register file."""
+
+    file: _StreamedFile
+    start: int
+    stop: int
+
+
+class _Source(NamedTuple):
+    """The equipment in an equipment-register source.
+
+    An element is [bytes][] if it was loaded from a cache file, or a `_Location` if the file was
+    streamed, and it is parsed when it is first needed.
+    """
+
+    team: str
+    ids: list[str]
+    aliases: list[str]
+    elements: list[Element[str] | bytes | _Location]
+
+
+_CACHE_HEADER = struct.Struct("<6sBQq32s")  # magic, version, size, mtime_ns, sha256
+_CACHE_MAGIC = b"MSLREG"
+_CACHE_VERSION = 1
+_CACHE_LENGTH = struct.Struct("<I")
+
+
+def _cache_file(path: Path, directory: Path | None) -> Path:
+    """Returns the path of the cache file for an equipment-register file."""
+    if directory is None:
+        return path.with_name(f"{path.name}.cache")
+    digest = hashlib.sha256(os.fsencode(path.resolve())).hexdigest()[:16]
+    return directory / f"{path.stem}-{digest}.cache"
+
+
+def _read_cache(path: Path, cache: Path) -> _Source | None:
+    """Read a cache file. Returns `None` if the cache file does not exist or is not valid."""
+    try:
+        data = cache.read_bytes()
+    except OSError:
+        return None
+
+    try:
+        magic, version, size, mtime_ns, digest = _CACHE_HEADER.unpack_from(data)
+        stat = path.stat()
+        if magic != _CACHE_MAGIC or version != _CACHE_VERSION or stat.st_size != size:
+            return None
+
+        if stat.st_mtime_ns != mtime_ns:
+            if hashlib.sha256(path.read_bytes()).digest() != digest:
+                return None
+            # the content has not changed (e.g., the file was copied), update the modification time
+            with cache.open("r+b") as f:
+                _ = f.write(_CACHE_HEADER.pack(magic, version, size, stat.st_mtime_ns, digest))
+
+        view = memoryview(data)
+        offset = _CACHE_HEADER.size
+        items: list[bytes] = []
+        while offset < len(view):
+            (n,) = _CACHE_LENGTH.unpack_from(view, offset)
+            offset += _CACHE_LENGTH.size
+            items.append(bytes(view[offset : offset + n]))
+            offset += n
+
+        if offset != len(view) or len(items) % 3 != 1:
+            return None
+
+        return _Source(
+            team=items[0].decode(),
+            ids=[i.decode() for i in items[1::3]],
+            aliases=[a.decode() for a in items[2::3]],
+            elements=list(items[3::3]),
+        )
+    except (OSError, UnicodeDecodeError, struct.error):
+        return None
+
+
+def _write_cache(cache: Path, header: bytes, source: _Source, root: Element[str]) -> None:
+    """Write a cache file. An error is logged, but not raised, if the cache file cannot be written."""
+    items = [source.team.encode()]
+    for id_, alias, element in zip(source.ids, source.aliases, root):
+        items.extend((id_.encode(), alias.encode(), tostring(element)))
+
+    parts = [header]
+    for item in items:
+        parts.extend((_CACHE_LENGTH.pack(len(item)), item))
+
+    # write to a temporary file first so that another process never reads a partially-written cache file
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        _ = tmp.write_bytes(b"".join(parts))
+        _ = tmp.replace(cache)
+    except OSError as e:
+        logger.warning("cannot write the equipment-register cache file %r, %s", str(cache), e)
+        tmp.unlink(missing_ok=True)
+
+
+def _stream(path: Path) -> _Source:  # noqa: C901, PLR0915
+    """Index the ids, aliases and byte offsets of the `<equipment>` elements in an equipment-register file.
+
+    The file is parsed in one pass, without building the element tree, so the memory that is
+    required does not depend on the size of the file.
+    """
+    team = ""
+    root = ""
+    encoding = "utf-8"  # the encoding of the file, the end tag of the root element must be encoded the same way
+    ids: list[str] = []
+    aliases: list[str] = []
+    starts: list[int] = []
+    stops: list[int] = []
+    text: list[str] = []
+    depth = 0
+    children = 0  # the number of sub-elements of the current <equipment> element, the first is the id
+
+    parser = ParserCreate()
+    parser.buffer_text = True
+
+    def start_element(name: str, attrib: dict[str, str]) -> None:
+        nonlocal children, depth, root, team
+        depth += 1
+        if depth == 1:
+            root = name
+            team = attrib.get("team", "")
+        elif depth == 2:  # noqa: PLR2004
+            starts.append(parser.CurrentByteIndex)
+            aliases.append(attrib.get("alias", ""))
+            children = 0
+        elif depth == 3:  # noqa: PLR2004
+            children += 1
+
+    def end_element(name: str) -> None:
+        nonlocal depth
+        depth -= 1
+        if depth == 1:
+            # the index is the start of the end tag, or the byte after an empty-element tag
+            stop = parser.CurrentByteIndex
+            context = parser.GetInputContext() or b""
+            if context.startswith(f"</{name}".encode(encoding)):
+                gt = ">".encode(encoding)
+                stop += context.index(gt) + len(gt)
+            stops.append(stop)
+            ids.append("".join(text))
+            text.clear()
+
+    def character_data(data: str) -> None:
+        if depth == 3 and children == 1:  # noqa: PLR2004
+            text.append(data)
+
+    def xml_decl(version: str, declared: str | None, standalone: int) -> None:  # pyright: ignore[reportUnusedParameter]  # noqa: ARG001
+        nonlocal encoding
+        if declared and encoding == "utf-8":
+            encoding = declared
+
+    parser.XmlDeclHandler = xml_decl
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+
+    stat = path.stat()
+    with path.open("rb") as f:
+        # a byte-order mark takes precedence over the encoding in the XML declaration
+        bom = f.read(2)
+        _ = f.seek(0)
+        if bom == codecs.BOM_UTF16_LE:
+            encoding = "utf-16-le"
+        elif bom == codecs.BOM_UTF16_BE:
+            encoding = "utf-16-be"
+
+        try:
+            _ = parser.ParseFile(f)
+        except ExpatError as e:
+            raise ParseError(str(e)) from None
+
+        prefix = b""
+        if starts:
+            _ = f.seek(0)
+            prefix = f.read(starts[0])
+
+    file = _StreamedFile(
+        path, mtime_ns=stat.st_mtime_ns, prefix=prefix, size=stat.st_size, suffix=f"</{root}>".encode(encoding)
+    )
+    elements: list[Element[str] | bytes | _Location] = [_Location(file, a, b) for a, b in zip(starts, stops)]
+    return _Source(team=team, ids=ids, aliases=aliases, elements=elements)
+
+
+def _load(source: XMLSource | Element[str], directory: Path | None, *, cache: bool, stream: bool) -> _Source:
+    """Load an equipment-register source.
+
+    A cache file is used if `cache` is enabled, or the file is indexed if `stream` is enabled,
+    and the source is path-like.
+    """
+    if isinstance(source, Element):
+        root = source
+    elif isinstance(source, (str, bytes, os.PathLike)) and (cache or stream):
+        path = Path(os.fsdecode(source))
+        if stream:
+            return _stream(path)
+
+        file = _cache_file(path, directory)
+        cached = _read_cache(path, file)
+        if cached is not None:
+            logger.debug("loaded equipment register %r from cache %r", str(path), str(file))
+            return cached
+
+        stat = path.stat()
+        content = path.read_bytes()
+        root = fromstring(content)  # noqa: S314
+        loaded = _from_root(root)
+        digest = hashlib.sha256(content).digest()
+        header = _CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, stat.st_size, stat.st_mtime_ns, digest)
+        _write_cache(file, header, loaded, root)
+        return loaded
+    else:
+        root = ElementTree().parse(source)
+
+    return _from_root(root)
+
+
+def _from_root(root: Element[str]) -> _Source:
+    """Get the equipment from the root element of an equipment register."""
+    elements: list[Element[str] | bytes | _Location] = list(root)
+    return _Source(
+        team=root.attrib.get("team", ""),
+        ids=[str(e[0].text) for e in root],  # e[0] is the ID
+        aliases=[e.attrib.get("alias", "") for e in root],
+        elements=elements,
+    )
+
+
 class Register:
     """Represents the [register][element_register] element in an equipment register."""
 
     NAMESPACE: str = "https://measurement.govt.nz/equipment-register"
     """Default XML namespace."""
 
-    def __init__(self, *sources: XMLSource | Element[str]) -> None:
+    def __init__(
+        self, *sources: XMLSource | Element[str], cache: bool | PathLike = False, stream: bool = False
+    ) -> None:
         """Represents the [register][element_register] element in an equipment register.
 
         Specifying multiple sources allows for storing an equipment register across multiple
@@ -2801,27 +3164,53 @@ class Register:
         Args:
             sources: The [path-like][path-like object], [file-like][file-like object] or
                 [Element][xml.etree.ElementTree.Element] objects that represent an equipment register.
+            cache: Whether to cache the (parsed) equipment register in a binary file, so that the
+                XML file does not need to be parsed again the next time that the register is loaded.
+                A cache file is only used for a `source` that is [path-like][path-like object] and
+                it is recreated if the size, modification time and content of the XML file changed.
+                If `True`, the cache file is written to the same directory as the XML file (with
+                the extension `.cache` appended to the filename). If a [path-like][path-like object]
+                object, the directory to write the cache files to.
+            stream: Whether to index an XML file, rather than load the file into memory. A file is
+                parsed once to find the id, alias and the location of each `<equipment>` element, and an
+                `<equipment>` element is read from the file when the equipment is requested. Memory usage
+                then depends on the number of equipment that are accessed rather than on the size of the
+                register. This is only used for a `source` that is [path-like][path-like object], and
+                cannot be used with `cache`.
         """
+        if stream and cache is not False:
+            msg = "Cannot use both `cache` and `stream` to load an equipment register"
+            raise ValueError(msg)
+
+        directory = None if isinstance(cache, bool) else Path(os.fsdecode(cache)).expanduser()
+
         team = ""
-        self._elements: list[Element[str]] = []
+        ids: list[str] = []
+        aliases: list[str] = []
+        self._elements: list[Element[str] | bytes | _Location] = []
         for source in sources:
-            root = source if isinstance(source, Element) else ElementTree().parse(source)
-            t = root.attrib.get("team", "")
+            loaded = _load(source, directory, cache=cache is not False, stream=stream)
             if not team:
-                team = t
+                team = loaded.team
 
-            if team != t:
-                msg = f"Cannot merge equipment registers from different teams, {team!r} != {t!r}"
+            if team != loaded.team:
+                msg = f"Cannot merge equipment registers from different teams, {team!r} != {loaded.team!r}"
                 raise ValueError(msg)
 
-            self._elements.extend(root)
+            ids.extend(loaded.ids)
+            aliases.extend(loaded.aliases)
+            self._elements.extend(loaded.elements)
 
         self._team: str = team
         self._equipment: list[Equipment | None] = [None] * len(self._elements)
 
         # a mapping between the alias/id and the index number in the register
-        self._index_map: dict[str, int] = {str(e[0].text): i for i, e in enumerate(self._elements)}  # e[0] is the ID
-        self._index_map.update({e.attrib["alias"]: i for i, e in enumerate(self._elements) if e.attrib.get("alias")})
+        self._index_map: dict[str, int] = {id_: i for i, id_ in enumerate(ids)}
+        self._index_map.update({alias: i for i, alias in enumerate(aliases) if alias})
+
+        # created the first time that find() or query() is called
+        self._search_index: _SearchIndex | None = None
+        self._query_index: _QueryIndex | None = None
 
     def __getitem__(self, item: str | int) -> Equipment:
         """Returns an Equipment item from the register."""
@@ -2835,7 +3224,7 @@ class Register:
 
         e = self._equipment[index]  # this will raise IndexError if out of bounds
         if e is None:
-            e = Equipment.from_xml(self._elements[index])
+            e = Equipment.from_xml(self._element(index))
             self._equipment[index] = e
         return e
 
@@ -2843,7 +3232,7 @@ class Register:
         """Yields the Equipment elements in the register."""
         for i, e in enumerate(self._equipment):
             if e is None:
-                e = Equipment.from_xml(self._elements[i])  # noqa: PLW2901
+                e = Equipment.from_xml(self._element(i))  # noqa: PLW2901
                 self._equipment[i] = e
             yield e
 
@@ -2855,6 +3244,17 @@ class Register:
         """Returns the string representation."""
         return f"{self.__class__.__name__}(team={self.team!r} ({len(self)} equipment))"
 
+    def _element(self, index: int) -> Element[str]:
+        """Returns the XML element of the equipment (parses the element if it was cached or streamed)."""
+        element = self._elements[index]
+        if isinstance(element, bytes):
+            element = fromstring(element)  # noqa: S314
+            self._elements[index] = element
+        elif isinstance(element, _Location):
+            element = element.file.read(element.start, element.stop)
+            self._elements[index] = element
+        return element
+
     def add(self, equipment: Equipment) -> None:
         """Add equipment to the register.
 
@@ -2866,10 +3266,18 @@ class Register:
         if equipment.alias:
             self._index_map[equipment.alias] = len(self._equipment)
         self._equipment.append(equipment)
+        self._search_index = None
+        self._query_index = None
 
-    def find(self, pattern: str | re.Pattern[str], *, flags: int = 0) -> Iterator[Equipment]:  # noqa: C901
+    def find(self, pattern: str | re.Pattern[str], *, flags: int = 0) -> Iterator[Equipment]:
         """Find equipment in the register.
 
+        The values that are searched are collected into an index the first time that this method
+        is called, and the index is reused by subsequent searches until equipment is
+        [added][msl.equipment.schema.Register.add] to the register. If the `pattern` is a literal
+        (i.e., it does not contain regular-expression metacharacters) only the equipment that contain
+        all words in the `pattern` are searched.
+
         The following values are used in the search:
 
         * keywords: [Equipment][msl.equipment.schema.Equipment]
@@ -2899,103 +3307,14 @@ class Register:
         Yields:
             Equipment that match the `pattern`.
         """  # noqa: E501
-
-        def comment_search(item: Report | PerformanceCheck) -> bool:
-            for cvd_equation in item.cvd_equations:
-                if regex.search(cvd_equation.comment) is not None:
-                    return True
-            for equation in item.equations:
-                if regex.search(equation.comment) is not None:
-                    return True
-            for file in item.files:
-                if regex.search(file.comment) is not None:
-                    return True
-            for table in item.tables:
-                if regex.search(table.comment) is not None:
-                    return True
-            return any(regex.search(deserialised.comment) is not None for deserialised in item.deserialisers)
-
-        def task_search(m: Maintenance) -> bool:
-            for c in m.completed:
-                if regex.search(c.task) is not None:
-                    return True
-                if regex.search(c.performed_by) is not None:
-                    return True
-            for p in m.planned:
-                if regex.search(p.task) is not None:
-                    return True
-                if regex.search(p.performed_by) is not None:
-                    return True
-            return False
-
-        def alteration_search(alterations: tuple[Alteration, ...]) -> bool:
-            for a in alterations:
-                if regex.search(a.details) is not None:
-                    return True
-                if regex.search(a.performed_by) is not None:
-                    return True
-            return False
-
-        def calibrations_search(e: Equipment) -> bool:  # noqa: C901, PLR0911, PLR0912
-            for m in e.calibrations:
-                if regex.search(m.quantity) is not None:
-                    return True
-                for c in m.components:
-                    if regex.search(c.name) is not None:
-                        return True
-                    for r in c.reports:
-                        if regex.search(r.entered_by) is not None:
-                            return True
-                        if regex.search(r.checked_by) is not None:
-                            return True
-                        if comment_search(r):
-                            return True
-                        if regex.search(r.id) is not None:
-                            return True
-                    for pc in c.performance_checks:
-                        if regex.search(pc.entered_by) is not None:
-                            return True
-                        if regex.search(pc.checked_by) is not None:
-                            return True
-                        if comment_search(pc):
-                            return True
-                    for a in c.adjustments:
-                        if regex.search(a.details) is not None:
-                            return True
-                    for dr in c.digital_reports:
-                        if regex.search(dr.format.value) is not None:
-                            return True
-                        if regex.search(dr.id) is not None:
-                            return True
-                        if regex.search(dr.comment) is not None:
-                            return True
-            return False
-
-        def asset_number_search(f: Financial) -> bool:
-            if f.capital_expenditure is None:
-                return False
-            return regex.search(f.capital_expenditure.asset_number) is not None
-
         regex = re.compile(pattern, flags=flags)
-        for equipment in self:
-            if (
-                regex.search(" ".join(equipment.keywords)) is not None
-                or regex.search(equipment.description) is not None
-                or regex.search(equipment.manufacturer) is not None
-                or regex.search(equipment.model) is not None
-                or regex.search(equipment.serial) is not None
-                or regex.search(equipment.id) is not None
-                or regex.search(equipment.location) is not None
-                or regex.search(equipment.entered_by) is not None
-                or regex.search(equipment.checked_by) is not None
-                or calibrations_search(equipment)
-                or alteration_search(equipment.alterations)
-                or task_search(equipment.maintenance)
-                or asset_number_search(equipment.quality_manual.financial)
-                or regex.search(equipment.quality_manual.service_agent) is not None
-                or regex.search(" ".join(equipment.quality_manual.technical_procedures)) is not None
-            ):
-                yield equipment
+        if self._search_index is None:
+            self._search_index = _SearchIndex(self)
+
+        index = self._search_index
+        for i in index.candidates(regex):
+            if any(regex.search(value) is not None for value in index.fields[i]):
+                yield self[i]
 
     def get(self, item: int | str) -> Equipment | None:
         """Get an [Equipment][msl.equipment.schema.Equipment] item from the register.
@@ -3047,6 +3366,153 @@ class Register:
         except (ValueError, IndexError):
             return None
 
+    def query(  # noqa: PLR0913
+        self,
+        *,
+        due_start: _date | None = None,
+        due_stop: _date | None = None,
+        keywords: str | Iterable[str] | None = None,
+        location: str | Iterable[str] | None = None,
+        manufacturer: str | Iterable[str] | None = None,
+        model: str | Iterable[str] | None = None,
+        quantity: str | Iterable[str] | None = None,
+        status: Status | str | Iterable[Status | str] | None = None,
+    ) -> list[Equipment]:
+        """Select equipment in the register by the values of its fields.
+
+        The filters are combined, so the selected equipment must match all filters that are
+        specified. A filter may be a single value, or multiple values to select the equipment
+        that match any of the values. The values must match exactly (they are case sensitive).
+
+        The indexes that are used to select the equipment are created the first time that this method
+        is called, and the indexes are reused by subsequent queries until equipment is
+        [added][msl.equipment.schema.Register.add] to the register.
+
+        <!--
+        >>> from datetime import date
+        >>> from msl.equipment import Register
+        >>> register = Register("tests/data/mass/register.xml", "tests/data/mass/register2.xml")
+
+        -->
+
+        **Example:**
+        Select the active equipment that must be re-calibrated in 2028
+
+        ```pycon
+        >>> register.query(status="Active", due_start=date(2028, 1, 1), due_stop=date(2028, 12, 31))
+        [Equipment(id='MSLE.M.092', manufacturer='XYZ', model='A', serial='b' (4 reports))]
+
+        ```
+
+        Args:
+            due_start: Select equipment that has a _component_ with a
+                [next_calibration_date][msl.equipment.schema.Latest.next_calibration_date] that is on or
+                after this date. The date is determined from the [latest_reports][msl.equipment.schema.Equipment.latest_reports]
+                and a _measurand_ that is calibrated on demand (i.e., the
+                [calibration_interval][msl.equipment.schema.Measurand.calibration_interval] is 0) is ignored.
+            due_stop: Select equipment that has a _component_ with a
+                [next_calibration_date][msl.equipment.schema.Latest.next_calibration_date] that is on or
+                before this date. See `due_start` for more details.
+            keywords: Select equipment that has one of the [keywords][msl.equipment.schema.Equipment.keywords].
+            location: Select equipment by its [location][msl.equipment.schema.Equipment.location].
+            manufacturer: Select equipment by its [manufacturer][msl.equipment.schema.Equipment.manufacturer].
+            model: Select equipment by its [model][msl.equipment.schema.Equipment.model].
+            quantity: Select equipment that has a _measurand_ with the
+                [quantity][msl.equipment.schema.Measurand.quantity]. If `due_start` or `due_stop` is also
+                specified, the date range applies to the components of the measurand.
+            status: Select equipment by its [status][msl.equipment.schema.Equipment.status].
+
+        Returns:
+            The selected equipment, in the order that the equipment is in the register.
+        """  # noqa: E501
+        if self._query_index is None:
+            self._query_index = _QueryIndex(self)
+
+        index = self._query_index
+        quantities = None if quantity is None else [quantity] if isinstance(quantity, str) else list(quantity)
+        statuses = None
+        if status is not None:
+            statuses = [Status(s) for s in ((status,) if isinstance(status, (Status, str)) else status)]
+
+        selected: set[int] | None = None
+        for name, value in (
+            ("keywords", keywords),
+            ("location", location),
+            ("manufacturer", manufacturer),
+            ("model", model),
+            ("quantity", quantities),
+            ("status", statuses),
+        ):
+            if value is not None:
+                found = index.select(name, (value,) if isinstance(value, str) else value)
+                selected = found if selected is None else selected & found
+
+        if due_start is not None or due_stop is not None:
+            found = index.due(due_start, due_stop, quantities)
+            selected = found if selected is None else selected & found
+
+        return [self[i] for i in (range(len(self)) if selected is None else sorted(selected))]
+
+    def calibration_status(self, date: Literal["issue", "start", "stop"] = "stop") -> NDArray[np.void]:
+        """Get the calibration status of every _component_ of the equipment in the register.
+
+        The dates of all reports and performance checks are collected into arrays, and the latest
+        report, the latest performance check and the date that a recalibration is due are determined
+        for all components together. This is the tabular equivalent of calling
+        [latest_reports][msl.equipment.schema.Equipment.latest_reports] and
+        [latest_performance_checks][msl.equipment.schema.Equipment.latest_performance_checks] for
+        each equipment, without creating the [LatestReport][msl.equipment.schema.LatestReport] and
+        [LatestPerformanceCheck][msl.equipment.schema.LatestPerformanceCheck] instances.
+
+        <!--
+        >>> import numpy as np
+        >>> from msl.equipment import Register
+        >>> register = Register("tests/data/mass/register.xml", "tests/data/mass/register2.xml")
+
+        -->
+
+        **Example:**
+        Get the components that must be re-calibrated in 2028
+
+        ```pycon
+        >>> status = register.calibration_status()
+        >>> due = status[(status["calibration_interval"] > 0) & (status["next_calibration_date"] < np.datetime64("2029"))]
+        >>> for row in np.sort(due, order="next_calibration_date"):
+        ...     print(row["id"], row["name"], row["next_calibration_date"])
+        MSLE.M.092 Probe 1 2028-08-14
+        MSLE.M.092 Probe 2 2028-10-14
+
+        ```
+
+        Args:
+            date: Which date in a report to use to determine what _latest_ refers to:
+
+                * `issue`: Report issue date
+                * `start`: Measurement start date
+                * `stop`: Measurement stop date
+
+        Returns:
+            A [structured array][structured_arrays] with one row for each _component_ (in the order that
+                the equipment is in the register) and the fields:
+
+                * `id` (str): The equipment [id][msl.equipment.schema.Equipment.id].
+                * `quantity` (str): The measurand [quantity][msl.equipment.schema.Measurand.quantity].
+                * `name` (str): The component [name][msl.equipment.schema.Component.name].
+                * `calibration_interval` (float): The measurand
+                    [calibration_interval][msl.equipment.schema.Measurand.calibration_interval].
+                * `report_id` (str): The [id][msl.equipment.schema.Report.id] of the latest report.
+                * `report_date` (datetime64[D]): The `date` of the latest report.
+                * `next_calibration_date` (datetime64[D]): The date that the component is due for a
+                    recalibration, see [next_calibration_date][msl.equipment.schema.Latest.next_calibration_date].
+                * `check_date` (datetime64[D]): The completed date of the latest performance check.
+                * `next_check_date` (datetime64[D]): The date that the next performance check is due.
+
+                The value of a date is `NaT` (and `report_id` is an empty string) if the component does
+                not have a report or a performance check.
+        """  # noqa: E501
+        status, _ = _calibration_status(self, date)
+        return status
+
     @property
     def team(self) -> str:
         """[str][] &mdash; The name of the team that is responsible for the equipment register."""
@@ -3174,10 +3640,12 @@ class Connection:
 
         1. If a [Connection][] has a specified [backend][msl.equipment.schema.Connection.backend],
            that is not `MSL`, that [Backend][connections-backend] is used.
-        2. If the [Connection][] has the appropriate [manufacturer][msl.equipment.schema.Connection.manufacturer]
+        2. If the [Connection][] has the `remote` _property_ set to `True`, a
+           [RemoteEquipment][msl.equipment.interfaces.remote.RemoteEquipment] instance is returned.
+        3. If the [Connection][] has the appropriate [manufacturer][msl.equipment.schema.Connection.manufacturer]
            and [model][msl.equipment.schema.Connection.model] values for one of the [Resources][],
            that Resource is used.
-        3. If the [Connection][] has an [address][msl.equipment.schema.Connection.address]
+        4. If the [Connection][] has an [address][msl.equipment.schema.Connection.address]
            that is supported by one of the [Interfaces][connections-interfaces], that Interface is used.
         """
         equipment = Equipment(
@@ -3313,6 +3781,7 @@ class Interface:
         flags: int = 0,
         backend: Backend | None = None,
         regex: re.Pattern[str] | None = None,
+        remote: bool = False,
         append: bool = True,
     ) -> None:
         """This method is called whenever the Interface is sub-classed.
@@ -3323,8 +3792,9 @@ class Interface:
             flags: The flags to use for the regex pattern string.
             backend: The backend to use for communication.
             regex: The compiled regex to use when matching the Connection address.
-            append: Whether to append the subclass to the appropriate `backends`, `interfaces`
-                or `resources` list.
+            remote: Whether the subclass is the client for equipment that is connected to a remote computer.
+            append: Whether to append the subclass to the appropriate `backends`, `interfaces`,
+                `remotes` or `resources` list.
         """
         if not append:
             return
@@ -3332,6 +3802,9 @@ class Interface:
         if backend is not None:
             backends.append(_Backend(cls, backend))
             logger.debug("added backend: %s", cls)
+        elif remote:
+            remotes.append(cls)
+            logger.debug("added remote: %s", cls)
         elif regex is not None:
             interfaces.append(_Interface(cls, regex))
             logger.debug("added interface: %s", cls)
@@ -3410,6 +3883,315 @@ class _Resource:
         return not (self.model and not self.model.search(equipment.model))
 
 
+def _search_fields(equipment: Equipment) -> tuple[str, ...]:  # noqa: C901
+    """Returns the (unique) values of an Equipment item that Register.find() searches."""
+    fields = [
+        " ".join(equipment.keywords),
+        equipment.description,
+        equipment.manufacturer,
+        equipment.model,
+        equipment.serial,
+        equipment.id,
+        equipment.location,
+        equipment.entered_by,
+        equipment.checked_by,
+    ]
+
+    def comments(item: Report | PerformanceCheck) -> None:
+        fields.extend(c.comment for c in item.cvd_equations)
+        fields.extend(e.comment for e in item.equations)
+        fields.extend(f.comment for f in item.files)
+        fields.extend(t.comment for t in item.tables)
+        fields.extend(d.comment for d in item.deserialisers)
+
+    for m in equipment.calibrations:
+        fields.append(m.quantity)
+        for c in m.components:
+            fields.append(c.name)
+            for r in c.reports:
+                fields.extend((r.entered_by, r.checked_by, r.id))
+                comments(r)
+            for pc in c.performance_checks:
+                fields.extend((pc.entered_by, pc.checked_by))
+                comments(pc)
+            fields.extend(a.details for a in c.adjustments)
+            for dr in c.digital_reports:
+                fields.extend((dr.format.value, dr.id, dr.comment))
+
+    for a in equipment.alterations:
+        fields.extend((a.details, a.performed_by))
+
+    for ct in equipment.maintenance.completed:
+        fields.extend((ct.task, ct.performed_by))
+    for pt in equipment.maintenance.planned:
+        fields.extend((pt.task, pt.performed_by))
+
+    qm = equipment.quality_manual
+    if qm.financial.capital_expenditure is not None:
+        fields.append(qm.financial.capital_expenditure.asset_number)
+    fields.extend((qm.service_agent, " ".join(qm.technical_procedures)))
+
+    return tuple(dict.fromkeys(fields))
+
+
+class _Vocabulary:
+    """The words in an inverted index, arranged to find the words that contain a substring."""
+
+    __slots__: tuple[str, ...] = ("reversed", "trigrams", "words")
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """The words in an inverted index, arranged to find the words that contain a substring."""
+        self.words: list[str] = sorted(words)
+        self.reversed: list[str] = sorted(w[::-1] for w in self.words)
+        self.trigrams: dict[str, set[str]] = {}  # the words that contain each sequence of 3 characters
+        for word in self.words:
+            for i in range(len(word) - 2):
+                self.trigrams.setdefault(word[i : i + 3], set()).add(word)
+
+    @staticmethod
+    def _prefixed(words: list[str], prefix: str) -> Iterator[str]:
+        """Yield the words (which must be sorted) that start with `prefix`."""
+        for i in range(bisect_left(words, prefix), len(words)):
+            if not words[i].startswith(prefix):
+                break
+            yield words[i]
+
+    def containing(self, text: str) -> Iterable[str]:
+        """Returns the words that contain `text`."""
+        if len(text) < 3:  # noqa: PLR2004
+            return [w for w in self.words if text in w]
+        sets = sorted((self.trigrams.get(text[i : i + 3], set()) for i in range(len(text) - 2)), key=len)
+        return [w for w in sets[0].intersection(*sets[1:]) if text in w]
+
+    def ending_with(self, suffix: str) -> Iterable[str]:
+        """Returns the words that end with `suffix`."""
+        return [w[::-1] for w in self._prefixed(self.reversed, suffix[::-1])]
+
+    def starting_with(self, prefix: str) -> Iterable[str]:
+        """Returns the words that start with `prefix`."""
+        return self._prefixed(self.words, prefix)
+
+
+class _SearchIndex:
+    """An inverted index of the words in the values that Register.find() searches."""
+
+    __slots__: tuple[str, ...] = ("fields", "folded", "non_ascii", "postings", "vocabularies")
+
+    WORD: re.Pattern[str] = re.compile(r"\w+")
+    METACHARACTERS: re.Pattern[str] = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+    def __init__(self, equipment: Iterable[Equipment]) -> None:
+        """An inverted index of the words in the values that Register.find() searches."""
+        self.fields: list[tuple[str, ...]] = []
+        self.postings: dict[str, set[int]] = {}  # word -> indices of the equipment that contain the word
+        self.folded: dict[str, set[int]] = {}  # same as postings, but the words are lower case
+        self.non_ascii: set[int] = set()  # indices of the equipment that contain non-ASCII characters
+        self.vocabularies: dict[bool, _Vocabulary] = {}  # created when a pattern needs a substring of a word
+
+        for i, e in enumerate(equipment):
+            fields = _search_fields(e)
+            self.fields.append(fields)
+            document = "\n".join(fields)
+            if not document.isascii():
+                self.non_ascii.add(i)
+            for word in set(self.WORD.findall(document)):
+                self.postings.setdefault(word, set()).add(i)
+                self.folded.setdefault(word.lower(), set()).add(i)
+
+    def candidates(self, regex: re.Pattern[str]) -> Iterable[int]:
+        """Returns the indices of the equipment that could match a regular-expression pattern.
+
+        Only a literal pattern (with no flags, other than IGNORECASE) can use the index to reduce
+        the number of candidates, otherwise all equipment are candidates.
+        """
+        pattern = regex.pattern
+        words = self.WORD.findall(pattern)
+        ignore_case = bool(regex.flags & re.IGNORECASE)
+        if (
+            not words
+            or regex.flags & ~(re.IGNORECASE | re.UNICODE)
+            or self.METACHARACTERS.search(pattern) is not None
+            or (ignore_case and not pattern.isascii())
+        ):
+            return range(len(self.fields))
+
+        postings = self.folded if ignore_case else self.postings
+        found: set[int] | None = None
+        for match in self.WORD.finditer(pattern):
+            word = match.group().lower() if ignore_case else match.group()
+            # a word in the pattern is a whole word in a value only if it is delimited by non-word
+            # characters in the pattern, otherwise it may be part of a word (e.g., "Prob" in "Probe")
+            starts, ends = match.start() > 0, match.end() < len(pattern)
+            if starts and ends:
+                keys: Iterable[str] = (word,)
+            else:
+                vocabulary = self.vocabularies.get(ignore_case)
+                if vocabulary is None:
+                    vocabulary = self.vocabularies[ignore_case] = _Vocabulary(postings)
+                if starts:
+                    keys = vocabulary.starting_with(word)
+                elif ends:
+                    keys = vocabulary.ending_with(word)
+                else:
+                    keys = vocabulary.containing(word)
+
+            indices: set[int] = set()
+            for key in keys:
+                indices.update(postings.get(key, ()))
+            found = indices if found is None else found & indices
+            if not found:
+                break
+
+        assert found is not None  # noqa: S101
+        if ignore_case:
+            # case-insensitive matching of non-ASCII characters is not equivalent to str.lower()
+            found |= self.non_ascii
+        return sorted(found)
+
+
+def _latest_indices(groups: NDArray[np.intp], dates: NDArray[np.datetime64], size: int) -> NDArray[np.intp]:
+    """Returns the index of the latest date of each group (-1 if a group does not have a date).
+
+    If dates are equal, the index of the first date is returned.
+    """
+    indices = np.full(size, -1, dtype=np.intp)
+    valid = np.flatnonzero(dates > np.datetime64("1875-05-20"))
+    if valid.size > 0:
+        order = valid[np.lexsort((-valid, dates[valid], groups[valid]))]
+        sorted_groups = groups[order]
+        last = np.append(sorted_groups[1:] != sorted_groups[:-1], True)
+        indices[sorted_groups[last]] = order[last]
+    return indices
+
+
+def _calibration_status(
+    equipment: Iterable[Equipment], date: Literal["issue", "start", "stop"] = "stop"
+) -> tuple[NDArray[np.void], NDArray[np.intp]]:
+    """Returns the calibration status of every component and the index of the equipment of each component."""
+    attribute = {"stop": "measurement_stop_date", "start": "measurement_start_date"}.get(date, "report_issue_date")
+
+    # one row per component
+    rows: list[int] = []
+    ids: list[str] = []
+    quantities: list[str] = []
+    names: list[str] = []
+    intervals: list[float] = []
+
+    # one row per report and per performance check, and the component that it belongs to
+    report_components: list[int] = []
+    report_ids: list[str] = []
+    report_dates: list[_date] = []
+    references: list[_date] = []
+    check_components: list[int] = []
+    check_dates: list[_date] = []
+
+    for i, e in enumerate(equipment):
+        for m in e.calibrations:
+            for c in m.components:
+                component = len(rows)
+                rows.append(i)
+                ids.append(e.id)
+                quantities.append(m.quantity)
+                names.append(c.name)
+                intervals.append(m.calibration_interval)
+                for r in c.reports:
+                    report_components.append(component)
+                    report_ids.append(r.id)
+                    report_dates.append(getattr(r, attribute))
+                    references.append(
+                        r.measurement_stop_date if r.recalibrate_reference == "stop" else r.measurement_start_date
+                    )
+                for pc in c.performance_checks:
+                    check_components.append(component)
+                    check_dates.append(pc.completed_date)
+
+    size = len(rows)
+    interval = np.array(intervals, dtype=np.float64)
+    nat = np.datetime64("NaT", "D")
+
+    dates = np.array(report_dates, dtype="datetime64[D]")
+    latest = _latest_indices(np.array(report_components, dtype=np.intp), dates, size)
+    found = latest >= 0
+    report_date = np.where(found, np.append(dates, nat)[latest], nat)
+    reference = np.where(found, np.append(np.array(references, dtype="datetime64[D]"), nat)[latest], nat)
+    report_id = np.where(found, np.append(np.array(report_ids, dtype=str), "")[latest], "")
+
+    dates = np.array(check_dates, dtype="datetime64[D]")
+    latest = _latest_indices(np.array(check_components, dtype=np.intp), dates, size)
+    check_date = np.where(latest >= 0, np.append(dates, nat)[latest], nat)
+
+    columns: dict[str, NDArray[_Any]] = {
+        "id": np.array(ids, dtype=str),
+        "quantity": np.array(quantities, dtype=str),
+        "name": np.array(names, dtype=str),
+        "calibration_interval": interval,
+        "report_id": report_id.astype(str),
+        "report_date": report_date,
+        "next_calibration_date": _future_dates(reference, interval),
+        "check_date": check_date,
+        "next_check_date": _future_dates(check_date, interval),
+    }
+    status = np.empty(size, dtype=[(k, v.dtype) for k, v in columns.items()])
+    for k, v in columns.items():
+        status[k] = v
+    return status, np.array(rows, dtype=np.intp)
+
+
+class _QueryIndex:
+    """The secondary indexes of the values that Register.query() selects equipment by."""
+
+    __slots__: tuple[str, ...] = ("dates", "exact", "quantities", "rows")
+
+    def __init__(self, equipment: Iterable[Equipment]) -> None:
+        """The secondary indexes of the values that Register.query() selects equipment by."""
+        # field name -> value -> indices of the equipment that have the value
+        self.exact: dict[str, dict[object, set[int]]] = {}
+
+        equipment = list(equipment)
+        for i, e in enumerate(equipment):
+            for name, values in (
+                ("keywords", e.keywords),
+                ("location", (e.location,)),
+                ("manufacturer", (e.manufacturer,)),
+                ("model", (e.model,)),
+                ("quantity", tuple(m.quantity for m in e.calibrations)),
+                ("status", (e.status,)),
+            ):
+                exact = self.exact.setdefault(name, {})
+                for value in values:
+                    exact.setdefault(value, set()).add(i)
+
+        # the next calibration date of each component (sorted) and the equipment index and quantity of each date
+        status, rows = _calibration_status(equipment)
+        dates = status["next_calibration_date"]
+        keep = np.flatnonzero((status["calibration_interval"] > 0) & ~np.isnat(dates))
+        order = keep[np.argsort(dates[keep], kind="stable")]
+        self.dates: NDArray[np.datetime64] = dates[order]
+        self.rows: NDArray[np.intp] = rows[order]
+        self.quantities: NDArray[np.str_] = status["quantity"][order]
+
+    def due(self, start: _date | None, stop: _date | None, quantities: list[str] | None) -> set[int]:
+        """Returns the indices of the equipment that have a component that is due within a date range (inclusive)."""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(start, "D"), side="left"))
+        hi = (
+            len(self.dates)
+            if stop is None
+            else int(np.searchsorted(self.dates, np.datetime64(stop, "D"), side="right"))
+        )
+        rows = self.rows[lo:hi]
+        if quantities is not None:
+            rows = rows[np.isin(self.quantities[lo:hi], quantities)]
+        return set(rows.tolist())
+
+    def select(self, name: str, values: Iterable[object]) -> set[int]:
+        """Returns the indices of the equipment that have any of the values of a field."""
+        exact = self.exact.get(name, {})
+        selected: set[int] = set()
+        for value in values:
+            selected.update(exact.get(value, ()))
+        return selected
+
+
 def _find_interface_class(equipment: Equipment) -> type[Interface]:
     """Find the Interface class for the specified Equipment."""
     assert equipment.connection is not None  # noqa: S101
@@ -3418,6 +4200,10 @@ def _find_interface_class(equipment: Equipment) -> type[Interface]:
         if backend.handles(equipment.connection):
             return backend.cls
 
+    # the interface (or resource) is connected to an EquipmentServer on a remote computer
+    if remotes and equipment.connection.properties.get("remote"):
+        return remotes[-1]
+
     for resource in resources:
         if resource.handles(equipment):
             return resource.cls
@@ -3433,5 +4219,6 @@ def _find_interface_class(equipment: Equipment) -> type[Interface]:
 
 resources: list[_Resource] = []
 backends: list[_Backend] = []
+remotes: list[type[Interface]] = []
 interfaces: list[_Interface] = []
 connections = Connections()
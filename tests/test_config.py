@@ -242,6 +242,22 @@ def test_registers_file() -> None:
     assert str(c.registers["Mass"]) == "Register(team='Mass' (2 equipment))"
 
 
+def test_registers_cache(tmp_path: Path) -> None:
+    text = f"""<?xml version="1.0" encoding="utf-8" ?>
+    <msl>
+        <register cache="{tmp_path}">tests/data/mass</register>
+        <register cache="false">tests/data/light</register>
+    </msl>
+    """
+    c = Config(StringIO(text))
+    assert str(c.registers["Mass"]) == "Register(team='Mass' (3 equipment))"
+    assert str(c.registers["Light"]) == "Register(team='Light' (4 equipment))"
+    assert sorted(p.name.split("-")[0] for p in tmp_path.iterdir()) == ["register", "register2"]
+
+    c = Config(StringIO(text))
+    assert c.registers["Mass"]["MSLE.M.092"].manufacturer == "XYZ"
+
+
 def test_source_types() -> None:
     path = str(Path(__file__).parent / "data" / "config.xml")
     assert Config(path).path == path
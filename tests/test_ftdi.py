@@ -3,6 +3,7 @@ from __future__ import annotations
 # cSpell: ignore VIDPID
 import os
 import sys
+from array import array
 from typing import TYPE_CHECKING
 
 import pytest
@@ -18,6 +19,7 @@ from msl.equipment.interfaces.ftdi import (
     _ftdi_232bm_2232h_baud_to_divisor,  # pyright: ignore[reportPrivateUsage]
     _get_ftdi_divisor,  # pyright: ignore[reportPrivateUsage]
     _maybe_load_ftd2xx,  # pyright: ignore[reportPrivateUsage]
+    _strip_status_bytes,  # pyright: ignore[reportPrivateUsage]
     find_ftd2xx_devices,
     parse_ftdi_address,
 )
@@ -472,6 +474,47 @@ def test_read_write(usb_backend: USBBackend) -> None:  # noqa: PLR0915
             _ = device.read(size=90)
 
 
+def test_strip_status_bytes() -> None:
+    status = bytes([17, 96])
+    data = bytes(range(200))
+    packets = status + data[:62] + status + data[62:124] + status + data[124:130] + bytes(10)
+    buffer = array("B", packets)
+    assert _strip_status_bytes(buffer, len(packets) - 10, 64) == (data[:130], 0)
+    assert _strip_status_bytes(buffer, 128, 64) == (data[:124], 0)
+    assert _strip_status_bytes(buffer, 66, 64) == (data[:62], 0)
+    assert _strip_status_bytes(buffer, 2, 64) == (b"", 0)
+    assert _strip_status_bytes(buffer, 0, 64) == (b"", 0)
+
+    # an error bit in the line-status byte of a packet that has data
+    buffer[65] = 0b1100_0010
+    assert _strip_status_bytes(buffer, 130, 64) == (data[:124], 0b1100_0010)
+
+    # an error bit in the line-status byte of a status-only packet is ignored
+    buffer[65] = 96
+    buffer[129] = 0b1000_0000
+    assert _strip_status_bytes(buffer, 130, 64) == (data[:124], 0)
+
+
+def test_read_multiple_packets_per_transfer(usb_backend: USBBackend) -> None:
+    usb_backend.add_device(1, 2, "x")
+    c = Connection("FTDI::1::2::x", usb_backend=usb_backend, transfer_size=100)
+
+    status = bytes([17, 96])
+    data = bytes(range(256)) * 4
+
+    device: FTDI
+    with c.connect() as device:
+        assert device._transfer_size == 128  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+        usb_backend.add_bulk_response(b"".join(status + data[i : i + 62] for i in range(0, 124, 62)))
+        usb_backend.add_bulk_response(status + data[124:186] + status + data[186:200])
+        assert device.read(size=200, decode=False) == data[:200]
+
+        usb_backend.add_bulk_response(status + data[:62] + bytes([17, 0x80]) + data[62:70])
+        with pytest.raises(MSLConnectionError, match=r"bit mask of the line-status byte is 0b10000000\. Set"):
+            _ = device.read(size=70)
+
+
 def test_write_sio(usb_backend: USBBackend) -> None:
     usb_backend.add_device(1, 2, "x", device_version=FT232A - 1)
     c = Connection("FTDI::1::2::x", usb_backend=usb_backend)
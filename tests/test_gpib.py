@@ -2,22 +2,34 @@ from __future__ import annotations
 
 import os
 import sys
+from ctypes import memmove
+from functools import partial
 from pathlib import Path
+from threading import Event, Thread, local
+from time import sleep
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
 
 from msl.equipment import GPIB, Connection, Equipment, MSLConnectionError
+from msl.equipment.interfaces import gpib
 from msl.equipment.interfaces.gpib import (
+    CMPL,
+    NOADDR,
+    TIMO,
+    GPIBSRQWatcher,
     ParsedGPIBAddress,
     _convert_timeout,  # pyright: ignore[reportPrivateUsage]
     find_listeners,
     parse_gpib_address,
+    read_async_all,
 )
 from msl.equipment.interfaces.message import MSLTimeoutError
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from ctypes import Array, c_char, c_ushort
 
 
 @pytest.fixture
@@ -129,6 +141,109 @@ def test_mock_find_listeners(mock_gpib: None) -> None:
     assert find_listeners(include_sad=True) == ["GPIB0::5::INSTR", "GPIB15::11::INSTR", "GPIB15::11::123::INSTR"]
 
 
+def test_mock_find_listeners_find_lstn(mock_gpib: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert mock_gpib is None
+    assert find_listeners() == ["GPIB0::5::INSTR", "GPIB15::11::INSTR"]  # loads the library, uses ibln
+
+    assert GPIB.gpib_library is not None
+    lib = GPIB.gpib_library.lib
+    with pytest.raises(NotImplementedError):
+        lib.FindLstn(0, None, None, 0)  # the mock library does not export FindLstn
+
+    listeners = {0: [5, 7 | (96 << 8)], 15: [11]}
+    thread_local = local()
+    ibln: list[tuple[int, int, int]] = []
+    original_ibln = lib.ibln
+
+    def find_lstn(board: int, padlist: Array[c_ushort], results: Array[c_ushort], limit: int) -> None:
+        assert padlist[len(padlist) - 1] == NOADDR
+        assert limit == len(results)
+        found = listeners.get(board, [])
+        for i, address in enumerate(found):
+            results[i] = address
+        thread_local.count = len(found)
+
+    def mock_ibln(board: int, pad: int, sad: int, exists: object) -> int:
+        ibln.append((board, pad, sad))
+        result: int = original_ibln(board, pad, sad, exists)
+        return result
+
+    monkeypatch.setattr(lib, "FindLstn", find_lstn)
+    monkeypatch.setattr(lib, "ibcntl", lambda: thread_local.count)
+    monkeypatch.setattr(lib, "ibln", mock_ibln)
+
+    assert find_listeners() == ["GPIB0::5::INSTR", "GPIB15::11::INSTR"]
+    assert not ibln
+
+    # the secondary addresses of a primary listener are checked with ibln
+    assert find_listeners(include_sad=True) == [
+        "GPIB0::5::INSTR",
+        "GPIB0::7::96::INSTR",
+        "GPIB15::11::INSTR",
+        "GPIB15::11::123::INSTR",
+    ]
+    assert sorted({(board, pad) for board, pad, _ in ibln}) == [(0, 5), (15, 11)]
+    assert len(ibln) == 2 * 31
+
+
+def test_mock_find_listeners_cache(mock_gpib: None, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    assert mock_gpib is None
+    cache_file = tmp_path / "gpib.json"
+    monkeypatch.setattr(gpib, "_listeners_cache", {})
+
+    assert find_listeners(cache=cache_file) == ["GPIB0::5::INSTR", "GPIB15::11::INSTR"]
+    assert not cache_file.is_file()  # ttl=0, the cache is not used
+
+    assert GPIB.gpib_library is not None
+    lib = GPIB.gpib_library.lib
+    boards: list[int] = []
+    ibask = lib.ibask
+
+    def mock_ibask(board: int, option: int, value: object) -> int:
+        if option == 0x1:
+            boards.append(board)
+        result: int = ibask(board, option, value)
+        return result
+
+    monkeypatch.setattr(lib, "ibask", mock_ibask)
+
+    # the cache is only kept in memory
+    assert find_listeners(ttl=60) == ["GPIB0::5::INSTR", "GPIB15::11::INSTR"]
+    assert len(boards) == 16
+    assert not cache_file.is_file()
+    assert find_listeners(ttl=60) == ["GPIB0::5::INSTR", "GPIB15::11::INSTR"]
+    assert len(boards) == 16
+
+    # the cache is also kept in a file
+    monkeypatch.setattr(gpib, "_listeners_cache", {})
+    assert find_listeners(ttl=60, cache=cache_file) == ["GPIB0::5::INSTR", "GPIB15::11::INSTR"]
+    assert len(boards) == 32
+    assert cache_file.is_file()
+
+    # use the cache file (e.g., from a previous process)
+    monkeypatch.setattr(gpib, "_listeners_cache", {})
+    assert find_listeners(ttl=60, cache=cache_file) == ["GPIB0::5::INSTR", "GPIB15::11::INSTR"]
+    assert len(boards) == 32
+
+    # without the cache file, the bus is scanned again
+    monkeypatch.setattr(gpib, "_listeners_cache", {})
+    assert find_listeners(ttl=60) == ["GPIB0::5::INSTR", "GPIB15::11::INSTR"]
+    assert len(boards) == 48
+
+    # include_sad is cached separately
+    assert find_listeners(include_sad=True, ttl=60) == [
+        "GPIB0::5::INSTR",
+        "GPIB15::11::INSTR",
+        "GPIB15::11::123::INSTR",
+    ]
+    assert len(boards) == 64
+
+    # the cache has expired
+    sleep(0.01)
+    assert find_listeners(ttl=0.001, cache=cache_file) == ["GPIB0::5::INSTR", "GPIB15::11::INSTR"]
+    assert len(boards) == 80
+
+
 def test_mock_read_write(mock_gpib: None) -> None:
     assert mock_gpib is None
 
@@ -229,7 +344,7 @@ def test_mock_logging(mock_gpib: None, caplog: pytest.LogCaptureFixture) -> None
     # version() tested above
     assert dev.wait(0) == 32
     assert dev.wait_for_srq() == 32
-    assert dev.write_async(b"foo") == 34
+    assert dev.write_async(b"foo").result() == 10
     dev.disconnect()
     dev.disconnect()  # multiple times is ok and only logs "Disconnected from ..." once
     dev.disconnect()
@@ -238,6 +353,199 @@ def test_mock_logging(mock_gpib: None, caplog: pytest.LogCaptureFixture) -> None
     assert caplog.messages[-1] == "Disconnected from GPIB<|| at GPIB::5>"
 
 
+def test_mock_srq_callback(mock_gpib: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert mock_gpib is None
+    monkeypatch.setattr(GPIB, "_srq_watchers", {})
+
+    a: GPIB = Connection("GPIB::5").connect()
+    b: GPIB = Connection("GPIB::6").connect()
+
+    srq = Event()
+    ibwait: list[int] = []
+
+    def wait(mask: int, *, handle: int | None = None) -> int:
+        ibwait.append(mask)
+        assert handle == 0  # board index
+        if not srq.wait(0.05):
+            raise MSLTimeoutError(a, "no SRQ")
+        return 0x1000  # SRQI
+
+    def serial_poll_b() -> int:
+        srq.clear()  # the SRQ line remains asserted until the device that requested service is serial polled
+        return 0x50
+
+    for dev in (a, b):
+        monkeypatch.setattr(dev, "wait", wait)
+    monkeypatch.setattr(a, "serial_poll", partial(int, 0))
+    monkeypatch.setattr(b, "serial_poll", serial_poll_b)
+
+    received: list[tuple[str, int]] = []
+    done = Event()
+
+    def callback_a(status: int) -> None:
+        received.append(("a", status))
+
+    def callback_b(status: int) -> None:
+        received.append(("b", status))
+        b.remove_srq_callback(callback_b)
+        done.set()
+
+    a.add_srq_callback(callback_a)
+    b.add_srq_callback(callback_b)
+    watcher = GPIB._srq_watchers[0]  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert isinstance(watcher, GPIBSRQWatcher)
+    assert watcher.board == 0
+    assert watcher.devices == [a, b]
+
+    srq.set()
+    assert done.wait(5)
+    assert received == [("b", 0x50)]  # only b requested service
+    assert watcher.devices == [a]
+    assert ibwait[0] == 0x1000 | TIMO
+
+    # disconnecting removes the callbacks and the background thread stops
+    a.disconnect()
+    assert watcher.devices == []
+    thread = watcher._thread  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    if thread is not None:
+        thread.join(5)
+        assert not thread.is_alive()
+    b.disconnect()
+
+
+def test_mock_read_async(mock_gpib: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert mock_gpib is None
+    a: GPIB = Connection("GPIB::5").connect()
+    b: GPIB = Connection("GPIB::good").connect()
+    assert a.handle == 3
+    assert b.handle == 2
+
+    responses = {3: np.array([1.5, -2.0]).tobytes(), 2: np.array([3.25]).tobytes()}
+    started: list[int] = []
+    written: list[bytes] = []
+    masks: list[int] = []
+    count: list[int] = []
+
+    def ibrda(handle: int, buffer: Array[c_char], size: int) -> int:
+        data = responses[handle]
+        assert size >= len(data)
+        _ = memmove(buffer, data, len(data))
+        started.append(handle)
+        count.append(len(data))
+        return 0
+
+    def ibwrta(handle: int, message: bytes, size: int) -> int:
+        assert handle in responses
+        written.append(message[:size])
+        count.append(size)
+        return 0
+
+    def ibwait(handle: int, mask: int) -> int:
+        assert handle in responses
+        masks.append(mask)
+        return CMPL
+
+    lib = a._lib  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    monkeypatch.setattr(lib, "ibrda", ibrda)
+    monkeypatch.setattr(lib, "ibwrta", ibwrta)
+    monkeypatch.setattr(lib, "ibwait", ibwait)
+    monkeypatch.setattr(lib, "ibcntl", lambda: count.pop(0))
+
+    # read directly into a numpy array
+    buffer = np.zeros(4)
+    assert a.read_async(buffer).result() == 16
+    assert buffer.tolist() == [1.5, -2.0, 0.0, 0.0]
+    assert masks == [CMPL | TIMO]
+
+    # overlapped write then read of multiple devices
+    buffers = [np.zeros(2), np.zeros(2)]
+    assert read_async_all([a, b], buffers, message="READ?") == [16, 8]
+    assert written == [b"READ?\r\n", b"READ?\r\n"]
+    assert sorted(started) == [2, 3, 3]
+    assert buffers[0].tolist() == [1.5, -2.0]
+    assert buffers[1].tolist() == [3.25, 0.0]
+
+    with pytest.raises(ValueError, match=r"number of devices \(2\) and buffers \(1\)"):
+        _ = read_async_all([a, b], [buffer])
+
+    with pytest.raises(TypeError):
+        _ = a.read_async(b"read-only")
+
+    # the I/O operation is aborted if it times out
+    stopped: list[int] = []
+
+    def ibwait_timeout(*_: int) -> int:
+        raise MSLTimeoutError(a)
+
+    monkeypatch.setattr(lib, "ibwait", ibwait_timeout)
+    monkeypatch.setattr(lib, "ibstop", stopped.append)
+    with pytest.raises(MSLTimeoutError):
+        _ = read_async_all([a], [bytearray(16)])
+    assert stopped == [3]
+
+
+def test_mock_read_async_all_timeout(mock_gpib: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert mock_gpib is None
+    a: GPIB = Connection("GPIB::5").connect()
+    b: GPIB = Connection("GPIB::good").connect()
+    assert a.handle == 3
+    assert b.handle == 2
+
+    # device a completes immediately, the transfer of device b keeps writing to the buffer until it is stopped
+    stopped: dict[int, Event] = {3: Event(), 2: Event()}
+    threads: list[Thread] = []
+
+    def ibrda(handle: int, buffer: Array[c_char], size: int) -> int:
+        if handle == 3:
+            _ = memmove(buffer, b"\x01" * size, size)
+            return 0
+
+        def transfer() -> None:
+            value = 0
+            while not stopped[handle].wait(0.001):
+                value = (value + 1) % 256
+                _ = memmove(buffer, bytes([value]) * size, size)
+
+        thread = Thread(target=transfer, daemon=True)
+        thread.start()
+        threads.append(thread)
+        return 0
+
+    def ibwait(handle: int, _: int) -> int:
+        if handle == 2:
+            assert stopped[2].wait(5)
+        return CMPL
+
+    def ibstop(handle: int) -> int:
+        stopped[handle].set()
+        return 0
+
+    lib = a._lib  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    monkeypatch.setattr(lib, "ibrda", ibrda)
+    monkeypatch.setattr(lib, "ibwait", ibwait)
+    monkeypatch.setattr(lib, "ibstop", ibstop)
+    monkeypatch.setattr(lib, "ibcntl", lambda: 8)
+
+    buffers = [np.zeros(8, dtype=np.uint8), np.zeros(8, dtype=np.uint8)]
+    with pytest.raises(TimeoutError, match=r"did not complete after 0.1 seconds"):
+        _ = read_async_all([a, b], buffers, timeout=0.1)
+
+    # only the transfer that was still in progress is aborted, and the buffer is no longer written to
+    assert stopped[2].is_set()
+    assert not stopped[3].is_set()
+    for thread in threads:
+        thread.join(5)
+        assert not thread.is_alive()
+    snapshot = buffers[1].copy()
+    sleep(0.05)
+    assert np.array_equal(buffers[1], snapshot)
+    assert buffers[0].tolist() == [1] * 8
+
+    # the handle of device b can be used again
+    stopped[2].set()  # the next transfer completes immediately (ibwait does not block)
+    assert b.read_async(buffers[1]).result() == 8
+
+
 def test_no_connection_instance() -> None:
     with pytest.raises(TypeError, match=r"A Connection is not associated"):
         _ = GPIB(Equipment())
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 # pyright: reportUnusedVariable=false
+import socket
+import time
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
 
 from msl.equipment import Connection, Equipment, Message, MSLConnectionError, MultiInterface
+from msl.equipment.interfaces.message import Deadline
 
 if TYPE_CHECKING:
     from conftest import TCPServer
@@ -234,3 +237,37 @@ def test_multi_interface_read_write(tcp_server: type[TCPServer]) -> None:
 def test_multi_interface_connection_error() -> None:
     with pytest.raises(MSLConnectionError, match=r"MultiInterface<ABC|123|X at COM254>\ncould not open port"):
         _ = MultiInterface(Equipment(connection=Connection("COM254"), manufacturer="ABC", model="123", serial="X"))
+
+
+def test_deadline() -> None:
+    d = Deadline(None)
+    assert d.timeout is None
+    assert not d.expired
+    assert d.remaining() is None
+    assert d.remaining_ms() == 0  # libusb, wait forever
+
+    assert not Deadline(0.1).expired
+    d = Deadline(0.1)
+    assert d.timeout == 0.1
+    remaining = d.remaining()
+    assert remaining is not None
+    assert 0 < remaining <= 0.1
+    assert 1 <= d.remaining_ms() <= 100
+    assert repr(d).startswith("<Deadline timeout=0.1 remaining=")
+
+    time.sleep(0.11)
+    assert d.expired
+    assert d.remaining() == 0
+    assert d.remaining_ms() == 1  # libusb considers 0 as no timeout
+
+
+def test_deadline_wait_readable() -> None:
+    a, b = socket.socketpair()
+    with a, b:
+        t0 = time.monotonic()
+        assert not Deadline(0.1).wait_readable(a)
+        assert time.monotonic() - t0 >= 0.09
+
+        _ = b.send(b"x")
+        assert Deadline(0.1).wait_readable(a)
+        assert Deadline(None).wait_readable(a)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import socket
+import time
+from threading import Thread
+from typing import TYPE_CHECKING
+
+from msl.equipment import Connection, MSLConnectionError, MSLTimeoutError, Prologix, Socket
+from msl.equipment.interfaces.multiplexer import SocketMultiplexer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import pytest
+
+
+class LineServer:
+    """A TCP server that replies to each line after a delay."""
+
+    def __init__(self, reply: Callable[[bytes], bytes | None], delay: float = 0) -> None:
+        """A TCP server that replies to each line after a delay."""
+        self.reply: Callable[[bytes], bytes | None] = reply
+        self.delay: float = delay
+        self.sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(1)
+        self.host: str = self.sock.getsockname()[0]
+        self.port: int = self.sock.getsockname()[1]
+        self.thread: Thread = Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self) -> None:
+        conn, _ = self.sock.accept()
+        with conn, conn.makefile("rb") as f:
+            for line in f:
+                reply = self.reply(line.rstrip(b"\n"))
+                if reply is not None:
+                    time.sleep(self.delay)
+                    conn.sendall(reply)
+
+    def close(self) -> None:
+        """Close the listening socket."""
+        self.sock.close()
+
+
+def test_query_all() -> None:
+    delay = 0.2
+    servers = [LineServer(lambda line: line + b"\n", delay=delay) for _ in range(10)]
+    silent = LineServer(lambda _: None)
+    servers.append(silent)
+
+    devices: list[Socket] = [
+        Connection(f"TCP::{s.host}::{s.port}", termination=b"\n", timeout=1).connect() for s in servers
+    ]
+    try:
+        with SocketMultiplexer(devices) as mux:
+            assert len(mux.devices) == len(devices)
+            assert repr(mux) == f"<SocketMultiplexer devices={len(devices)}>"
+
+            t0 = time.monotonic()
+            replies = mux.query_all({d: f"MEAS{i}?" for i, d in enumerate(devices)}, timeout=delay * 3)
+            elapsed = time.monotonic() - t0
+
+            # the replies arrive concurrently, so the total time is not the sum of the delays
+            assert elapsed < delay * 5
+            assert list(replies) == devices
+            for i, device in enumerate(devices[:-1]):
+                assert replies[device] == f"MEAS{i}?\n"
+            assert isinstance(replies[devices[-1]], MSLTimeoutError)
+
+            # the same message to all devices, as bytes
+            mux.remove(devices[-1])
+            replies = mux.query_all(b"IDN?", decode=False)
+            assert len(replies) == len(devices) - 1
+            assert all(r == b"IDN?\n" for r in replies.values())
+
+            # the devices can still be used directly
+            assert devices[0].query("direct") == "direct\n"
+    finally:
+        for device in devices:
+            device.disconnect()
+        for server in servers:
+            server.close()
+
+
+def test_query_all_closed() -> None:
+    server = LineServer(lambda _: None)
+    device: Socket = Connection(f"TCP::{server.host}::{server.port}", termination=b"\n", timeout=1).connect()
+    server.thread.join(0.1)
+    mux = SocketMultiplexer([device])
+    try:
+        device.socket.shutdown(socket.SHUT_RD)  # recv() returns b"" as if the peer closed the connection
+        replies = mux.query_all("MEAS?")
+        error = replies[device]
+        assert isinstance(error, MSLConnectionError)
+        assert "closed by the peer" in str(error)
+    finally:
+        mux.close()
+        device.disconnect()
+        server.close()
+
+
+def test_query_all_prologix(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Prologix, "_controllers", {})
+    monkeypatch.setattr(Prologix, "_schedulers", {})
+
+    # the Prologix Controller only sends a reply after "++read eoi"
+    server = LineServer(lambda line: b"GPIB reply\n" if line == b"++read eoi" else None, delay=0.1)
+    echo = LineServer(lambda line: line + b"\n", delay=0.1)
+    pro: Prologix = Connection(f"Prologix::{server.host}::{server.port}::6", timeout=1).connect()
+    dev: Socket = Connection(f"TCP::{echo.host}::{echo.port}", termination=b"\n", timeout=1).connect()
+    try:
+        mux = SocketMultiplexer([pro, dev])
+        replies = mux.query_all({pro: "MEAS?", dev: "MEAS?"})
+        assert replies == {pro: "GPIB reply\n", dev: "MEAS?\n"}
+        mux.close()
+    finally:
+        dev.disconnect()
+        pro.disconnect()
+        echo.close()
+        server.close()
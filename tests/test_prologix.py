@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import socket
+from functools import partial
+from threading import Event, Thread
+from time import sleep
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
 
 from msl.equipment import Connection, Equipment, Message, MSLConnectionError, Prologix
-from msl.equipment.interfaces.prologix import find_prologix, parse_prologix_address
+from msl.equipment.interfaces import prologix
+from msl.equipment.interfaces.prologix import PrologixScheduler, find_prologix, parse_prologix_address
+from msl.equipment.utils import to_bytes
 
 if TYPE_CHECKING:
     from conftest import TCPServer
@@ -78,6 +85,8 @@ def test_connection_message_attributes() -> None:
         assert attr in dir_p
 
     ignore = {
+        "add_srq_callback",
+        "address",
         "clear",
         "controller",
         "escape_characters",
@@ -87,12 +96,15 @@ def test_connection_message_attributes() -> None:
         "pad",
         "prologix_help",
         "remote_enable",
+        "remove_srq_callback",
         "reset_controller",
         "sad",
+        "scheduler",
         "serial_poll",
         "set_eot_char",
         "set_eot_enable",
         "set_plus_plus_read_char",
+        "settings",
         "trigger",
         "wait",
         "wait_for_srq",
@@ -330,6 +342,261 @@ def test_messages(tcp_server: type[TCPServer]) -> None:  # noqa: PLR0915
             _ = pro.read()
 
 
+def test_write_large_data(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Prologix, "_controllers", {})
+    monkeypatch.setattr(Prologix, "_schedulers", {})
+
+    # a mock Prologix Controller that only receives bytes
+    received = bytearray()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(1)
+
+    def receive() -> None:
+        conn, _ = sock.accept()
+        with conn:
+            while True:
+                data = conn.recv(65536)
+                if not data:
+                    break
+                received.extend(data)
+
+    thread = Thread(target=receive, daemon=True)
+    thread.start()
+
+    host, port = sock.getsockname()
+    pro: Prologix = Connection(f"Prologix::{host}::{port}::6", write_termination="\r\n").connect()
+
+    sizes: list[int] = []
+    write = pro.controller._write  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    def counting_write(message: bytes) -> int:
+        sizes.append(len(message))
+        return write(message)
+
+    monkeypatch.setattr(pro.controller, "_write", counting_write)
+
+    # every byte value, so that all of LF, CR, ESC and + must be escaped
+    values = np.tile(np.arange(256, dtype=np.uint8), 4096)
+    n = pro.write(b"WAVE ", data=values, dtype=np.uint8)
+    pro.controller.disconnect()
+    thread.join(5)
+    sock.close()
+
+    expected = prologix._escape(b"WAVE " + to_bytes(values, fmt="ieee", dtype=np.uint8) + b"\r\n") + b"\n"  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert n == len(expected)
+    assert received.endswith(expected)
+    assert len(sizes) > 1
+    assert max(sizes) <= 2 * prologix._WRITE_CHUNK_SIZE + 1  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert sum(sizes) == n
+
+
 def test_no_connection_instance() -> None:
     with pytest.raises(TypeError, match=r"A Connection is not associated"):
         _ = Prologix(Equipment())
+
+
+def test_scheduler(tcp_server: type[TCPServer], monkeypatch: pytest.MonkeyPatch) -> None:  # noqa: C901, PLR0915
+    monkeypatch.setattr(Prologix, "_controllers", {})
+    monkeypatch.setattr(Prologix, "_schedulers", {})
+
+    with tcp_server() as server:
+        a: Prologix = Connection(f"Prologix::{server.host}::{server.port}::1", timeout=1).connect()
+        b: Prologix = Connection(f"Prologix::{server.host}::{server.port}::2", timeout=1).connect()
+        c: Prologix = Connection(f"Prologix::{server.host}::{server.port}::3::96", timeout=1, eoi=False).connect()
+        controller = a.controller
+        try:
+            assert a.scheduler is b.scheduler
+            assert a.scheduler is c.scheduler
+            assert isinstance(a.scheduler, PrologixScheduler)
+            assert repr(a.scheduler) == f"PrologixScheduler<Prologix<{server.host}>>"
+            assert a.scheduler.pending == 0
+            assert a.scheduler.controller is controller
+            assert a.scheduler.devices == [a, b, c]
+            assert a.address == b"++addr 1\n"
+            assert c.address == b"++addr 3 96\n"
+            assert c.settings == {"addr": b"++addr 3 96\n", "eoi": b"++eoi 0\n", "eos": b"++eos 3\n"}
+
+            expected = [
+                "++mode 1",
+                "++auto 0",
+                "++eoi 1",
+                "++eos 3",
+                "++eot_char 0",
+                "++eot_enable 0",
+                "++read_tmo_ms 1000",
+                "++addr 1",
+                # ++eoi and ++eos are not sent again for b since the values have not changed
+                "++mode 1",
+                "++auto 0",
+                "++eot_char 0",
+                "++eot_enable 0",
+                "++read_tmo_ms 1000",
+                "++addr 2",
+                # c does not use EOI
+                "++mode 1",
+                "++auto 0",
+                "++eoi 0",
+                "++eot_char 0",
+                "++eot_enable 0",
+                "++read_tmo_ms 1000",
+                "++addr 3 96",
+            ]
+            for line in expected:
+                assert controller.read() == line + "\n"
+
+            for device in (a, b, c):
+                device.write_termination = None
+
+            # block the scheduler so that the requests from all devices accumulate in the queue
+            event = Event()
+            blocker = a.scheduler.submit(a, event.wait, select=False)
+            while not blocker.running():
+                sleep(0.01)
+            for i in range(3):
+                for device, prefix in ((a, "a"), (b, "b"), (c, "c")):
+                    _ = device.scheduler.submit(device, partial(device.write, f"{prefix}{i}"))
+            assert a.scheduler.pending == 9
+            event.set()
+            assert blocker.result() is True
+
+            # requests are grouped by GPIB address and the order of the requests for each device is preserved
+            expected = [
+                "++addr 1",
+                "++eoi 1",
+                "a0",
+                "a1",
+                "a2",
+                "++addr 2",
+                "b0",
+                "b1",
+                "b2",
+                "++addr 3 96",
+                "++eoi 0",
+                "c0",
+                "c1",
+                "c2",
+            ]
+            for line in expected:
+                assert controller.read() == line + "\n"
+
+            # at most max_batch requests are executed for a device while other devices are waiting
+            a.scheduler.max_batch = 2
+            event.clear()
+            blocker = a.scheduler.submit(c, event.wait, select=False)
+            while not blocker.running():
+                sleep(0.01)
+            for i in range(4):
+                _ = a.scheduler.submit(a, partial(a.write, f"a{i}"))
+            for i in range(2):
+                _ = b.scheduler.submit(b, partial(b.write, f"b{i}"))
+            event.set()
+            assert blocker.result() is True
+            _ = a.scheduler.submit(a, lambda: None, select=False).result()  # wait for the queue to be empty
+
+            expected = [
+                "++addr 1",
+                "++eoi 1",
+                "a0",
+                "a1",
+                "++addr 2",
+                "b0",
+                "b1",
+                "++addr 1",
+                "a2",
+                "a3",
+            ]
+            for line in expected:
+                assert controller.read() == line + "\n"
+
+            # an exception is raised in the thread that is waiting for the result
+            with pytest.raises(ZeroDivisionError):
+                _ = a.scheduler.run(a, lambda: 1 / 0)
+
+            # writing ++eoi is remembered for the device
+            assert a.write("++eoi 0") == len("++eoi 0\n")
+            assert controller.read() == "++eoi 0\n"
+            assert a.write("OK") == len("OK\n")
+            assert controller.read() == "OK\n"
+            assert b.write("OK") == len("OK\n")
+            assert controller.read() == "++addr 2\n"
+            assert controller.read() == "++eoi 1\n"
+            assert controller.read() == "OK\n"
+
+        finally:
+            _ = controller.write(b"SHUTDOWN")
+
+        for device in (a, b, c):
+            device.disconnect()
+            with pytest.raises(MSLConnectionError, match=r"Disconnected from Prologix GPIB device"):
+                _ = device.scheduler.submit(device, lambda: None)
+
+
+def test_srq_watcher(tcp_server: type[TCPServer], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Prologix, "_controllers", {})
+    monkeypatch.setattr(Prologix, "_schedulers", {})
+
+    with tcp_server() as server:
+        a: Prologix = Connection(f"Prologix::{server.host}::{server.port}::1", timeout=1).connect()
+        b: Prologix = Connection(f"Prologix::{server.host}::{server.port}::2", timeout=1).connect()
+        controller = a.controller
+        try:
+            for _ in range(14):  # the ++ messages that were written when a and b were created
+                _ = controller.read()
+
+            watcher = a.scheduler.srq_watcher
+            assert watcher is b.scheduler.srq_watcher
+            assert a.scheduler.devices == [a, b]
+
+            server.add_requests_responses({b"++srq\n": b"0\n", b"++spoll 1\n": b"0\n", b"++spoll 2\n": b"80\n"})
+
+            # all waiting threads are woken up by the same service request
+            results: dict[str, int] = {}
+
+            def wait(device: Prologix, name: str) -> None:
+                results[name] = device.wait_for_srq(timeout=5)
+
+            threads = [Thread(target=wait, args=(a, "a")), Thread(target=wait, args=(b, "b"))]
+            for t in threads:
+                t.start()
+            while len(watcher._waiters) < 2:  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+                sleep(0.01)
+            server.add_requests_responses({b"++srq\n": b"1\n"})
+            for t in threads:
+                t.join()
+            assert results == {"a": 0, "b": 80}
+
+            # the callback is only called for the device that requested service
+            server.add_requests_responses({b"++srq\n": b"0\n"})
+            event = Event()
+            statuses: list[int] = []
+
+            def callback(status: int) -> None:
+                statuses.append(status)
+                b.remove_srq_callback(callback)
+                # serial polling the device clears its service request
+                server.add_requests_responses({b"++srq\n": b"0\n"})
+                event.set()
+
+            def not_called(status: int) -> None:
+                statuses.append(-status)
+
+            a.add_srq_callback(not_called)
+            b.add_srq_callback(callback)
+            sleep(0.1)
+            assert not statuses
+            server.add_requests_responses({b"++srq\n": b"1\n"})
+            assert event.wait(5)
+            a.remove_srq_callback()
+            assert statuses == [80]
+
+            with pytest.raises(TimeoutError, match=r"0.1 seconds"):
+                _ = a.wait_for_srq(timeout=0.1)
+
+        finally:
+            _ = controller.write(b"SHUTDOWN")
+
+        a.disconnect()
+        assert a.scheduler.devices == [b]
+        with pytest.raises(MSLConnectionError, match=r"Disconnected from Prologix GPIB device"):
+            _ = a.wait_for_srq()
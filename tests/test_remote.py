@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import enum
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from msl.equipment import (
+    Connection,
+    Equipment,
+    EquipmentServer,
+    Interface,
+    MSLConnectionError,
+    MSLTimeoutError,
+    RemoteEquipment,
+)
+from msl.equipment.interfaces.remote import (
+    RemoteTimeoutError,
+    _decode,  # pyright: ignore[reportPrivateUsage]
+    _encode,  # pyright: ignore[reportPrivateUsage]
+)
+
+if TYPE_CHECKING:
+    from msl.equipment.typing import ZMQBuffer
+
+
+class Mode(enum.Enum):
+    """The output mode of a power supply."""
+
+    CV = "constant voltage"
+    CC = "constant current"
+
+
+class Supply(Interface, append=False):
+    """A power supply that is connected to the server."""
+
+    def __init__(self, equipment: Equipment) -> None:
+        """A power supply that is connected to the server."""
+        super().__init__(equipment)
+        self.label: str = "PSU"
+        self.calls: list[str] = []
+        self._mode: Mode = Mode.CV
+        self._voltages: dict[int, float] = {1: 0.0, 2: 0.0}
+
+    def array(self, n: int) -> np.ndarray[tuple[int], np.dtype[np.float64]]:
+        """Returns an array."""
+        return np.arange(n, dtype=float)
+
+    def echo(self, *args: object, **kwargs: object) -> tuple[tuple[object, ...], dict[str, object]]:
+        """Returns the arguments."""
+        return args, kwargs
+
+    def fail(self, message: str) -> None:
+        """Raises an exception."""
+        self.calls.append("fail")
+        raise ValueError(message)
+
+    def get_voltage(self, channel: int) -> float:
+        """Returns the voltage of a channel."""
+        self.calls.append(f"get_voltage({channel})")
+        return self._voltages[channel]
+
+    def lost(self) -> None:
+        """Raises an MSLConnectionError."""
+        raise MSLConnectionError(self, "Lost the connection")
+
+    @property
+    def mode(self) -> Mode:
+        """The output mode."""
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: Mode) -> None:
+        self._mode = Mode(value)
+
+    def set_voltage(self, channel: int, value: float) -> None:
+        """Sets the voltage of a channel."""
+        self.calls.append(f"set_voltage({channel}, {value})")
+        time.sleep(0.01)
+        self._voltages[channel] = value
+
+    def slow(self, seconds: float) -> float:
+        """Returns after a delay."""
+        time.sleep(seconds)
+        return seconds
+
+    def unserializable(self) -> object:
+        """Returns an object that cannot be serialized."""
+        return object()
+
+
+class Server:
+    """Run an EquipmentServer in a thread."""
+
+    def __init__(self, **kwargs: object) -> None:
+        """Run an EquipmentServer in a thread."""
+        self.supply: Supply = Supply(Equipment(connection=Connection("Supply")))
+        self.server: EquipmentServer = EquipmentServer(self.supply, host="127.0.0.1", **kwargs)  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+        self.thread: threading.Thread = threading.Thread(target=self.server.start, daemon=True, kwargs={"info": False})
+        self.thread.start()
+        while not self.server.port:
+            time.sleep(0.01)
+
+    def connect(self) -> RemoteEquipment:
+        """Connect a client to the server."""
+        remote: RemoteEquipment = Connection(f"ZMQ::127.0.0.1::{self.server.port}", remote=True, timeout=5).connect()
+        return remote
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self.server.shutdown_server()
+        self.thread.join()
+
+
+def test_encode_decode() -> None:
+    obj: tuple[object, ...] = (
+        None,
+        True,
+        False,
+        -1,
+        1 << 70,
+        -(1 << 63),
+        1.5,
+        2 - 3j,
+        "\N{GREEK SMALL LETTER MU}s",
+        b"\x00\x01",
+        bytearray(b"ab"),
+        [1, [2, (3,)]],
+        {"a": 1, 2: None},
+        np.float32(0.5),
+        np.bool_(True),  # noqa: FBT003
+        Mode.CC,
+        [],
+        (),
+        {},
+    )
+    out = bytearray()
+    frames: list[ZMQBuffer] = []
+    _encode(obj, out, frames)
+    assert not frames
+    assert _decode(out, frames) == (
+        None,
+        True,
+        False,
+        -1,
+        1 << 70,
+        -(1 << 63),
+        1.5,
+        2 - 3j,
+        "\N{GREEK SMALL LETTER MU}s",
+        b"\x00\x01",
+        b"ab",
+        [1, [2, (3,)]],
+        {"a": 1, 2: None},
+        0.5,
+        True,
+        "constant current",
+        [],
+        (),
+        {},
+    )
+
+    out = bytearray()
+    _encode([np.arange(3), "x", np.ones((2, 2))], out, frames)
+    assert len(frames) == 4
+    a, x, b = _decode(out, frames)
+    assert np.array_equal(a, [0, 1, 2])
+    assert x == "x"
+    assert np.array_equal(b, np.ones((2, 2)))
+
+    with pytest.raises(TypeError, match=r"Cannot serialize an object of type 'object'"):
+        _encode([object()], bytearray(), [])
+
+    with pytest.raises(ValueError, match=r"Invalid type code 'z'"):
+        _ = _decode(b"z", [])
+
+
+def test_remote_equipment() -> None:  # noqa: PLR0915
+    server = Server()
+    remote = server.connect()
+    try:
+        assert isinstance(remote, RemoteEquipment)
+        assert str(remote) == "RemoteEquipment<||>"
+        assert {"array", "calls", "echo", "get_voltage", "label", "mode", "set_voltage"}.issubset(dir(remote))
+        assert "disconnect" in dir(remote)  # the local method
+
+        # methods
+        assert remote.get_voltage(1) == 0.0
+        assert remote.set_voltage(1, 5.5) is None
+        assert remote.get_voltage(1) == 5.5
+        assert remote.echo(1, "a", b"b", key=[1.5, None]) == ((1, "a", b"b"), {"key": [1.5, None]})
+        assert remote.call("get_voltage", 1) == 5.5
+        assert remote.get_voltage.__name__ == "get_voltage"
+
+        # attributes and properties
+        assert remote.label == "PSU"
+        assert remote.mode == "constant voltage"
+        remote.mode = "constant current"
+        assert remote.mode == "constant current"
+        assert server.supply.mode is Mode.CC
+        remote.label = "Supply"
+        assert server.supply.label == "Supply"
+
+        # a numpy array
+        array = remote.array(1000)
+        assert isinstance(array, np.ndarray)
+        assert np.array_equal(array, np.arange(1000))
+
+        # exceptions
+        with pytest.raises(ValueError, match=r"^oops$"):
+            remote.fail("oops")
+        with pytest.raises(MSLConnectionError, match=r"Lost the connection"):
+            remote.lost()
+        with pytest.raises(TypeError, match=r"Cannot serialize an object of type 'object'"):
+            remote.unserializable()
+        with pytest.raises(KeyError):
+            remote.get_voltage(3)
+        with pytest.raises(AttributeError, match=r"'RemoteEquipment' object has no attribute 'invalid'"):
+            _ = remote.invalid
+        with pytest.raises(AttributeError, match=r"'Supply' object has no attribute 'disconnect' that a client"):
+            remote.call("disconnect")
+        with pytest.raises(AttributeError, match=r"'Supply' object has no attribute '_voltages' that a client"):
+            remote.call("_voltages")
+
+        # the connection is still usable after an exception
+        assert remote.get_voltage(1) == 5.5
+
+        # a batch of calls in one round trip
+        server.supply.calls.clear()
+        batch = remote.batch()
+        batch.set_voltage(2, 1.2)
+        batch.get_voltage(2)
+        batch.get("label")
+        batch.set("label", "PSU")
+        batch.call("get_voltage", 1)
+        assert len(batch) == 5
+        assert batch.execute() == [None, 1.2, "Supply", None, 5.5]
+        assert len(batch) == 0
+        assert server.supply.calls == ["set_voltage(2, 1.2)", "get_voltage(2)", "get_voltage(1)"]
+        assert batch.execute() == []
+        with pytest.raises(AttributeError, match=r"no remote method 'label'"):
+            batch.label()
+
+        # the remaining calls in a batch are not executed after an exception
+        server.supply.calls.clear()
+        batch.get_voltage(1)
+        batch.fail("batch")
+        batch.get_voltage(2)
+        with pytest.raises(ValueError, match=r"^batch$"):
+            _ = batch.execute()
+        assert server.supply.calls == ["get_voltage(1)", "fail"]
+
+        # pipelining
+        results = [remote.submit("set_voltage", 1, float(i)) for i in range(10)]
+        results.append(remote.submit("get_voltage", 1))
+        results.append(batch.submit())
+        assert not results[-1].done()
+        assert results[-2].result() == 9.0
+        assert all(r.done() for r in results[:-1])
+        assert results[-1].result() == []
+        assert all(r.result() is None for r in results[:10])
+    finally:
+        remote.disconnect()
+        remote.disconnect()
+        server.stop()
+
+    with pytest.raises(MSLConnectionError, match=r"The connection to the server is closed"):
+        _ = remote.get_voltage(1)
+
+
+def test_remote_equipment_methods() -> None:
+    with pytest.raises(AttributeError, match=r"'Supply' object has no attribute 'invalid'"):
+        _ = EquipmentServer(Supply(Equipment(connection=Connection("Supply"))), methods=["invalid"])
+
+    server = Server(methods=["get_voltage", "label"])
+    remote = server.connect()
+    try:
+        assert remote.get_voltage(2) == 0.0
+        assert remote.label == "PSU"
+        with pytest.raises(AttributeError, match=r"'RemoteEquipment' object has no attribute 'set_voltage'"):
+            remote.set_voltage(1, 1.0)
+        with pytest.raises(AttributeError, match=r"'Supply' object has no attribute 'set_voltage' that a client"):
+            remote.call("set_voltage", 1, 1.0)
+    finally:
+        remote.disconnect()
+        server.stop()
+
+
+def test_remote_equipment_timeout() -> None:
+    with pytest.raises(RemoteTimeoutError, match=r"Timeout occurred after 0.1 second\(s\) waiting for a reply"):
+        _ = Connection("ZMQ::127.0.0.1::5", remote=True, timeout=0.1).connect()
+
+    with pytest.raises(ValueError, match=r"Invalid ZeroMQ address 'ZMQ::127.0.0.1'"):
+        _ = RemoteEquipment(Equipment(connection=Connection("ZMQ::127.0.0.1", remote=True)))
+
+
+def test_remote_equipment_timeout_slow_reply() -> None:
+    server = Server()
+    c = Connection(f"ZMQ::127.0.0.1::{server.server.port}", remote=True, timeout=0.1)
+    remote: RemoteEquipment = c.connect()
+    try:
+        # the same exception types that the other interfaces raise if a timeout expires
+        with pytest.raises(TimeoutError) as info:
+            _ = remote.slow(0.5)
+        assert isinstance(info.value, MSLTimeoutError)
+        assert isinstance(info.value, RemoteTimeoutError)
+        assert info.value.message == "Timeout occurred after 0.1 second(s) waiting for a reply from the server"
+        assert str(info.value).startswith(repr(remote))
+
+        # the late reply is discarded and the connection can still be used
+        time.sleep(0.5)
+        assert remote.slow(0.01) == 0.01
+    finally:
+        remote.disconnect()
+        server.stop()
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import os
 import re
 import sys
+from dataclasses import asdict, fields
 from datetime import date, datetime
 from io import BytesIO, StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
-from xml.etree.ElementTree import XML, Element, ElementTree, tostring
+from xml.etree.ElementTree import XML, Element, ElementTree, ParseError, tostring
 
 import numpy as np
 import pytest
@@ -48,7 +50,7 @@ from msl.equipment import (
     Status,
     Table,
 )
-from msl.equipment.schema import Latest, _future_date, _Indent, connections  # pyright: ignore[reportPrivateUsage]
+from msl.equipment.schema import Latest, _future_date, _future_dates, _Indent, _Location, connections  # pyright: ignore[reportPrivateUsage]
 
 if TYPE_CHECKING:
     from typing import Literal
@@ -3232,6 +3234,319 @@ def test_register_find_none() -> None:
     assert len(found) == 0
 
 
+@pytest.mark.skipif(sys.version_info[:2] < (3, 10), reason="requires dataclass slots")
+def test_register_deferred_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    parsed: list[str] = []
+    table_from_xml = Table.from_xml
+
+    def from_xml(element: Element[str]) -> Table:
+        parsed.append(element.attrib["comment"])
+        return table_from_xml(element)
+
+    monkeypatch.setattr(Table, "from_xml", from_xml)
+
+    path = Path(__file__).parent / "data" / "mass"
+    r = Register(path / "register.xml", path / "register2.xml")
+    e = r["MSLE.M.092"]
+    assert e.manufacturer == "XYZ"
+    assert e._deferred is not None  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert sorted(e._deferred) == ["alterations", "calibrations", "firmware", "maintenance"]  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    reports = [report for m in e.calibrations for c in m.components for report in c.reports]
+    assert len(reports) == 4
+    assert sorted(e._deferred) == ["alterations", "firmware", "maintenance"]  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert not parsed
+
+    table = next(report.table for report in reports if report.tables)
+    assert parsed == ["Elephant"]
+    assert table.comment == "Elephant"
+    assert e.maintenance.completed[0].performed_by == "Guy Dubuis"
+    assert sorted(e._deferred) == ["alterations", "firmware"]  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        _ = e.unknown  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType]
+
+    # the parsers are not a dataclass field, so the fields are the same as the fields of the schema
+    assert [f.name for f in fields(Equipment)] == [
+        "entered_by",
+        "checked_by",
+        "checked_date",
+        "alias",
+        "keywords",
+        "id",
+        "manufacturer",
+        "model",
+        "serial",
+        "description",
+        "specifications",
+        "location",
+        "status",
+        "loggable",
+        "traceable",
+        "calibrations",
+        "maintenance",
+        "alterations",
+        "firmware",
+        "specified_requirements",
+        "reference_materials",
+        "quality_manual",
+        "connection",
+    ]
+    assert [f.name for f in fields(Report)][-5:] == ["cvd_equations", "deserialisers", "equations", "files", "tables"]
+    assert [f.name for f in fields(PerformanceCheck)][-5:] == [
+        "cvd_equations",
+        "deserialisers",
+        "equations",
+        "files",
+        "tables",
+    ]
+    assert list(asdict(e))[-1] == "connection"
+    assert "_deferred" not in asdict(reports[0])
+
+
+def test_register_find_index() -> None:
+    path = Path(__file__).parent / "data" / "mass"
+    r = Register(path / "register.xml", path / "register2.xml")
+    index = r._search_index  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert index is None
+
+    assert [e.id for e in r.find("Prob")] == ["MSLE.M.092"]  # part of a word
+    index = r._search_index  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert index is not None
+    assert [e.id for e in r.find("probe 1", flags=re.IGNORECASE)] == ["MSLE.M.092"]
+    assert [e.id for e in r.find("", flags=re.IGNORECASE)] == ["MSLE.M.001", "MSLE.M.092", "MSLE.M.100"]
+    assert list(r.find("probe 1")) == []
+    assert list(r.find("Probe 9")) == []
+    assert [e.id for e in r.find("robe 1", flags=re.IGNORECASE)] == ["MSLE.M.092"]  # end of a word
+    assert [e.id for e in r.find("the ambient la")] == ["MSLE.M.092"]  # whole words and the start of a word
+    assert list(r.find("the ambien lab")) == []
+    assert [e.id for e in r.find("ygromet")] == ["MSLE.M.092"]  # part of a word
+    assert [e.id for e in r.find("mbi")] == ["MSLE.M.092"]
+    assert id(r._search_index) == id(index)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    # adding equipment invalidates the index
+    r.add(Equipment(id="MSLE.M.200", description="Peanut butter"))
+    assert r._search_index is None  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert [e.id for e in r.find("peanut", flags=re.IGNORECASE)] == ["MSLE.M.200"]
+    assert [e.id for e in r.find("Hygrometer|butter")] == ["MSLE.M.092", "MSLE.M.200"]
+
+
+def test_register_cache(tmp_path: Path) -> None:
+    path = tmp_path / "register.xml"
+    _ = path.write_bytes((Path(__file__).parent / "data" / "mass" / "register.xml").read_bytes())
+    cache = tmp_path / "register.xml.cache"
+
+    # the XML file is parsed and the cache file is created
+    r = Register(path, cache=True)
+    assert cache.is_file()
+    assert all(isinstance(e, Element) for e in r._elements)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    expected = [(e.id, e.alias, e.manufacturer, len(e.calibrations)) for e in r]
+
+    # the register is loaded from the cache file, the elements are parsed when needed
+    r = Register(path, cache=True)
+    assert all(isinstance(e, bytes) for e in r._elements)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert r.team == "Mass"
+    assert r["MSLE.M.092"].id == "MSLE.M.092"
+    assert [(e.id, e.alias, e.manufacturer, len(e.calibrations)) for e in r] == expected
+    assert list(r.find("Hygrometer")) == [r["MSLE.M.092"]]
+
+    # the modification time changed but the content did not
+    mtime = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+    r = Register(path, cache=True)
+    assert isinstance(r._elements[0], bytes)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert int.from_bytes(cache.read_bytes()[15:23], "little") == mtime
+
+    # the content changed
+    _ = path.write_bytes(path.read_bytes().replace(b"<manufacturer>XYZ<", b"<manufacturer>ABC<"))
+    r = Register(path, cache=True)
+    assert isinstance(r._elements[0], Element)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert r["MSLE.M.092"].manufacturer == "ABC"
+    assert Register(path, cache=True)["MSLE.M.092"].manufacturer == "ABC"
+
+    # a corrupt cache file is ignored (and recreated)
+    _ = cache.write_bytes(cache.read_bytes()[:-10])
+    r = Register(path, cache=True)
+    assert isinstance(r._elements[0], Element)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert [e.id for e in Register(path, cache=True)] == [e[0] for e in expected]
+
+    # a cache directory
+    directory = tmp_path / "cache" / "files"
+    r = Register(path, Path(__file__).parent / "data" / "mass" / "register2.xml", cache=directory)
+    assert len(r) == 3
+    assert len(list(directory.glob("register-*.cache"))) == 1
+    assert len(list(directory.glob("register2-*.cache"))) == 1
+
+    # the cache is not used for a file-like object
+    with path.open("rb") as f:
+        r = Register(f, cache=directory)
+    assert isinstance(r._elements[0], Element)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+def test_register_stream(tmp_path: Path) -> None:
+    path = Path(__file__).parent / "data" / "mass"
+    expected = Register(path / "register.xml", path / "register2.xml")
+
+    r = Register(path / "register.xml", path / "register2.xml", stream=True)
+    assert r.team == "Mass"
+    assert len(r) == 3
+    assert all(isinstance(e, _Location) for e in r._elements)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert r._index_map == expected._index_map  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    assert r["MSLE.M.092"].manufacturer == "XYZ"
+    elements = r._elements  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert [type(e) for e in elements] == [_Location, Element, _Location]
+    assert elements[1].tag == f"{{{Register.NAMESPACE}}}equipment"  # type: ignore[union-attr]  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+    assert tostring(r.tree().getroot()) == tostring(expected.tree().getroot())
+
+    # an empty register and an <equipment/> element without sub-elements
+    file = tmp_path / "register.xml"
+    _ = file.write_text('<?xml version="1.0" encoding="utf-8"?><register team="A"/>')
+    assert len(Register(file, stream=True)) == 0
+    _ = file.write_text('<register team="B"><equipment alias="x"/><equipment alias="y" /></register>')
+    r = Register(file, stream=True)
+    assert r.team == "B"
+    assert r._index_map == {"": 1, "x": 0, "y": 1}  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert r._element(1).attrib == {"alias": "y"}  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    # the file is modified after it was indexed
+    _ = file.write_text('<register team="B"><equipment alias="z"/></register>')
+    with pytest.raises(ValueError, match=r"has been modified since it was loaded"):
+        _ = r._element(0)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    _ = file.write_text('<register team="B"><equipment></register>')
+    with pytest.raises(ParseError, match=r"mismatched tag"):
+        _ = Register(file, stream=True)
+
+    with pytest.raises(ValueError, match=r"Cannot use both `cache` and `stream`"):
+        _ = Register(file, cache=True, stream=True)
+
+    # the elements are read in the encoding of the file
+    light = Path(__file__).parent / "data" / "light" / "register.xml"
+    expected = Register(light)
+    text = light.read_text(encoding="utf-8")
+    for encoding, declared in (("utf-16", "UTF-16"), ("utf-16-be", "UTF-16BE"), ("latin-1", "ISO-8859-1")):
+        _ = file.write_bytes(text.replace("encoding='utf-8'", f"encoding='{declared}'").encode(encoding))
+        r = Register(file, stream=True)
+        assert [e.id for e in r] == [e.id for e in expected]
+        assert tostring(r.tree().getroot()) == tostring(expected.tree().getroot())
+
+
+def test_register_query() -> None:
+    path = Path(__file__).parent / "data" / "mass"
+    r = Register(path / "register.xml", path / "register2.xml")
+
+    def ids(equipment: list[Equipment]) -> list[str]:
+        return [e.id for e in equipment]
+
+    index = r._query_index  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert index is None
+    assert ids(r.query()) == ["MSLE.M.001", "MSLE.M.092", "MSLE.M.100"]
+    assert ids(r.query(manufacturer="XYZ")) == ["MSLE.M.092"]
+    assert ids(r.query(manufacturer="xyz")) == []
+    assert ids(r.query(manufacturer=["MSL", "Measurement", "Unknown"])) == ["MSLE.M.001", "MSLE.M.100"]
+    assert ids(r.query(model="Stds")) == ["MSLE.M.100"]
+    assert ids(r.query(status="Active")) == ["MSLE.M.092", "MSLE.M.100"]
+    assert ids(r.query(status=Status.Lost)) == ["MSLE.M.001"]
+    assert ids(r.query(status=[Status.Lost, "Active"])) == ["MSLE.M.001", "MSLE.M.092", "MSLE.M.100"]
+    assert ids(r.query(location="CMM Lab")) == ["MSLE.M.001"]
+    assert ids(r.query(keywords="DC")) == ["MSLE.M.100"]
+    assert ids(r.query(keywords=["DC", "Hygrometer"])) == ["MSLE.M.092", "MSLE.M.100"]
+    assert ids(r.query(quantity="Wavelength")) == ["MSLE.M.100"]
+    assert ids(r.query(quantity=iter(["Humidity", "Wavelength"]))) == ["MSLE.M.092", "MSLE.M.100"]
+    assert ids(r.query(location="Mass Standards Laboratories", keywords="AC")) == ["MSLE.M.100"]
+    assert ids(r.query(location="CMM Lab", keywords="AC")) == []
+
+    # next calibration dates of MSLE.M.092: Humidity 2028-08-14, 2028-10-14; Spectral Irradiance 2029-07-08, 2030-03-10
+    # MSLE.M.100 is calibrated on demand, so it is never due
+    assert ids(r.query(due_stop=date(2030, 12, 31))) == ["MSLE.M.092"]
+    assert ids(r.query(due_start=date(2028, 8, 14), due_stop=date(2028, 8, 14))) == ["MSLE.M.092"]
+    assert ids(r.query(due_start=date(2028, 8, 15), due_stop=date(2028, 10, 13))) == []
+    assert ids(r.query(due_start=date(2030, 3, 11))) == []
+    assert ids(r.query(due_start=date(2029, 1, 1), quantity="Humidity")) == []
+    assert ids(r.query(due_start=date(2029, 1, 1), quantity="Spectral Irradiance")) == ["MSLE.M.092"]
+
+    with pytest.raises(ValueError, match=r"'Unknown' is not a valid Status"):
+        _ = r.query(status="Unknown")
+
+    # adding equipment invalidates the indexes
+    index = r._query_index  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert index is not None
+    r.add(Equipment(id="MSLE.M.200", manufacturer="XYZ", status=Status.Dormant))
+    assert ids(r.query(manufacturer="XYZ")) == ["MSLE.M.092", "MSLE.M.200"]
+    assert ids(r.query(manufacturer="XYZ", status="Dormant")) == ["MSLE.M.200"]
+    assert id(r._query_index) != id(index)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+@pytest.mark.parametrize("date", ["issue", "start", "stop"])
+def test_register_calibration_status(date: Literal["issue", "start", "stop"]) -> None:
+    path = Path(__file__).parent / "data" / "mass"
+    r = Register(path / "register.xml", path / "register2.xml")
+
+    status = r.calibration_status(date)
+    assert status.dtype.names == (
+        "id",
+        "quantity",
+        "name",
+        "calibration_interval",
+        "report_id",
+        "report_date",
+        "next_calibration_date",
+        "check_date",
+        "next_check_date",
+    )
+
+    # one row per component, MSLE.M.001 does not have any components
+    assert status["id"].tolist() == ["MSLE.M.092"] * 4 + ["MSLE.M.100"] * 2
+    assert status["name"].tolist() == ["Probe 1", "Probe 2", "FEL 1", "FEL 2", "", ""]
+    assert status["calibration_interval"].tolist() == [5.0, 5.0, 5.0, 5.0, 5.0, 0.0]
+
+    # the Voltage DC measurand of MSLE.M.100 only has a performance check
+    assert status[4]["report_id"] == ""
+    assert np.isnat(status[4]["report_date"])
+    assert np.isnat(status[4]["next_calibration_date"])
+    assert status[4]["check_date"] == np.datetime64("2023-04-02")
+    assert status[4]["next_check_date"] == np.datetime64("2028-04-02")
+
+    # must agree with the latest report and latest performance check of each equipment
+    reports = [
+        (e.id, lr.quantity, lr.name, lr.id, lr.next_calibration_date) for e in r for lr in e.latest_reports(date)
+    ]
+    assert reports == [
+        (row["id"], row["quantity"], row["name"], row["report_id"], row["next_calibration_date"].item())
+        for row in status
+        if row["report_id"]
+    ]
+
+    checks = [
+        (e.id, c.quantity, c.name, c.completed_date, c.next_calibration_date)
+        for e in r
+        for c in e.latest_performance_checks()
+    ]
+    assert checks == [
+        (row["id"], row["quantity"], row["name"], row["check_date"].item(), row["next_check_date"].item())
+        for row in status
+        if not np.isnat(row["check_date"])
+    ]
+
+    # sorting and filtering
+    due = status[
+        (status["calibration_interval"] > 0) & (status["next_calibration_date"] <= np.datetime64("2029-12-31"))
+    ]
+    assert np.sort(due, order="next_calibration_date")["name"].tolist() == ["Probe 1", "Probe 2", "FEL 1"]
+
+    assert Register().calibration_status().size == 0
+
+
+def test_future_dates() -> None:
+    rng = np.random.default_rng(0)
+    dates = np.datetime64("2000-01-01") + rng.integers(0, 20000, size=2000).astype("timedelta64[D]")
+    years = rng.choice([0, 0.25, 0.5, 0.9, 1, 1.5, 2, 2.75, 5], size=dates.size)
+    future = _future_dates(np.append(dates, np.datetime64("NaT")), np.append(years, 1))
+    assert np.isnat(future[-1])
+    assert future[:-1].tolist() == [_future_date(d, float(y)) for d, y in zip(dates.tolist(), years)]
+
+
 def test_register_get_none() -> None:
     r = Register(Path(__file__).parent / "data" / "mass" / "register.xml")
     assert r.get(100) is None
@@ -6,6 +6,8 @@ try:
 except ImportError:
     pty = None  # type: ignore[assignment]
 
+import time
+from threading import Thread
 from typing import TYPE_CHECKING, cast
 
 import pytest
@@ -13,6 +15,7 @@ from serial.tools.list_ports_common import ListPortInfo
 
 from msl.equipment import Connection, Equipment, MSLConnectionError, MSLTimeoutError, Serial
 from msl.equipment.interfaces.serial import (
+    SerialBus,
     _init_serial,  # pyright: ignore[reportPrivateUsage]
     find_port,
     find_ports,
@@ -161,6 +164,72 @@ def test_pty_session(pty_server: type[PTYServer]) -> None:
         dev.disconnect()
 
 
+@pytest.mark.skipif(pty is None, reason="pty is not available")
+def test_pty_background_reader(pty_server: type[PTYServer]) -> None:
+    term = b"\r\n"
+    with pty_server(term=term) as server:
+        c = Connection(
+            f"ASRL{server.name}",
+            termination=term,
+            timeout=0.5,
+            background_reader=True,
+        )
+
+        dev: Serial = c.connect()
+        reader = dev.reader
+        assert reader is not None
+        assert dev.start_reader() is reader
+
+        # the timeout of the serial port is not changed by the calling thread
+        assert dev.serial.timeout == 0.1
+        dev.timeout = 2
+        assert dev.serial.timeout == 0.1
+        assert dev.serial.write_timeout == 2
+
+        assert dev.query("hello") == "hello\r\n"
+
+        assert dev.write("x" * 4096) == 4096 + len(term)
+        assert dev.read() == "x" * 4096 + term.decode()
+
+        # frames are split off in the background thread
+        assert dev.write(b"021.3" + term + b",054.2" + term + b"1") == 18
+        dev.timeout = 0.2
+        while reader.available < 18:
+            time.sleep(0.01)
+        assert reader.frames == 3
+        assert dev.read() == "021.3\r\n"
+        assert dev.read(size=3) == ",05"
+        assert dev.read() == "4.2\r\n"
+        assert dev.read(size=2) == "1\r"
+        assert dev.read() == "\n"
+
+        with pytest.raises(MSLTimeoutError):
+            _ = dev.read()
+
+        # without a read termination, the bytes that are available are returned
+        dev.read_termination = None
+        assert dev.write(b"abc") == 5
+        received = b""
+        while received != b"abc\r\n":
+            received += dev.read(decode=False)
+
+        dev.read_termination = term
+        assert dev.write(b"discard") == 9
+        while reader.available < 9:
+            time.sleep(0.01)
+        reader.clear()
+        assert reader.available == 0
+        assert reader.frames == 0
+
+        dev.stop_reader()
+        assert dev.reader is None
+        assert not reader.running
+        assert dev.serial.timeout == 0.2
+        assert dev.query("bye") == "bye\r\n"
+
+        dev.disconnect()
+
+
 @pytest.mark.skipif(pty is None, reason="pty is not available")
 def test_pty_timeout(pty_server: type[PTYServer]) -> None:
     term = b"\n"
@@ -203,6 +272,51 @@ def test_pty_timeout(pty_server: type[PTYServer]) -> None:
         dev.disconnect()
 
 
+@pytest.mark.skipif(pty is None, reason="pty is not available")
+def test_pty_timeout_trickle(pty_server: type[PTYServer], monkeypatch: pytest.MonkeyPatch) -> None:
+    class Trickle:
+        """Bytes are waiting for most of the timeout, then the device stops sending (no termination)."""
+
+        def __init__(self, duration: float, timeout: float) -> None:
+            self.stop: float = time.monotonic() + duration
+            self.timeout: float | None = timeout
+            self.timeouts: list[float | None] = []
+
+        @property
+        def in_waiting(self) -> int:
+            return 1 if time.monotonic() < self.stop else 0
+
+        def read(self, size: int) -> bytes:
+            if self.in_waiting:
+                time.sleep(0.005)
+                return b"x" * size
+            self.timeouts.append(self.timeout)
+            time.sleep(self.timeout or 0)
+            return b""
+
+    term = b"\n"
+    timeout = 0.3
+    with pty_server(term=term) as server:
+        dev: Serial = Connection(f"ASRL{server.name}", termination=term, timeout=timeout).connect()
+        trickle = Trickle(duration=0.8 * timeout, timeout=timeout)
+        monkeypatch.setattr(dev, "_serial", trickle)
+
+        t0 = time.monotonic()
+        with pytest.raises(MSLTimeoutError):
+            _ = dev.read()
+        elapsed = time.monotonic() - t0
+
+        # the total time to receive all bytes is the timeout, the first wait only uses the time remaining
+        assert elapsed < 1.2 * timeout
+        assert len(trickle.timeouts) == 1
+        assert trickle.timeouts[0] is not None
+        assert trickle.timeouts[0] < 0.3 * timeout
+        assert trickle.timeout == timeout  # restored
+
+        monkeypatch.undo()
+        dev.disconnect()
+
+
 @pytest.mark.skipif(pty is None, reason="pty is not available")
 def test_pty_logging(pty_server: type[PTYServer], caplog: pytest.LogCaptureFixture) -> None:
     term = b"\n"
@@ -399,6 +513,88 @@ def test_mock_session() -> None:
     dev.disconnect()
 
 
+def test_mock_shared_bus() -> None:
+    c1 = Connection("ASRL/mock://", shared=True, termination=b"\r", timeout=0.1)
+    c2 = Connection("ASRL/mock://", shared=True, termination=b"\n", timeout=0.2)
+
+    dev1: Serial = c1.connect()
+    dev2: Serial = c2.connect()
+    assert dev1.bus is not None
+    assert dev1.bus is dev2.bus
+    assert dev1.serial is dev2.serial
+    assert dev1.bus.users == 2
+
+    assert dev1.query("one") == "one\r"
+    assert dev2.query("two") == "two\n"
+
+    with pytest.raises(ValueError, match=r"shared with baudrate=9600, requested baudrate=19200"):
+        _ = Connection("ASRL/mock://", shared=True, baud_rate=19200).connect()
+    assert dev1.bus.users == 2
+
+    with pytest.raises(MSLConnectionError, match=r"Cannot start a background reader on a shared serial port"):
+        _ = dev1.start_reader()
+
+    bus = dev1.bus
+    port = dev1.serial
+    dev1.disconnect()
+    assert bus.users == 1
+    assert dev1.serial is not port
+    assert port.is_open
+    assert dev2.query("still open") == "still open\n"
+
+    dev2.disconnect()
+    assert bus.users == 0
+    assert "mock://" not in SerialBus._buses  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert not dev2.serial.is_open
+
+
+def test_serial_bus_fair_queue_and_batching() -> None:
+    port = _init_serial("mock://", {})
+    port.open()
+    bus = SerialBus(port, inter_frame_gap=0, max_batch=2)
+    assert bus.max_batch == 2
+
+    granted: list[str] = []
+
+    def poll(owner: str, name: str) -> None:
+        with bus.lock(owner):
+            granted.append(name)
+
+    threads: list[Thread] = []
+    with bus.lock("main"), bus.lock("main"):  # reentrant
+        for owner, name in [("a", "a1"), ("b", "b1"), ("a", "a2"), ("a", "a3")]:
+            t = Thread(target=poll, args=(owner, name))
+            t.start()
+            threads.append(t)
+            while len(bus._queue) < len(threads):  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+                time.sleep(0.001)
+        assert not granted
+
+    for t in threads:
+        t.join()
+
+    # consecutive requests of "a" are batched (max_batch=2) before "b" is granted
+    assert granted == ["a1", "a2", "b1", "a3"]
+    port.close()
+
+
+def test_serial_bus_inter_frame_gap() -> None:
+    port = _init_serial("mock://", {"baud_rate": 9600})
+    bus = SerialBus(port)
+    assert bus.inter_frame_gap == pytest.approx(3.5 * 10 / 9600)
+
+    port = _init_serial("mock://", {"baud_rate": 115200, "parity": "even"})
+    assert SerialBus(port).inter_frame_gap == pytest.approx(1.75e-3)
+
+    bus.inter_frame_gap = 0.05
+    with bus.lock("a"):
+        pass
+    t0 = time.perf_counter()
+    with bus.lock("b"):
+        elapsed = time.perf_counter() - t0
+    assert elapsed >= 0.05
+
+
 def test_find_port_find_ports(caplog: pytest.LogCaptureFixture) -> None:
     a = ListPortInfo("/dev/ttyS1")
     a.hwid = "VID:PID"
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import socket
 import sys
+import time
+from threading import Thread
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
 
 from msl.equipment import Connection, Equipment, MSLConnectionError, MSLTimeoutError, Socket
-from msl.equipment.interfaces.socket import parse_socket_address
+from msl.equipment.interfaces.socket import IS_LINUX, parse_socket_address, set_socket_options
 
 if TYPE_CHECKING:
     from conftest import TCPServer, UDPServer
@@ -175,6 +179,35 @@ def test_tcp_socket_timeout(tcp_server: type[TCPServer]) -> None:
     server.stop()
 
 
+def test_tcp_socket_read_deadline() -> None:
+    # the server keeps sending bytes, but never sends the termination character(s)
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def trickle() -> None:
+        conn, _ = server.accept()
+        with conn, contextlib.suppress(OSError):
+            while True:
+                conn.sendall(b"x")
+                time.sleep(0.01)
+
+    thread = Thread(target=trickle, daemon=True)
+    thread.start()
+
+    host, port = server.getsockname()
+    dev: Socket = Connection(f"TCP::{host}::{port}", termination=b"\n", timeout=0.2).connect()
+    t0 = time.monotonic()
+    with pytest.raises(MSLTimeoutError):
+        _ = dev.read()
+    assert 0.2 <= time.monotonic() - t0 < 1
+    assert dev.socket.gettimeout() == 0.2
+
+    dev.disconnect()
+    server.close()
+    thread.join(1)
+
+
 def test_udp_socket_read(udp_server: type[UDPServer]) -> None:
     term = b"^END"
     server = udp_server(term=term)
@@ -442,3 +475,95 @@ def test_reconnect_tcp(tcp_server: type[TCPServer], caplog: pytest.LogCaptureFix
 def test_no_connection_instance() -> None:
     with pytest.raises(TypeError, match=r"A Connection is not associated"):
         _ = Socket(Equipment())
+
+
+def test_tcp_socket_options(tcp_server: type[TCPServer]) -> None:
+    term = b"\n"
+    with tcp_server(term=term) as server:
+        connection = Connection(
+            address=f"TCP::{server.host}::{server.port}",
+            termination=term,
+            timeout=1,
+            so_rcvbuf=65536,
+            so_sndbuf=32768,
+            tcp_keepcnt=3,
+            tcp_keepintvl=5,
+            tcp_nodelay=True,
+            tcp_quickack=True,
+        )
+        with connection.connect() as dev:
+            sock = dev.socket
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) != 0  # enabled by tcp_keep*
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 65536
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) >= 32768
+            if hasattr(socket, "TCP_KEEPCNT"):
+                assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT) == 3
+                assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL) == 5
+            assert dev.query("hello") == "hello\n"
+            assert dev.query("world") == "world\n"
+
+            # the options are set again after reconnecting
+            dev.reconnect()
+            assert dev.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+
+        # the default values of the operating system are not changed
+        with Connection(address=f"TCP::{server.host}::{server.port}", timeout=1).connect() as dev:
+            assert dev.socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) == 0
+
+
+def test_set_socket_options_udp() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        # the TCP options are ignored for a UDP socket
+        set_socket_options(sock, {"so_rcvbuf": 65536, "tcp_nodelay": True, "tcp_keepidle": 10})
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 65536
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) == 0
+
+
+def test_read_datagrams() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as peer:
+        peer.bind(("127.0.0.1", 0))
+        host, port = peer.getsockname()
+        c = Connection(f"UDP::{host}::{port}", timeout=0.2, termination=b"\n", buffer_size=64, so_rcvbuf=4096)
+        with c.connect() as dev:
+            # the peer learns the address of the device
+            assert dev.write("hello") == 6
+            data, address = peer.recvfrom(64)
+            assert data == b"hello\n"
+
+            t0 = time.time()
+            for i in range(5):
+                _ = peer.sendto(f"a{i}\nb{i}".encode(), address)
+
+            # the message boundaries are kept (the read termination is ignored)
+            datagrams = dev.read_datagrams(10)
+            assert [d.data for d in datagrams] == [f"a{i}\nb{i}".encode() for i in range(5)]
+            assert all(d.address == (host, port) for d in datagrams)
+            assert all(t0 - 1 < d.timestamp < time.time() + 1 for d in datagrams)
+
+            _ = peer.sendto(b"x", address)
+            _ = peer.sendto(b"y", address)
+            time.sleep(0.05)
+            assert [d.data for d in dev.read_datagrams()] == [b"x"]
+            assert [d.data for d in dev.read_datagrams(2)] == [b"y"]
+
+            with pytest.raises(MSLTimeoutError):
+                _ = dev.read_datagrams(2)
+
+            # overflow the (small) receive buffer of the operating system
+            assert dev.dropped_datagrams == 0
+            for _ in range(1000):
+                _ = peer.sendto(b"z" * 32, address)
+            time.sleep(0.05)
+            datagrams = dev.read_datagrams(1000)
+            assert 0 < len(datagrams) < 1000
+            if IS_LINUX:
+                assert dev.dropped_datagrams + len(datagrams) == 1000
+
+
+def test_read_datagrams_tcp(tcp_server: type[TCPServer]) -> None:
+    with tcp_server() as server:
+        dev: Socket = Connection(f"TCP::{server.host}::{server.port}").connect()
+        with pytest.raises(MSLConnectionError, match=r"Reading datagrams requires a UDP socket"):
+            _ = dev.read_datagrams()
+        dev.disconnect()
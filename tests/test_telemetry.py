@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import time
+from itertools import count
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from msl.equipment.interfaces.telemetry import (
+    TelemetryBatch,
+    TelemetryPublisher,
+    TelemetrySubscriber,
+    _pack,  # pyright: ignore[reportPrivateUsage]
+    unpack_telemetry,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from numpy.typing import ArrayLike
+
+
+def receive(pub: TelemetryPublisher, sub: TelemetrySubscriber, send: Callable[[], None]) -> TelemetryBatch:
+    # a subscriber only receives the batches that are published after it has connected (slow joiner)
+    for _ in range(100):
+        send()
+        try:
+            return sub.receive()
+        except TimeoutError:
+            pass
+    msg = f"{sub!r} did not receive a batch from {pub!r}"
+    raise AssertionError(msg)
+
+
+def test_pack_unpack() -> None:
+    batch = unpack_telemetry(_pack(b"voltage", [1.0, 2.0, 3.0], [0.1, 0.2, 0.3]))
+    assert batch.channel == "voltage"
+    assert batch.timestamps.tolist() == [1.0, 2.0, 3.0]
+    assert batch.values.tolist() == [0.1, 0.2, 0.3]
+
+    values = np.arange(6, dtype=np.int32).reshape(3, 2)
+    batch = unpack_telemetry(memoryview(_pack("\N{GREEK SMALL LETTER MU}".encode() * 50, [1, 2, 3], values)))
+    assert batch.channel == "\N{GREEK SMALL LETTER MU}" * 50
+    assert batch.values.shape == (3, 2)
+    assert batch.values.dtype == np.float64
+    assert np.array_equal(batch.values, values)
+
+    batch = unpack_telemetry(_pack(b"empty", [], []))
+    assert batch.timestamps.size == 0
+    assert batch.values.size == 0
+
+
+def test_pack_unpack_invalid() -> None:
+    with pytest.raises(ValueError, match=r"Invalid shapes"):
+        _ = _pack(b"a", [1, 2], [1])
+    with pytest.raises(ValueError, match=r"Invalid shapes"):
+        _ = _pack(b"a", [[1, 2]], [1])
+    with pytest.raises(ValueError, match=r"not null terminated"):
+        _ = unpack_telemetry(b"x" * 1000)
+
+
+def test_publisher_invalid() -> None:
+    with pytest.raises(ValueError, match=r"batch size must be >= 1, got 0"):
+        _ = TelemetryPublisher(batch_size=0)
+
+    with TelemetryPublisher({"a": time.time}, host="127.0.0.1") as pub:
+        assert pub.port > 0
+        assert pub.address == f"tcp://127.0.0.1:{pub.port}"
+        assert repr(pub) == f"<TelemetryPublisher address={pub.address!r} channels=1>"
+        with pytest.raises(ValueError, match=r"channel named 'a' already exists"):
+            pub.add_channel("a", time.time)
+        with pytest.raises(ValueError, match=r"cannot contain a null character"):
+            pub.add_channel("b\x00", time.time)
+        assert pub.channels == ["a"]
+
+
+def test_publish_subscribe() -> None:
+    counter = count()
+    pub = TelemetryPublisher({"temp": lambda: next(counter), "temperature": lambda: (1, 2)}, batch_size=5)
+    sub = TelemetrySubscriber(f"tcp://127.0.0.1:{pub.port}", "temp", timeout=0.05)
+    try:
+        assert repr(sub) == f"<TelemetrySubscriber address='tcp://127.0.0.1:{pub.port}'>"
+
+        def send() -> None:
+            for _ in range(5):
+                pub.sample()
+
+        batch = receive(pub, sub, send)
+
+        # subscribing to "temp" does not match "temperature"
+        assert batch.channel == "temp"
+        assert batch.values.shape == (5,)
+        assert np.array_equal(np.diff(batch.values), [1, 1, 1, 1])
+        assert np.all(np.diff(batch.timestamps) >= 0)
+        assert not batch.values.flags.owndata
+
+        # a partial batch is published by flush()
+        pub.sample()
+        pub.flush()
+        batch = sub.receive()
+        assert batch.channel == "temp"
+        assert batch.values.shape == (1,)
+
+        # readings that were acquired elsewhere
+        pub.publish("temp", [1.5], [9.0])
+        assert sub.receive().values.tolist() == [9.0]
+
+        with pytest.raises(TimeoutError, match=r"after 0.05 seconds"):
+            _ = sub.receive()
+    finally:
+        sub.close()
+        pub.close()
+
+
+def test_background_thread(caplog: pytest.LogCaptureFixture) -> None:
+    def fail() -> float:
+        raise RuntimeError
+
+    pub = TelemetryPublisher({"a": lambda: (1.0, 2.0, 3.0), "fail": fail}, batch_size=2, host="127.0.0.1")
+    sub = TelemetrySubscriber(pub.address, timeout=1)
+    try:
+        pub.start(interval=0.01)
+        with pytest.raises(RuntimeError, match=r"already been started"):
+            pub.start(interval=0.01)
+
+        for batch in sub:
+            assert batch.channel == "a"
+            assert batch.values.tolist() == [[1.0, 2.0, 3.0], [1.0, 2.0, 3.0]]
+            break
+
+        pub.stop()
+        pub.stop()
+        assert "could not read channel 'fail'" in caplog.text
+    finally:
+        pub.close()
+        pub.close()
+        sub.close()
+
+
+def test_bad_readings(caplog: pytest.LogCaptureFixture) -> None:
+    readings: Iterator[ArrayLike] = iter(
+        [(1.0, 2.0), (3.0,), "OVLD", (4.0, 5.0), [[6.0, 7.0]], (8.0, 9.0), (1.0, 2.0, 3.0), (0.0, 1.0)]
+    )
+    pub = TelemetryPublisher({"a": lambda: next(readings)}, batch_size=5, host="127.0.0.1")
+    sub = TelemetrySubscriber(pub.address, timeout=1)
+    try:
+        _ = receive(pub, sub, lambda: pub.publish("a", [0.0], [[0.0, 0.0]]))
+        for _ in range(8):
+            pub.sample()
+
+        # the bad readings are skipped and the good readings in the batch are still published
+        pub.flush()
+        batch = sub.receive()
+        assert batch.values.tolist() == [[1.0, 2.0], [4.0, 5.0], [8.0, 9.0], [0.0, 1.0]]
+        assert batch.timestamps.shape == (4,)
+        assert "shape (1,), expected shape (2,)" in caplog.text
+        assert "could not read channel 'a'" in caplog.text  # "OVLD"
+        assert "shape (1, 2), expected shape () or (m,)" in caplog.text
+        assert "shape (3,), expected shape (2,)" in caplog.text
+    finally:
+        pub.close()
+        sub.close()
+
+    # the background thread keeps running if a reading is bad
+    values: Iterator[ArrayLike] = iter([1.0, 2.0, (3.0, 4.0), "OVLD", 5.0])
+    pub = TelemetryPublisher({"b": lambda: next(values, 6.0)}, batch_size=5, host="127.0.0.1")
+    sub = TelemetrySubscriber(pub.address, timeout=1)
+    try:
+        _ = receive(pub, sub, lambda: pub.publish("b", [0.0], [0.0]))
+        pub.start(interval=0.01)
+        batch = sub.receive()
+        assert batch.values.tolist() == [1.0, 2.0, 5.0, 6.0, 6.0]
+        thread = pub._thread  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        assert thread is not None
+        assert thread.is_alive()
+    finally:
+        pub.close()
+        sub.close()
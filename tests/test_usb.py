@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+import time
 from array import array
 from typing import TYPE_CHECKING
 
@@ -250,6 +251,86 @@ def test_write_read_query(usb_backend: USBBackend) -> None:
         assert device.write(b"") == 0
 
 
+class FakeBulkIn:
+    """Fake the read() method of a usb.core.Device that streams a known sequence of bytes."""
+
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        """Fake the read() method of a usb.core.Device that streams a known sequence of bytes."""
+        self.data: bytes = data
+        self.chunk_size: int = chunk_size
+        self.offset: int = 0
+        self.device: USB | None = None
+        self.max_available: int = sys.maxsize
+
+    def throttle(self) -> bool:
+        """Whether to pretend that the device has no data available."""
+        if self.device is None:
+            return False
+        # the stream is not assigned to the device until the reader thread has started
+        stream = self.device.stream
+        return stream is None or stream.available > self.max_available
+
+    def read(self, address: int, buffer: array[int], timeout: int) -> int:  # pyright: ignore[reportUnusedParameter]  # noqa: ARG002
+        """Mock a bulk read."""
+        if self.offset >= len(self.data) or self.throttle():
+            time.sleep(0.001)
+            msg = "Mocked timeout"
+            raise usb.core.USBTimeoutError(msg)  # pyright: ignore[reportUnknownMemberType]
+
+        chunk = self.data[self.offset : self.offset + self.chunk_size]
+        self.offset += len(chunk)
+        buffer[: len(chunk)] = array("B", chunk)
+        return len(chunk)
+
+
+def test_streaming(usb_backend: USBBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+    usb_backend.add_device(1, 2, "x")
+    c = Connection("USB::1::2::x::RAW", usb_backend=usb_backend)
+    data = bytes(range(256)) * 64
+    fake = FakeBulkIn(data, 1000)
+    with USB(Equipment(connection=c)) as device:
+        fake.device = device
+        fake.max_available = 2000  # forces the ring buffer to wrap around many times
+        monkeypatch.setattr(device._device, "read", fake.read)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+        with pytest.raises(ValueError, match=r"capacity \[100\] must be >= the transfer size \[1000\]"):
+            _ = device.start_streaming(capacity=100, transfer_size=1000)
+
+        stream = device.start_streaming(capacity=4096, transfer_size=1000)
+        assert device.start_streaming() is stream
+        assert stream.capacity == 4096
+
+        received = bytearray()
+        received.extend(device.read(size=3000, decode=False))
+        received.extend(stream.read(size=5))
+        while len(received) < len(data):
+            received.extend(stream.read(timeout=1))
+        assert received == data
+
+        device.timeout = 0.05
+        with pytest.raises(MSLTimeoutError):
+            _ = device.read(size=1)
+        with pytest.raises(MSLTimeoutError):
+            _ = stream.read()
+
+        device.stop_streaming()
+        assert device.stream is None
+        assert not stream.running
+
+        # the ring buffer overflows if the data is not consumed
+        fake.offset = 0
+        fake.device = None
+        stream = device.start_streaming(capacity=1500, transfer_size=1000)
+        assert stream.read(size=1000, timeout=1) == data[:1000]
+        with pytest.raises(MSLConnectionError, match=r"ring buffer overflowed"):
+            _ = device.read(size=5000, decode=False)
+
+        # the original read() method is used after streaming stops
+        device.stop_streaming()
+        fake.offset = 0
+        assert device.read(size=10, decode=False) == data[:10]
+
+
 def test_ctrl_transfer(usb_backend: USBBackend) -> None:
     usb_backend.add_device(1, 2, "x")
     c = Connection("USB::1::2::x::RAW", usb_backend=usb_backend)
@@ -2,14 +2,23 @@ from __future__ import annotations
 
 import sys
 from array import array
+from queue import Empty, Queue
+from threading import Event
 from typing import TYPE_CHECKING
 
 import pytest
+import usb.core  # type: ignore[import-untyped]  # pyright: ignore[reportMissingTypeStubs]
 
 from msl.equipment import USB, USBTMC, Connection, MSLConnectionError, MSLTimeoutError, RENMode
-from msl.equipment.interfaces.usbtmc import Capabilities, _Message  # pyright: ignore[reportPrivateUsage]
+from msl.equipment.interfaces.usbtmc import (
+    Capabilities,
+    _definite_length,  # pyright: ignore[reportPrivateUsage]
+    _Message,  # pyright: ignore[reportPrivateUsage]
+)
 
 if TYPE_CHECKING:
+    from typing import Callable
+
     from conftest import USBBackend
 
 
@@ -205,6 +214,103 @@ def test_serial_poll_with_interrupt(usb_backend: USBBackend) -> None:
         assert device.serial_poll() == 62
 
 
+class FakeInterruptIn:
+    """Fake the Interrupt-IN endpoint of a usb.core.Device, Bulk-IN reads use the original read() method."""
+
+    def __init__(self, device: USBTMC) -> None:
+        """Fake the Interrupt-IN endpoint of a usb.core.Device."""
+        assert device.intr_in_endpoint is not None
+        self.address: int = device.intr_in_endpoint.address
+        self.original_read: Callable[..., array[int] | int] = device._device.read  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        self.queue: Queue[bytes | Exception] = Queue()
+
+    def read(self, address: int, size_or_buffer: int | array[int], timeout: int) -> array[int] | int:
+        """Mock a read."""
+        if address != self.address:
+            return self.original_read(address, size_or_buffer, timeout)
+
+        try:
+            item = self.queue.get(timeout=timeout / 1000)
+        except Empty:
+            msg = "Mocked timeout"
+            raise usb.core.USBTimeoutError(msg) from None  # pyright: ignore[reportUnknownMemberType]
+
+        if isinstance(item, Exception):
+            raise item
+        return array("B", item)
+
+
+def test_interrupt_listener(usb_backend: USBBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+    usb_backend.add_device(1, 2, "x", is_usb_tmc=True, has_intr_read=True)
+    c = Connection("USB::1::2::x", usb_backend=usb_backend)
+
+    device: USBTMC
+    with c.connect() as device:
+        fake = FakeInterruptIn(device)
+        monkeypatch.setattr(device._device, "read", fake.read)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+        statuses: list[int] = []
+        called = Event()
+
+        def callback(status: int) -> None:
+            statuses.append(status)
+            called.set()
+
+        def bad_callback(status: int) -> None:  # pyright: ignore[reportUnusedParameter]  # noqa: ARG001
+            raise ValueError
+
+        device.add_srq_callback(bad_callback)
+        device.add_srq_callback(callback)
+        listener = device._listener  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        assert listener is not None
+        assert listener.running
+        assert listener.callbacks == [bad_callback, callback]
+
+        # SRQ notification, the exception in bad_callback does not stop the listener
+        fake.queue.put(bytes([0x81, 0x50]))
+        assert called.wait(5)
+        assert statuses == [0x50]
+        assert device.wait_for_srq(timeout=5) == 0x50
+        with pytest.raises(MSLTimeoutError):
+            _ = device.wait_for_srq(timeout=0.05)
+
+        # packets that do not have bit 7 set are ignored
+        fake.queue.put(bytes([0x01, 0x60]))
+        fake.queue.put(bytes([0x81, 0x40]))
+        assert device.wait_for_srq(timeout=5) == 0x40
+
+        # READ_STATUS_BYTE response is delivered to serial_poll by the listener
+        usb_backend.add_ctrl_response(b"\x01\x02\x00")  # STATUS_SUCCESS, bTag, reserved
+        fake.queue.put(bytes([0x82, 0x10]))
+        assert device.serial_poll() == 0x10
+
+        device.remove_srq_callback(callback)
+        assert listener.callbacks == [bad_callback]
+        device.remove_srq_callback()
+        assert listener.callbacks == []
+
+        # the listener stops if there is an error reading the Interrupt-IN endpoint
+        fake.queue.put(OSError("Mocked Interrupt-IN error"))
+        with pytest.raises(MSLConnectionError, match=r"listener stopped, .*Mocked Interrupt-IN error"):
+            _ = listener.wait_for_srq(timeout=5)
+
+    assert device._listener is None  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+def test_interrupt_listener_unsupported(usb_backend: USBBackend) -> None:
+    usb_backend.add_device(1, 2, "x", is_usb_tmc=True, has_intr_read=False)
+    c = Connection("USB::1::2::x", usb_backend=usb_backend)
+
+    device: USBTMC
+    with c.connect() as device:
+        with pytest.raises(MSLConnectionError, match=r"does not have an Interrupt-IN endpoint"):
+            _ = device.wait_for_srq(timeout=0.1)
+
+        device.capabilities.is_488_interface = False
+        with pytest.raises(MSLConnectionError, match=r"not a USB488 interface"):
+            device.add_srq_callback(print)
+
+
 def test_control_ren(usb_backend: USBBackend) -> None:
     usb_backend.add_device(1, 2, "x", is_usb_tmc=True, has_intr_read=True)
     c = Connection("USB::1::2::x", usb_backend=usb_backend)
@@ -419,6 +525,52 @@ def test_read(usb_backend: USBBackend) -> None:
             _ = device.read()
 
 
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        (b"", None),
+        (b"1.23\n", None),
+        (b"#0abc\n", None),
+        (b"#x123", None),
+        (b"#3", None),
+        (b"#3abc", None),
+        (b"#15hello\n", 8),
+        (b"#210helloworld", 14),
+        (b":CURV #3100" + bytes(10), 6 + 2 + 3 + 100),
+        (bytes(100) + b"#15hello", None),
+    ],
+)
+def test_definite_length(message: bytes, expected: int | None) -> None:
+    assert _definite_length(message) == expected
+
+
+def test_read_large_block(usb_backend: USBBackend) -> None:
+    usb_backend.add_device(1, 2, "x")
+    c = Connection("USB::1::2::x", usb_backend=usb_backend)
+
+    payload = b"#7" + b"1000000" + bytes(range(256)) * 3906 + bytes(64) + b"\n"
+    assert len(payload) == 1_000_010
+
+    device: USBTMC
+    with c.connect() as device:
+        device.capabilities.is_listen_only = False
+
+        # the first transfer is buffer_size bytes (not EOM), the remainder is requested in one transfer
+        n = 4096
+        usb_backend.add_bulk_response(bytes([2, 1, 0, 0]) + n.to_bytes(4, "little") + bytes(4) + payload[:n])
+        remaining = len(payload) - n
+        usb_backend.add_bulk_response(
+            bytes([2, 2, 0, 0]) + remaining.to_bytes(4, "little") + bytes([1, 0, 0, 0]) + payload[n:] + bytes(2)
+        )
+        assert device.read(decode=False) == payload
+
+        # the last REQUEST_DEV_DEP_MSG_IN asked for the remainder of the block (plus a termination character)
+        request = usb_backend._bulk_message.tobytes()  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        assert request[:2] == bytes([2, 2])
+        assert int.from_bytes(request[4:8], "little") == remaining
+        assert len(device._byte_buffer) == 0  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
 def test_clear_device_buffers(usb_backend: USBBackend, caplog: pytest.LogCaptureFixture) -> None:
     usb_backend.add_device(1, 2, "x")
     c = Connection("USB::1::2::x", usb_backend=usb_backend)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import sys
 import threading
+import time
 from array import array
 from typing import TYPE_CHECKING
 
@@ -10,7 +12,7 @@ import pytest
 import zmq
 
 from msl.equipment import Connection, Equipment, MSLConnectionError, ZeroMQ, ZeroMQServer
-from msl.equipment.interfaces.zeromq import parse_zmq_address
+from msl.equipment.interfaces.zeromq import pack_array, parse_zmq_address, unpack_array
 
 if TYPE_CHECKING:
     from typing import Literal
@@ -467,3 +469,284 @@ def test_zmq_server_invalid_socket_type() -> None:
 
     with pytest.raises(ValueError, match=r"Cannot create <enum 'SocketType'> from 'ABC'$"):
         _ = Server(socket_type="ABC")
+
+
+def test_zmq_server_router(caplog: pytest.LogCaptureFixture) -> None:
+    class Server(ZeroMQServer):
+        def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse:  # pyright: ignore[reportImplicitOverride]
+            if msg_parts[0] == b"error":
+                msg = "bad request"
+                raise ValueError(msg)
+            time.sleep(0.2)
+            return [b"reply", *msg_parts]
+
+    server = Server(host="127.0.0.1", socket_type="ROUTER", workers=4)
+    thread = threading.Thread(target=server.start, daemon=True, kwargs={"info": False})
+    thread.start()
+
+    while not server.port:
+        pass
+
+    # REQ clients are handled concurrently
+    clients: list[ZeroMQ] = [Connection(f"ZMQ::127.0.0.1::{server.port}", timeout=5).connect() for _ in range(4)]
+    replies: dict[int, list[bytes]] = {}
+
+    def query(index: int) -> None:
+        replies[index] = clients[index].query_multipart([b"%d" % index])
+
+    threads = [threading.Thread(target=query, args=(i,)) for i in range(len(clients))]
+    t0 = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert time.monotonic() - t0 < 0.2 * len(clients)
+    assert replies == {i: [b"reply", b"%d" % i] for i in range(len(clients))}
+
+    # a REQ client always receives a reply, even if handling the request fails
+    assert clients[0].query_multipart([b"error"]) == [b"ValueError: bad request"]
+    assert clients[0].query_multipart([b"ok"]) == [b"reply", b"ok"]
+
+    # the requests from a DEALER client are handled in the order that they were sent
+    dealer: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", socket_type="DEALER", timeout=5).connect()
+    for request in (b"a", b"error", b"b", b"c"):
+        assert dealer.write(request) == len(request)
+    assert dealer.read_multipart() == [b"reply", b"a"]
+    assert dealer.read_multipart() == [b"reply", b"b"]
+    assert dealer.read_multipart() == [b"reply", b"c"]
+    assert "could not handle the request [b'error']" in caplog.text
+
+    for client in [*clients, dealer]:
+        client.disconnect()
+    server.shutdown_server()
+    thread.join()
+
+
+def test_zmq_server_router_handle_exception() -> None:
+    class Server(ZeroMQServer):
+        def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse:  # pyright: ignore[reportImplicitOverride]
+            if msg_parts[0] == b"error":
+                msg = "bad request"
+                raise ValueError(msg)
+            return msg_parts
+
+        def handle_exception(self, msg_parts: list[bytes], error: Exception) -> ZMQServerResponse:  # pyright: ignore[reportImplicitOverride]
+            return [b"ERROR", str(error).encode(), *msg_parts]
+
+    server = Server(host="127.0.0.1", socket_type="ROUTER")
+    thread = threading.Thread(target=server.start, daemon=True, kwargs={"info": False})
+    thread.start()
+
+    while not server.port:
+        pass
+
+    req: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", timeout=5).connect()
+    assert req.query_multipart([b"error", b"1"]) == [b"ERROR", b"bad request", b"error", b"1"]
+    assert req.query_multipart([b"ok"]) == [b"ok"]
+
+    dealer: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", socket_type="DEALER", timeout=5).connect()
+    assert dealer.write(b"error") == 5
+    assert dealer.read_multipart() == [b"ERROR", b"bad request", b"error"]
+
+    for client in (req, dealer):
+        client.disconnect()
+    server.shutdown_server()
+    thread.join()
+
+
+def test_zmq_server_router_async() -> None:
+    class Server(ZeroMQServer):
+        async def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse:  # pyright: ignore[reportImplicitOverride]
+            await asyncio.sleep(0.1 * int(msg_parts[0]))
+            return msg_parts[0]
+
+    server = Server(host="127.0.0.1", socket_type="ROUTER", max_in_flight=2)
+    thread = threading.Thread(target=server.start, daemon=True, kwargs={"info": False})
+    thread.start()
+
+    while not server.port:
+        pass
+
+    # the replies to different DEALER clients are sent when each coroutine finishes
+    slow: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", socket_type="DEALER", timeout=5).connect()
+    fast: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", socket_type="DEALER", timeout=5).connect()
+    assert slow.write(b"3") == 1
+    time.sleep(0.05)
+    assert fast.write(b"1") == 1
+    t0 = time.monotonic()
+    assert fast.read(decode=False) == b"1"
+    assert time.monotonic() - t0 < 0.25
+    assert slow.read(decode=False) == b"3"
+
+    slow.disconnect()
+    fast.disconnect()
+    server.shutdown_server()
+    thread.join()
+
+
+def test_zmq_server_router_dealer_empty_frame() -> None:
+    class Server(ZeroMQServer):
+        def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse:  # pyright: ignore[reportImplicitOverride]
+            return [b"reply", *msg_parts]
+
+    server = Server(host="127.0.0.1", socket_type="ROUTER")
+    thread = threading.Thread(target=server.start, daemon=True, kwargs={"info": False})
+    thread.start()
+
+    while not server.port:
+        pass
+
+    # the empty first frame from a DEALER client is part of the request, not a REQ delimiter
+    dealer: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", socket_type="DEALER", timeout=5).connect()
+    assert dealer.query_multipart([b"", b"data"]) == [b"reply", b"", b"data"]
+
+    # a REQ client still receives the reply without the delimiter
+    req: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", timeout=5).connect()
+    assert req.query_multipart([b"", b"data"]) == [b"reply", b"", b"data"]
+    assert req.query_multipart([b"data"]) == [b"reply", b"data"]
+
+    dealer.disconnect()
+    req.disconnect()
+    server.shutdown_server()
+    thread.join()
+
+
+def test_zmq_server_router_max_in_flight() -> None:
+    class Server(ZeroMQServer):
+        async def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse:  # pyright: ignore[reportImplicitOverride]
+            await asyncio.sleep(float(msg_parts[0]))
+            return msg_parts[0]
+
+    server = Server(host="127.0.0.1", socket_type="ROUTER", max_in_flight=1)
+    thread = threading.Thread(target=server.start, daemon=True, kwargs={"info": False})
+    thread.start()
+
+    while not server.port:
+        pass
+
+    # only one request is in flight, so the request of the second client waits for the first reply
+    first: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", socket_type="DEALER", timeout=5).connect()
+    second: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", socket_type="DEALER", timeout=5).connect()
+    t0 = time.monotonic()
+    assert first.write(b"0.2") == 3
+    time.sleep(0.05)
+    assert second.write(b"0") == 1
+    assert second.read(decode=False) == b"0"
+    assert time.monotonic() - t0 >= 0.2
+    assert first.read(decode=False) == b"0.2"
+
+    # the server can be shut down while the maximum number of requests are in flight
+    assert first.write(b"10") == 2
+    assert second.write(b"0") == 1
+    time.sleep(0.1)
+    t0 = time.monotonic()
+    server.shutdown_server()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert time.monotonic() - t0 < 1
+
+    first.disconnect()
+    second.disconnect()
+
+
+def test_zmq_server_max_in_flight_invalid() -> None:
+    class Server(ZeroMQServer):
+        def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse:  # pyright: ignore[reportImplicitOverride]
+            return msg_parts
+
+    with pytest.raises(ValueError, match=r"must be >= 1, got 0$"):
+        _ = Server(socket_type="ROUTER", max_in_flight=0)
+
+
+ARRAYS: list[np.ndarray[tuple[int, ...], np.dtype[np.generic]]] = [
+    np.arange(12, dtype=">f8").reshape(3, 4),
+    np.asfortranarray(np.arange(12, dtype=np.int16).reshape(3, 4)),
+    np.arange(20, dtype=np.uint8)[::3],  # not contiguous
+    np.array([(1, 2.5), (3, 4.5)], dtype=[("a", "<i4"), ("b", "<f8")]),
+    np.array(7.5),
+    np.array([], dtype=np.complex128),
+]
+
+
+def test_pack_unpack_array() -> None:
+    for expected in ARRAYS:
+        header, data = pack_array(expected)
+        assert isinstance(header, bytes)
+        unpacked = unpack_array([header, bytes(data)])  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+        assert unpacked.dtype == expected.dtype
+        assert unpacked.shape == expected.shape
+        assert np.array_equal(unpacked, expected)
+
+
+def test_pack_array_no_copy() -> None:
+    array = np.arange(10.0)
+    _, data = pack_array(array)
+    assert isinstance(data, memoryview)
+    assert np.shares_memory(np.asarray(data), array)
+
+
+def test_pack_unpack_array_invalid() -> None:
+    with pytest.raises(ValueError, match=r"contains Python objects"):
+        _ = pack_array(np.array([object()]))
+    with pytest.raises(ValueError, match=r"2-part message, got 1 part\(s\)"):
+        _ = unpack_array([b"{}"])
+
+
+def test_zmq_server_array() -> None:
+    class Server(ZeroMQServer):
+        def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse:  # pyright: ignore[reportImplicitOverride]
+            return pack_array(unpack_array(msg_parts) * 2)
+
+    server = Server(host="127.0.0.1")
+    thread = threading.Thread(target=server.start, daemon=True, kwargs={"info": False})
+    thread.start()
+
+    while not server.port:
+        pass
+
+    # each frame must be <= max_read_size
+    client: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", timeout=5, max_read_size=1 << 24).connect()
+    waveform = np.linspace(0, 1, 1_000_000).reshape(1000, 1000)
+    tracker = client.write_array(waveform)
+    assert tracker is not None
+    array = client.read_array()
+    assert tracker.done
+    assert not array.flags.owndata  # the array uses the buffer of the received frame
+    assert array.shape == (1000, 1000)
+    assert np.array_equal(array, waveform * 2)
+
+    _ = client.write_array(np.arange(3), track=False)
+    assert np.array_equal(client.read_array(), [0, 2, 4])
+
+    client.disconnect()
+    server.shutdown_server()
+    thread.join()
+
+
+@pytest.mark.parametrize("socket_type", ["REP", "ROUTER"])
+def test_zmq_server_array_no_copy(socket_type: str) -> None:
+    owndata: list[bool] = []
+
+    class Server(ZeroMQServer):
+        def handle_request(self, msg_parts: list[bytes]) -> ZMQServerResponse:  # pyright: ignore[reportImplicitOverride]
+            assert all(isinstance(part, zmq.Frame) for part in msg_parts)
+            array = unpack_array(msg_parts)
+            owndata.append(bool(array.flags.owndata))
+            return pack_array(array * 2)
+
+    server = Server(host="127.0.0.1", socket_type=socket_type, copy=False)
+    thread = threading.Thread(target=server.start, daemon=True, kwargs={"info": False})
+    thread.start()
+
+    while not server.port:
+        pass
+
+    client: ZeroMQ = Connection(f"ZMQ::127.0.0.1::{server.port}", timeout=5, max_read_size=1 << 24).connect()
+    waveform = np.linspace(0, 1, 100_000)
+    _ = client.write_array(waveform)
+    assert np.array_equal(client.read_array(), waveform * 2)
+    assert owndata == [False]  # the array uses the buffer of the received frame
+
+    client.disconnect()
+    server.shutdown_server()
+    thread.join()